@@ -0,0 +1,19 @@
+"""
+Benchmarks Package
+Offline micro-benchmarks for the GoTravel AI Backend (run with `python -m benchmarks.<name>`)
+"""
+import os
+import warnings
+
+# Settings and the global clients are created at import time, so make sure the
+# benchmarks can import the app without real credentials.
+os.environ.setdefault("SUPABASE_URL", "http://localhost:54321")
+os.environ.setdefault("SUPABASE_KEY", "eyJhbGciOiJIUzI1NiJ9.e30.benchmark")
+os.environ.setdefault("GOOGLE_API_KEY", "benchmark")
+
+import langchain  # noqa: E402,F401
+from langchain_core._api.deprecation import LangChainPendingDeprecationWarning  # noqa: E402
+
+# langchain installs its own warning filters on import, so ours go after it
+warnings.filterwarnings("ignore", category=LangChainPendingDeprecationWarning)
+warnings.filterwarnings("ignore", message=".*protected namespace.*")
@@ -0,0 +1,138 @@
+"""
+Agent Pipeline Overhead Benchmark
+Measures the per-request cost of wrapping the executor in RunnableWithMessageHistory
+and of verbose step tracing, using a chat model that answers instantly
+
+Usage:
+    python -m benchmarks.bench_agent_overhead --iterations 500
+"""
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+import argparse
+import asyncio
+import contextlib
+import os
+import statistics
+import time
+
+import benchmarks  # noqa: F401  (sets dummy credentials)
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.runnables.history import RunnableWithMessageHistory
+from src.services.agent import TravelAgent
+from src.services.session_store import InMemorySessionStore
+
+
+class InstantChatModel(BaseChatModel):
+    """Chat model that immediately returns a final answer without calling tools"""
+
+    @property
+    def _llm_type(self) -> str:
+        return "instant"
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> "InstantChatModel":
+        return self
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content="Done."))])
+
+
+def _build_agent(verbose: bool) -> TravelAgent:
+    agent = TravelAgent(session_store=InMemorySessionStore(), llm=InstantChatModel())
+    agent.agent_executor.verbose = verbose
+    return agent
+
+
+async def _per_request_wrapper(agent: TravelAgent, session_id: str) -> Any:
+    """Previous behaviour: build the history wrapper on every message"""
+    agent_with_history = RunnableWithMessageHistory(
+        agent.agent_executor,
+        lambda session_id: agent.get_chat_history(session_id),
+        input_messages_key="input",
+        history_messages_key="chat_history",
+    )
+    return await agent_with_history.ainvoke(
+        {"input": "hello"},
+        config={"configurable": {"session_id": session_id}}
+    )
+
+
+async def _prebuilt_wrapper(agent: TravelAgent, session_id: str) -> Any:
+    """Current behaviour: reuse the wrapper built in TravelAgent.__init__"""
+    return await agent.agent_with_history.ainvoke(
+        {"input": "hello"},
+        config={"configurable": {"session_id": session_id}}
+    )
+
+
+async def _time_turns(
+    scenarios: Dict[str, Tuple[Callable[[TravelAgent, str], Awaitable[Any]], TravelAgent]],
+    iterations: int
+) -> Dict[str, List[float]]:
+    """Run the scenarios round-robin so drift (GC, caches) affects them equally"""
+    # Warm up lazy imports and schema caches
+    for name, (run, agent) in scenarios.items():
+        for i in range(5):
+            await run(agent, f"warmup_{name}_{i}")
+
+    samples: Dict[str, List[float]] = {name: [] for name in scenarios}
+    for i in range(iterations):
+        for name, (run, agent) in scenarios.items():
+            start = time.perf_counter()
+            await run(agent, f"bench_{name}_{i}")
+            samples[name].append((time.perf_counter() - start) * 1e6)
+    return samples
+
+
+def _time_construction(agent: TravelAgent, iterations: int) -> List[float]:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        RunnableWithMessageHistory(
+            agent.agent_executor,
+            lambda session_id: agent.get_chat_history(session_id),
+            input_messages_key="input",
+            history_messages_key="chat_history",
+        )
+        samples.append((time.perf_counter() - start) * 1e6)
+    return samples
+
+
+def _report(name: str, samples: List[float]) -> None:
+    ordered = sorted(samples)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(
+        f"{name:<44} mean {statistics.mean(samples):>9.1f} us   "
+        f"p50 {statistics.median(samples):>9.1f} us   p95 {p95:>9.1f} us"
+    )
+
+
+async def main(iterations: int) -> None:
+    quiet_agent = _build_agent(verbose=False)
+    verbose_agent = _build_agent(verbose=True)
+
+    print(f"Agent pipeline overhead ({iterations} iterations)\n")
+    _report("wrapper construction only", _time_construction(quiet_agent, iterations))
+
+    # Verbose tracing writes to stdout; send it to /dev/null so only the cost remains
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        samples = await _time_turns({
+            "before": (_per_request_wrapper, verbose_agent),
+            "wrapper_only": (_per_request_wrapper, quiet_agent),
+            "after": (_prebuilt_wrapper, quiet_agent),
+        }, iterations)
+    before, after = samples["before"], samples["after"]
+
+    _report("before: per-request wrapper, verbose=True", before)
+    _report("per-request wrapper, verbose=False", samples["wrapper_only"])
+    _report("after: prebuilt wrapper, verbose=False", after)
+
+    saved = statistics.mean(before) - statistics.mean(after)
+    print(f"\nPer-turn overhead removed: {saved:.1f} us ({saved / statistics.mean(before):.1%})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations))
@@ -0,0 +1,142 @@
+"""
+Catalog Snapshot Benchmark
+Compares search latency through the database client against the in-memory
+catalog snapshot, checks both return the same rows, and compares a full
+snapshot reload with a delta sync of a few changed rows
+
+The database side is the in-memory Supabase with a simulated round trip
+(--db-latency-ms), so it measures what a remote query costs the caller.
+
+Usage:
+    python -m benchmarks.bench_catalog_snapshot --rows 2000 --iterations 200 --db-latency-ms 20 --changes 10
+"""
+from typing import Any, Dict, List, Tuple
+import argparse
+import asyncio
+import statistics
+import time
+
+import benchmarks  # noqa: F401  (sets dummy credentials)
+from benchmarks.fakes import InMemorySupabase
+from src.services.catalog_snapshot import CatalogSnapshot
+from src.services.catalog_sync import CatalogSync
+from src.services.database import (
+    async_supabase_client,
+    CATALOG_SNAPSHOT_COLUMNS,
+    CATALOG_SYNC_COLUMNS,
+    HOTEL_SUMMARY,
+    PACKAGE_SUMMARY,
+    PLACE_CARD
+)
+
+
+# (client method, filters) pairs as the tools call them
+QUERIES: List[Tuple[str, Dict[str, Any]]] = [
+    ("search_hotels", {"city": "Dhaka", "country": None, "limit": 10, "columns": HOTEL_SUMMARY}),
+    ("get_hotels_sorted_by_price", {"city": "Sylhet", "country": None, "ascending": True, "limit": 10, "columns": HOTEL_SUMMARY}),
+    ("search_packages", {"destination": "Cox's Bazar", "country": None, "category": None, "max_price": 20000,
+                         "min_price": None, "duration_days": None, "limit": 10, "columns": PACKAGE_SUMMARY}),
+    ("get_cheapest_packages", {"destination": "Sylhet", "limit": 5, "columns": PACKAGE_SUMMARY}),
+    ("get_packages_sorted_by_price", {"ascending": False, "limit": 10, "columns": PACKAGE_SUMMARY}),
+    ("search_places", {"country": None, "city": None, "category": None, "near_city": "Chittagong",
+                       "is_featured": None, "limit": 10, "columns": PLACE_CARD}),
+    ("get_popular_places", {"limit": 10, "columns": PLACE_CARD}),
+]
+
+# Sort key of the ordered queries; the rest have no ORDER BY
+SORT_KEYS = {
+    "get_hotels_sorted_by_price": "rating",
+    "get_cheapest_packages": "price",
+    "get_packages_sorted_by_price": "price",
+    "search_places": "popular_ranking",
+    "get_popular_places": "popular_ranking",
+}
+
+
+async def _remote(method: str, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return await getattr(async_supabase_client, method)(**filters)
+
+
+async def _same(snapshot: CatalogSnapshot, method: str, filters: Dict[str, Any]) -> bool:
+    """
+    Both sides match the same rows in the same key order
+
+    Compared without the limit: rows with equal sort keys (or all rows, for
+    unordered queries) may come back in any order, so a limit could cut the
+    two results at different rows and still both be correct.
+    """
+    unlimited = {**filters, "limit": 100000}
+    remote = await _remote(method, unlimited)
+    local = snapshot.search(method, unlimited)
+    by_id = lambda rows: sorted(rows, key=lambda row: row["id"])
+    key = SORT_KEYS.get(method)
+    same_order = key is None or [row[key] for row in remote] == [row[key] for row in local]
+    return same_order and by_id(remote) == by_id(local)
+
+
+async def main(args: argparse.Namespace) -> None:
+    db = InMemorySupabase(seed=args.seed, rows_per_table=args.rows, latency_ms=args.db_latency_ms)
+    db.install()
+    # Measure the remote queries themselves, not the result caches
+    async_supabase_client.search_cache = None
+    async_supabase_client.catalog_snapshot = None
+
+    snapshot = CatalogSnapshot(CATALOG_SNAPSHOT_COLUMNS, page_size=args.page_size)
+    await snapshot.refresh(async_supabase_client)
+    print(
+        f"Snapshot of {snapshot.stats()['tables']} loaded in {snapshot.last_refresh_ms} ms "
+        f"({db.queries} page requests)\n"
+    )
+
+    print(f"{'query':<30}{'rows':>6}{'db ms':>10}{'local us':>11}{'same':>6}")
+    for method, filters in QUERIES:
+        remote_samples, local_samples = [], []
+        for i in range(args.iterations):
+            if i < args.remote_iterations:
+                start = time.perf_counter()
+                await _remote(method, filters)
+                remote_samples.append((time.perf_counter() - start) * 1000)
+            start = time.perf_counter()
+            local = snapshot.search(method, filters)
+            local_samples.append((time.perf_counter() - start) * 1e6)
+
+        print(
+            f"{method:<30}{len(local):>6}{statistics.median(remote_samples):>10.2f}"
+            f"{statistics.median(local_samples):>11.1f}{'yes' if await _same(snapshot, method, filters) else 'NO':>6}"
+        )
+
+    # Refresh cost: full reload against polling for changed rows
+    sync = CatalogSync(CATALOG_SYNC_COLUMNS, overlap_seconds=0, page_size=args.page_size, snapshot=snapshot)
+    await sync.start(async_supabase_client)
+    await sync.sync_once(async_supabase_client)  # applies the rows at the initial watermark
+
+    for i, row in enumerate(db.tables["packages"][:args.changes]):
+        row["price"] = float(row["price"]) + 500
+        row["updated_at"] = f"2030-01-01T00:00:{i:02d}+00:00"
+    queries = db.queries
+    start = time.perf_counter()
+    applied = await sync.sync_once(async_supabase_client)
+    sync_ms = (time.perf_counter() - start) * 1000
+    sync_queries = db.queries - queries
+
+    queries = db.queries
+    start = time.perf_counter()
+    await snapshot.refresh(async_supabase_client)
+    reload_ms = (time.perf_counter() - start) * 1000
+    print(
+        f"\nFull reload: {reload_ms:.1f} ms, {db.queries - queries} requests\n"
+        f"Delta sync of {applied} changed rows: {sync_ms:.1f} ms, {sync_queries} requests "
+        f"(one per synced table)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2000, help="Hotels, packages and places to generate")
+    parser.add_argument("--iterations", type=int, default=200, help="Local searches timed per query")
+    parser.add_argument("--remote-iterations", type=int, default=10, help="Remote queries timed per query")
+    parser.add_argument("--db-latency-ms", type=float, default=20.0)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--changes", type=int, default=10, help="Package rows changed before the delta sync")
+    parser.add_argument("--seed", type=int, default=42)
+    asyncio.run(main(parser.parse_args()))
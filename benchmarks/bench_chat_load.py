@@ -0,0 +1,163 @@
+"""
+Chat Endpoint Load Benchmark
+Drives POST /api/chat at increasing concurrency against the scripted chat model
+and the in-memory Supabase, reporting p50/p95/p99 latency and throughput
+
+The fake LLM and database add fixed, configurable latencies and the message
+mix and seed are fixed, so runs on different commits measure the same work.
+Save a run with --json and compare the files between commits.
+
+Usage:
+    python -m benchmarks.bench_chat_load --concurrency 1 8 32 --requests 200 \\
+        --llm-latency-ms 300 --db-latency-ms 20 --json bench_output.json
+"""
+from typing import Any, Dict, List
+import argparse
+import asyncio
+import json
+import logging
+import subprocess
+import time
+
+import benchmarks  # noqa: F401  (sets dummy credentials)
+import httpx
+from fastapi import FastAPI
+from benchmarks.fakes import InMemorySupabase, ScriptedChatModel
+from src.config import settings
+from src.routes import api
+from src.services.agent import TravelAgent
+from src.services.session_store import InMemorySessionStore
+
+
+MESSAGES = [
+    "Show me hotels in Dhaka",
+    "What are the cheapest travel packages?",
+    "What's the weather in Cox's Bazar?",
+    "Find popular tourist places",
+    "Packages to Sylhet",
+    "Plan a trip to Sylhet with a hotel and places to visit",
+    "Cheap hotels in Chittagong",
+    "Thanks, that's all!",
+]
+
+
+def _percentile(ordered: List[float], pct: float) -> float:
+    """Nearest-rank percentile of sorted samples"""
+    if not ordered:
+        return 0.0
+    rank = max(1, min(len(ordered), round(pct / 100 * len(ordered) + 0.5)))
+    return ordered[rank - 1]
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def _build_app(args: argparse.Namespace) -> FastAPI:
+    """App with the real routes, backed by the fakes"""
+    # No external calls or per-request caching of answers unless asked for
+    settings.openweather_api_key = ""
+    settings.debug = False  # verbose executor tracing would dominate the timings
+    settings.response_cache_enabled = args.response_cache
+
+    InMemorySupabase(seed=args.seed, latency_ms=args.db_latency_ms).install()
+    api.travel_agent = TravelAgent(
+        session_store=InMemorySessionStore(),
+        llm=ScriptedChatModel(latency_ms=args.llm_latency_ms),
+        fast_llm=ScriptedChatModel(latency_ms=args.llm_latency_ms / 2)
+    )
+
+    app = FastAPI()
+    app.include_router(api.router, prefix="/api")
+    return app
+
+
+async def _run_level(client: httpx.AsyncClient, concurrency: int, requests: int, turns: int) -> Dict[str, Any]:
+    """Send `requests` chat requests with at most `concurrency` in flight"""
+    latencies: List[float] = []
+    statuses: Dict[int, int] = {}
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i: int) -> None:
+        async with semaphore:
+            # Each session sends `turns` consecutive messages
+            session_id = f"bench_c{concurrency}_s{i // turns}"
+            body = {"message": MESSAGES[i % len(MESSAGES)], "session_id": session_id}
+            start = time.perf_counter()
+            response = await client.post("/api/chat", json=body)
+            latencies.append((time.perf_counter() - start) * 1000)
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    elapsed = time.perf_counter() - start
+
+    ordered = sorted(latencies)
+    return {
+        "concurrency": concurrency,
+        "requests": requests,
+        "ok": statuses.get(200, 0),
+        "shed_503": statuses.get(503, 0),
+        "errors": requests - statuses.get(200, 0) - statuses.get(503, 0),
+        "p50_ms": round(_percentile(ordered, 50), 1),
+        "p95_ms": round(_percentile(ordered, 95), 1),
+        "p99_ms": round(_percentile(ordered, 99), 1),
+        "throughput_rps": round(requests / elapsed, 1),
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    app = _build_app(args)
+    # ASGITransport skips the network stack, so only the app is measured
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        await _run_level(client, concurrency=1, requests=len(MESSAGES), turns=1)  # warm up
+
+        print(
+            f"/api/chat load (llm {args.llm_latency_ms:.0f} ms, db {args.db_latency_ms:.0f} ms, "
+            f"{args.requests} requests per level, commit {_git_commit()})\n"
+        )
+        print(f"{'conc':>5}{'ok':>6}{'503':>6}{'err':>6}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'req/s':>9}")
+
+        results = []
+        for concurrency in args.concurrency:
+            row = await _run_level(client, concurrency, args.requests, args.turns)
+            results.append(row)
+            print(
+                f"{row['concurrency']:>5}{row['ok']:>6}{row['shed_503']:>6}{row['errors']:>6}"
+                f"{row['p50_ms']:>10.1f}{row['p95_ms']:>10.1f}{row['p99_ms']:>10.1f}{row['throughput_rps']:>9.1f}"
+            )
+
+    if args.json:
+        report = {
+            "commit": _git_commit(),
+            "params": {k: v for k, v in vars(args).items() if k != "json"},
+            "results": results,
+            "agent": api.travel_agent.get_metrics(),
+        }
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2, default=str)
+        print(f"\nSaved to {args.json}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--requests", type=int, default=200, help="Requests per concurrency level")
+    parser.add_argument("--turns", type=int, default=1, help="Messages per session")
+    parser.add_argument("--llm-latency-ms", type=float, default=300.0)
+    parser.add_argument("--db-latency-ms", type=float, default=20.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--response-cache", action="store_true", help="Keep the response cache enabled")
+    parser.add_argument("--json", help="Write results to this file for comparison across commits")
+    args = parser.parse_args()
+
+    # Per-request INFO logs would dominate the measurement
+    logging.disable(logging.WARNING)
+    asyncio.run(main(args))
@@ -0,0 +1,131 @@
+"""
+Column Projection Benchmark
+Measures the response payload bytes and JSON decode time of every catalog query
+with select("*") (before) and the named column projection the tools use (after)
+
+Rows come from the in-memory Supabase, with the image galleries and package
+itineraries filled to realistic sizes since those are what the projections drop.
+
+Usage:
+    python -m benchmarks.bench_projection --iterations 500 --rows 40
+"""
+from typing import Any, Awaitable, Callable, List, Tuple
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+import benchmarks  # noqa: F401  (sets dummy credentials)
+from benchmarks.fakes import InMemorySupabase
+from src.services.database import (
+    async_supabase_client,
+    HOTEL_SUMMARY,
+    ROOM_SUMMARY,
+    PACKAGE_SUMMARY,
+    PACKAGE_PRICING,
+    PLACE_CARD
+)
+
+
+STORAGE_URL = "https://project.supabase.co/storage/v1/object/public/catalog"
+
+
+def _add_media(db: InMemorySupabase) -> None:
+    """Give catalog rows the image galleries and itineraries real rows carry"""
+    for table in ("hotels", "packages", "places"):
+        for row in db.tables[table]:
+            row["cover_image"] = f"{STORAGE_URL}/{table}/{row['id']}/cover.jpg"
+            row["images"] = [f"{STORAGE_URL}/{table}/{row['id']}/gallery-{i}.jpg" for i in range(8)]
+    for row in db.tables["packages"]:
+        row["itinerary"] = {
+            f"day_{day + 1}": {
+                "title": f"Day {day + 1} in {row['destination']}",
+                "activities": ["Breakfast at the hotel", "Guided sightseeing", "Local lunch", "Free evening"],
+                "notes": "Pickup from the hotel lobby at 8 AM. Comfortable shoes recommended."
+            }
+            for day in range(row["duration_days"])
+        }
+
+
+def _queries(db: InMemorySupabase) -> List[Tuple[str, str, Callable[[str], Awaitable[Any]]]]:
+    """(query, projection name, fetch(columns)) for each catalog query the tools make"""
+    hotel_id = db.tables["hotels"][0]["id"]
+    package_id = db.tables["packages"][0]["id"]
+    client = async_supabase_client
+    return [
+        ("search_hotels", "HOTEL_SUMMARY",
+         lambda columns: client.search_hotels(city="Dhaka", limit=10, columns=columns)),
+        ("get_hotels_sorted_by_price", "HOTEL_SUMMARY",
+         lambda columns: client.get_hotels_sorted_by_price(limit=10, columns=columns)),
+        ("get_hotel_rooms", "ROOM_SUMMARY",
+         lambda columns: client.get_hotel_rooms(hotel_id, columns=columns)),
+        ("search_packages", "PACKAGE_SUMMARY",
+         lambda columns: client.search_packages(limit=10, columns=columns)),
+        ("get_cheapest_packages", "PACKAGE_SUMMARY",
+         lambda columns: client.get_cheapest_packages(limit=5, columns=columns)),
+        ("get_package_by_id", "PACKAGE_PRICING",
+         lambda columns: client.get_package_by_id(package_id, columns=columns)),
+        ("search_places", "PLACE_CARD",
+         lambda columns: client.search_places(limit=10, columns=columns)),
+        ("get_popular_places", "PLACE_CARD",
+         lambda columns: client.get_popular_places(limit=10, columns=columns)),
+    ]
+
+
+PROJECTIONS = {
+    "HOTEL_SUMMARY": HOTEL_SUMMARY,
+    "ROOM_SUMMARY": ROOM_SUMMARY,
+    "PACKAGE_SUMMARY": PACKAGE_SUMMARY,
+    "PACKAGE_PRICING": PACKAGE_PRICING,
+    "PLACE_CARD": PLACE_CARD,
+}
+
+
+def _measure(payload: bytes, iterations: int) -> float:
+    """Median JSON decode time in microseconds"""
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        json.loads(payload)
+        samples.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(samples)
+
+
+async def main(args: argparse.Namespace) -> None:
+    db = InMemorySupabase(seed=args.seed, rows_per_table=args.rows)
+    _add_media(db)
+    db.install()
+
+    print(f"{'query':<28}{'projection':<17}{'* bytes':>9}{'bytes':>8}{'saved':>8}{'* us':>9}{'us':>8}")
+    totals = {"full": 0, "projected": 0, "full_us": 0.0, "projected_us": 0.0}
+    for name, projection, fetch in _queries(db):
+        # PostgREST sends the rows as a JSON array; encode them the same way
+        full = json.dumps(await fetch("*")).encode()
+        projected = json.dumps(await fetch(PROJECTIONS[projection])).encode()
+        full_us = _measure(full, args.iterations)
+        projected_us = _measure(projected, args.iterations)
+
+        totals["full"] += len(full)
+        totals["projected"] += len(projected)
+        totals["full_us"] += full_us
+        totals["projected_us"] += projected_us
+        saved = 1 - len(projected) / len(full) if full else 0.0
+        print(
+            f"{name:<28}{projection:<17}{len(full):>9}{len(projected):>8}{saved:>8.0%}"
+            f"{full_us:>9.1f}{projected_us:>8.1f}"
+        )
+
+    saved = 1 - totals["projected"] / totals["full"]
+    print(
+        f"{'total':<45}{totals['full']:>9}{totals['projected']:>8}{saved:>8.0%}"
+        f"{totals['full_us']:>9.1f}{totals['projected_us']:>8.1f}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=500, help="Decode timings per payload")
+    parser.add_argument("--rows", type=int, default=40, help="Hotels, packages and places to generate")
+    parser.add_argument("--seed", type=int, default=42)
+    asyncio.run(main(parser.parse_args()))
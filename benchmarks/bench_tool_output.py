@@ -0,0 +1,139 @@
+"""
+Tool Output Size Benchmark
+Measures the prompt size and latency of every tool's result with indented JSON
+(before) and the compact, budgeted encoder (after), using catalog-shaped sample rows
+
+Usage:
+    python -m benchmarks.bench_tool_output --iterations 200 --prefill-us-per-token 50
+"""
+from typing import Any, Dict, List, Tuple
+import argparse
+import asyncio
+import statistics
+import time
+
+import benchmarks  # noqa: F401  (sets dummy credentials)
+from src.config import settings
+from src.services import tools as tools_module
+from src.services.database import async_supabase_client
+
+
+LOREM = (
+    "Nestled in the heart of the city with sweeping views, this property offers "
+    "modern comforts, warm Bangladeshi hospitality, curated local experiences and "
+    "easy access to markets, heritage sites and the waterfront promenade. "
+)
+
+
+def _hotel(i: int) -> Dict[str, Any]:
+    return {
+        "id": f"00000000-0000-0000-0000-{i:012d}", "name": f"Sample Hotel {i}",
+        "city": "Dhaka", "country": "Bangladesh", "address": f"{i} Gulshan Avenue",
+        "rating": 4.2, "reviews_count": 120 + i, "phone": None,
+        "contact_email": None, "description": LOREM * 2, "min_price": 5500.0 + i * 250
+    }
+
+
+def _package(i: int) -> Dict[str, Any]:
+    return {
+        "id": f"10000000-0000-0000-0000-{i:012d}", "name": f"Sample Package {i}",
+        "destination": "Cox's Bazar", "country": "Bangladesh", "category": "beach",
+        "duration_days": 3 + i % 4, "price": 12000.0 + i * 1500, "currency": "BDT",
+        "max_participants": 20, "available_slots": 12, "rating": 4.5,
+        "reviews_count": 40 + i, "included_services": ["hotel", "breakfast", "transport"],
+        "description": LOREM * 2
+    }
+
+
+def _place(i: int) -> Dict[str, Any]:
+    return {
+        "id": f"20000000-0000-0000-0000-{i:012d}", "name": f"Sample Place {i}",
+        "city": "Sylhet", "country": "Bangladesh", "category": "nature", "rating": 4.6,
+        "popular_ranking": i, "famous_for": ["tea gardens", "waterfalls"],
+        "activities": ["hiking", "boating"], "best_time_to_visit": None,
+        "description": LOREM * 2
+    }
+
+
+def _room(i: int) -> Dict[str, Any]:
+    return {
+        "id": f"30000000-0000-0000-0000-{i:012d}", "room_type": "Deluxe",
+        "price_per_night": 6500.0, "currency": "BDT", "capacity": 2, "bed_type": "King",
+        "amenities": ["wifi", "air conditioning", "breakfast"], "available_count": 4
+    }
+
+
+def _patch_database() -> None:
+    """Serve catalog-shaped rows instead of calling Supabase"""
+    async def rows(factory, count):
+        return [factory(i) for i in range(count)]
+
+    async_supabase_client.search_hotels = lambda **kwargs: rows(_hotel, 10)
+    async_supabase_client.get_hotel_rooms = lambda hotel_id, **kwargs: rows(_room, 6)
+    async_supabase_client.get_hotels_sorted_by_price = lambda **kwargs: rows(_hotel, 10)
+    async_supabase_client.search_packages = lambda **kwargs: rows(_package, 10)
+    async_supabase_client.get_cheapest_packages = lambda **kwargs: rows(_package, 5)
+    async_supabase_client.get_packages_sorted_by_price = lambda **kwargs: rows(_package, 10)
+    async_supabase_client.search_places = lambda **kwargs: rows(_place, 10)
+    async_supabase_client.get_popular_places = lambda **kwargs: rows(_place, 10)
+
+
+SCENARIOS: List[Tuple[str, Dict[str, Any]]] = [
+    ("search_hotels", {"city": "Dhaka"}),
+    ("get_hotel_rooms", {"hotel_id": "00000000-0000-0000-0000-000000000001"}),
+    ("get_hotels_by_price", {"sort_order": "low_to_high"}),
+    ("search_packages", {"destination": "Cox's Bazar"}),
+    ("get_cheapest_packages", {}),
+    ("get_packages_by_price", {"sort_order": "low_to_high"}),
+    ("search_places", {"city": "Sylhet"}),
+    ("get_popular_places", {}),
+]
+
+
+async def _measure(tool_name: str, args: Dict[str, Any], iterations: int) -> Tuple[int, float]:
+    """Return (output bytes, mean tool latency in microseconds)"""
+    tool = getattr(tools_module, tool_name)
+    output = await tool.ainvoke(args)
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await tool.ainvoke(args)
+        samples.append((time.perf_counter() - start) * 1e6)
+    return len(output.encode("utf-8")), statistics.mean(samples)
+
+
+async def main(iterations: int, prefill_us_per_token: float) -> None:
+    _patch_database()
+    print(f"Tool output size ({iterations} iterations, ~4 bytes per token, "
+          f"prefill {prefill_us_per_token:.0f} us/token)\n")
+    print(f"{'tool':<24}{'bytes before':>13}{'bytes after':>12}{'saved':>8}"
+          f"{'tool us before':>16}{'tool us after':>15}{'turn ms saved':>15}")
+
+    totals = [0, 0]
+    for tool_name, args in SCENARIOS:
+        settings.tool_output_compact = False
+        before_bytes, before_us = await _measure(tool_name, args, iterations)
+        settings.tool_output_compact = True
+        after_bytes, after_us = await _measure(tool_name, args, iterations)
+        totals[0] += before_bytes
+        totals[1] += after_bytes
+
+        # The tool result is re-read by the LLM on the next iteration
+        tokens_saved = (before_bytes - after_bytes) / 4
+        turn_saved_ms = (tokens_saved * prefill_us_per_token + before_us - after_us) / 1000
+        print(f"{tool_name:<24}{before_bytes:>13}{after_bytes:>12}"
+              f"{1 - after_bytes / before_bytes:>8.0%}{before_us:>16.1f}{after_us:>15.1f}{turn_saved_ms:>15.2f}")
+
+    print(f"\nTotal: {totals[0]} -> {totals[1]} bytes "
+          f"(~{(totals[0] - totals[1]) // 4} prompt tokens saved, {1 - totals[1] / totals[0]:.0%})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument(
+        "--prefill-us-per-token", type=float, default=50.0,
+        help="Model prompt-processing cost used to estimate end-to-end turn savings"
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations, args.prefill_us_per_token))
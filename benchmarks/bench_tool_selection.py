@@ -0,0 +1,84 @@
+"""
+Tool Selection Benchmark
+Compares the tool-schema prompt size of binding all tools (before) with the
+per-turn intent-scoped subset (after), plus the cost of selecting the subset
+
+Usage:
+    python -m benchmarks.bench_tool_selection --iterations 2000 --prefill-us-per-token 50
+"""
+from typing import List
+import argparse
+import json
+import statistics
+import time
+
+import benchmarks  # noqa: F401  (sets dummy credentials)
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from src.services.tools import tools
+from src.services.tool_selection import ToolSelector
+
+
+MESSAGES = [
+    "Show me hotels in Dhaka",
+    "What are the cheapest travel packages?",
+    "What's the weather in Cox's Bazar?",
+    "Find popular tourist places in Sylhet",
+    "I want to book the Sundarbans package for 2 people",
+    "Plan a trip to Sylhet with a hotel and places to visit",
+    "Show my saved favorites",
+    "Thanks, that's all!",
+]
+
+
+def _schema_tokens(tool_names: List[str]) -> int:
+    """Approximate prompt tokens for the bound tool schemas (~4 bytes per token)"""
+    schemas = [convert_to_openai_tool(t) for t in tools if t.name in tool_names]
+    return len(json.dumps(schemas, separators=(",", ":"))) // 4
+
+
+def main(iterations: int, prefill_us_per_token: float) -> None:
+    all_names = [t.name for t in tools]
+    full_tokens = _schema_tokens(all_names)
+    selector = ToolSelector(all_names)
+
+    print(f"Tool schema size per LLM call ({len(all_names)} tools = ~{full_tokens} tokens, "
+          f"prefill {prefill_us_per_token:.0f} us/token)\n")
+    print(f"{'message':<56}{'tools':>6}{'tokens':>8}{'saved':>8}{'select us':>11}{'call ms saved':>15}")
+
+    saved_totals: List[float] = []
+    for message in MESSAGES:
+        selection = selector.select(message, session_id=f"bench_{message}")
+        names = selection.tool_names or all_names
+        tokens = _schema_tokens(names)
+
+        samples = []
+        for i in range(iterations):
+            start = time.perf_counter()
+            selector.select(message, session_id=f"bench_{i}")
+            samples.append((time.perf_counter() - start) * 1e6)
+        select_us = statistics.mean(samples)
+
+        # Every LLM call in the turn (usually 2: plan + answer) re-reads the schemas
+        call_saved_ms = ((full_tokens - tokens) * prefill_us_per_token - select_us) / 1000
+        saved_totals.append(1 - tokens / full_tokens)
+        print(f"{message[:54]:<56}{len(names):>6}{tokens:>8}{1 - tokens / full_tokens:>8.0%}"
+              f"{select_us:>11.1f}{call_saved_ms:>15.2f}")
+
+    from src.services.agent import travel_agent
+    build_start = time.perf_counter()
+    travel_agent._executor_for_turn({"tool_names": ["search_hotels", "get_weather"]})
+    build_ms = (time.perf_counter() - build_start) * 1000
+
+    print(f"\nAverage schema tokens saved per LLM call: {statistics.mean(saved_totals):.0%}")
+    print(f"One-time executor build per new subset: {build_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument(
+        "--prefill-us-per-token", type=float, default=50.0,
+        help="Model prompt-processing cost used to estimate per-call latency savings"
+    )
+    args = parser.parse_args()
+    main(args.iterations, args.prefill_us_per_token)
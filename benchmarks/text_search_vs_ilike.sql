@@ -0,0 +1,122 @@
+-- Full Text Search Benchmark
+-- Compares keyword search through the GIN tsvector indexes against the ilike
+-- scans the API used before, on a seeded copy of the catalog tables.
+--
+-- Run against a local Postgres with the migrations applied (including
+-- 008_full_text_search.sql); nothing outside the bench_fts schema is touched:
+--
+--     psql "$DATABASE_URL" -v rows=200000 -f benchmarks/text_search_vs_ilike.sql
+--
+-- Compare the "Execution Time" lines of each pair. ilike with a leading %
+-- can't use a btree index, so it reads the whole table; @@ reads only the
+-- matching posting lists.
+
+\set ON_ERROR_STOP on
+\if :{?rows}
+\else
+  \set rows 100000
+\endif
+\timing on
+
+drop schema if exists bench_fts cascade;
+create schema bench_fts;
+
+-- Same columns, defaults and indexes (including idx_*_search) as the real tables
+create table bench_fts.hotels (like public.hotels including all);
+create table bench_fts.packages (like public.packages including all);
+create table bench_fts.places (like public.places including all);
+
+-- Seed text: a few thousand distinct words per column, with the searched
+-- terms ("tea", "garden", "beachfront", "waterfall") in roughly 1% of rows
+insert into bench_fts.hotels (name, description, address, city, country, rating)
+select
+  'Hotel ' || i,
+  case when i % 100 = 0 then 'Beachfront resort with a rooftop pool' else 'Comfortable rooms near word' || (i % 5000) end,
+  'Road ' || (i % 900),
+  (array['Dhaka', 'Sylhet', 'Cox''s Bazar', 'Chittagong', 'Rajshahi'])[1 + i % 5],
+  'Bangladesh',
+  (i % 50) / 10.0
+from generate_series(1, :rows) as i;
+
+insert into bench_fts.packages (
+  name, description, destination, country, category, duration_days, price,
+  max_participants, available_slots, contact_email, contact_phone, cover_image
+)
+select
+  'Package ' || i,
+  case when i % 100 = 0 then 'Guided tea garden trek with a boat safari' else 'Day trip visiting word' || (i % 5000) end,
+  (array['Dhaka', 'Sylhet', 'Cox''s Bazar', 'Sundarbans', 'Bandarban'])[1 + i % 5],
+  'Bangladesh',
+  (array['adventure', 'luxury', 'beach', 'cultural'])[1 + i % 4],
+  1 + i % 7,
+  1000 + i % 50000,
+  20,
+  1 + i % 20,
+  'tours@example.com',
+  '+8800000000',
+  'cover.jpg'
+from generate_series(1, :rows) as i;
+
+insert into bench_fts.places (name, description, country, city, category, cover_image)
+select
+  'Place ' || i,
+  case when i % 100 = 0 then 'Hidden waterfall at the end of a jungle hike' else 'Local landmark called word' || (i % 5000) end,
+  'Bangladesh',
+  (array['Dhaka', 'Sylhet', 'Cox''s Bazar', 'Chittagong', 'Rajshahi'])[1 + i % 5],
+  (array['beach', 'mountain', 'historical', 'cultural'])[1 + i % 4],
+  'cover.jpg'
+from generate_series(1, :rows) as i;
+
+analyze bench_fts.hotels;
+analyze bench_fts.packages;
+analyze bench_fts.places;
+
+-- ==================== HOTELS ====================
+
+-- Before: substring match on the description
+explain (analyze, buffers)
+select id, name from bench_fts.hotels
+where description ilike '%beachfront%'
+limit 10;
+
+-- After: the search_hotels_text() body, against the seeded table
+explain (analyze, buffers)
+select h.id, h.name
+from bench_fts.hotels h, websearch_to_tsquery('english', 'beachfront') q
+where to_tsvector('english', h.name || ' ' || coalesce(h.description, '') || ' ' || coalesce(h.address, '') || ' ' || coalesce(h.city, '') || ' ' || coalesce(h.country, '')) @@ q
+order by ts_rank(to_tsvector('english', h.name || ' ' || coalesce(h.description, '') || ' ' || coalesce(h.address, '') || ' ' || coalesce(h.city, '') || ' ' || coalesce(h.country, '')), q) desc, h.id
+limit 10;
+
+-- ==================== PACKAGES ====================
+
+explain (analyze, buffers)
+select id, name from bench_fts.packages
+where is_active and available_slots > 0
+  and (description ilike '%tea%' and description ilike '%garden%')
+limit 10;
+
+explain (analyze, buffers)
+select p.id, p.name
+from bench_fts.packages p, websearch_to_tsquery('english', 'tea garden') q
+where to_tsvector('english', p.name || ' ' || p.description || ' ' || p.destination || ' ' || p.country || ' ' || p.category) @@ q
+  and p.is_active and p.available_slots > 0
+order by ts_rank(to_tsvector('english', p.name || ' ' || p.description || ' ' || p.destination || ' ' || p.country || ' ' || p.category), q) desc, p.id
+limit 10;
+
+-- ==================== PLACES ====================
+
+explain (analyze, buffers)
+select id, name from bench_fts.places
+where is_active and (name ilike '%waterfall%' or description ilike '%waterfall%')
+order by popular_ranking desc
+limit 10;
+
+explain (analyze, buffers)
+select pl.id, pl.name
+from bench_fts.places pl, websearch_to_tsquery('english', 'waterfall') q
+where to_tsvector('english', pl.name || ' ' || coalesce(pl.description, '') || ' ' || pl.country || ' ' || coalesce(pl.city, '')) @@ q
+  and pl.is_active
+order by ts_rank(to_tsvector('english', pl.name || ' ' || coalesce(pl.description, '') || ' ' || pl.country || ' ' || coalesce(pl.city, '')), q) desc, pl.id
+limit 10;
+
+drop schema bench_fts cascade;
@@ -7,12 +7,16 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from contextlib import asynccontextmanager
+import asyncio
 import logging
 import sys
 from datetime import datetime
 
 from src.config import settings, validate_settings
 from src.routes import router
+from src.services.agent import travel_agent
+from src.services.database import async_supabase_client, catalog_snapshot, catalog_sync, GAZETTEER_COLUMNS
+from src.utils.gazetteer import location_gazetteer
 
 # Configure logging
 logging.basicConfig(
@@ -47,6 +51,39 @@ async def lifespan(app: FastAPI):
         logger.info(f"Debug Mode: {settings.debug}")
         logger.info(f"Allowed Origins: {settings.allowed_origins}")
         
+        # Open a pooled database connection before the first request needs it
+        try:
+            await async_supabase_client.ping()
+            logger.info("✅ Database connection pool ready")
+        except Exception as e:
+            logger.warning(f"⚠️ Database warm-up failed: {e}")
+        
+        # Load the catalog snapshot and keep it and the caches fresh in the background
+        # (by polling for changed rows when the delta sync is on, else by full reloads)
+        snapshot_task = None
+        if catalog_snapshot is not None:
+            await catalog_snapshot.refresh(async_supabase_client)
+        if catalog_sync is not None:
+            # Cached chat answers quote prices and availability, so changes drop them too
+            if travel_agent.response_cache is not None:
+                catalog_sync.on_change = lambda table: travel_agent.response_cache.invalidate()
+            await catalog_sync.start(async_supabase_client)
+            snapshot_task = asyncio.create_task(catalog_sync.run(async_supabase_client))
+        elif catalog_snapshot is not None:
+            snapshot_task = asyncio.create_task(catalog_snapshot.run(async_supabase_client))
+        
+        # Learn the catalog's city and destination names for location matching
+        gazetteer_task = None
+        if settings.gazetteer_enabled:
+            await location_gazetteer.refresh(
+                async_supabase_client, GAZETTEER_COLUMNS, settings.catalog_snapshot_page_size
+            )
+            if settings.gazetteer_refresh_seconds:
+                gazetteer_task = asyncio.create_task(location_gazetteer.run(
+                    async_supabase_client, GAZETTEER_COLUMNS,
+                    settings.gazetteer_refresh_seconds, settings.catalog_snapshot_page_size
+                ))
+        
         logger.info("✅ GoTravel AI Backend started successfully!")
         
     except Exception as e:
@@ -57,6 +94,11 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("🛑 Shutting down GoTravel AI Backend...")
+    if snapshot_task is not None:
+        snapshot_task.cancel()
+    if gazetteer_task is not None:
+        gazetteer_task.cancel()
+    await async_supabase_client.aclose()
 
 
 # Create FastAPI application
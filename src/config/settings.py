@@ -3,7 +3,7 @@ Configuration module for the GoTravel AI Backend
 Loads environment variables and provides configuration settings
 """
 import os
-from typing import List, Union
+from typing import Dict, List, Union
 from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from dotenv import load_dotenv
@@ -19,6 +19,13 @@ class Settings(BaseSettings):
     supabase_url: str = ""
     supabase_key: str = ""
     
+    # Async Supabase HTTP connection pool (shared by all queries in a worker)
+    supabase_pool_max_connections: int = 20  # Open connections at most; further queries wait
+    supabase_pool_max_keepalive: int = 10  # Idle connections kept open for reuse
+    supabase_pool_keepalive_seconds: float = 30.0  # Idle connections are closed after this
+    supabase_http2: bool = True  # Multiplex queries over one connection where supported
+    supabase_timeout_seconds: float = 10.0
+    
     # Google AI Configuration
     google_api_key: str = ""
     
@@ -38,6 +45,88 @@ class Settings(BaseSettings):
     temperature: float = 0.7
     max_tokens: int = 2048
     
+    # Model Cascade (simple lookups and small talk go to a faster, cheaper model)
+    cascade_enabled: bool = False
+    fast_model_name: str = "gemini-2.0-flash-lite"
+    cascade_max_fast_words: int = 16  # Longer messages go to model_name
+    cascade_max_fast_constraints: int = 2  # Messages with more constraints go to model_name
+    # Prices in USD per million tokens, used for per-tier cost logging
+    llm_input_cost_per_million: float = 0.10
+    llm_output_cost_per_million: float = 0.40
+    fast_llm_input_cost_per_million: float = 0.075
+    fast_llm_output_cost_per_million: float = 0.30
+    
+    # LLM Admission Control (per worker)
+    llm_max_concurrency: int = 8  # Agent runs calling the LLM at the same time
+    llm_queue_size: int = 32  # Requests waiting for a slot; beyond this requests get 503
+    llm_queue_timeout_seconds: float = 10.0  # Longest wait for a slot before a 503
+    max_parallel_tools: int = 4  # Tool calls from one LLM step run concurrently up to this
+    tool_selection_enabled: bool = True  # Bind only the tools relevant to each message
+    prefetch_enabled: bool = True  # Start the likely tool query while the LLM plans the turn
+    prefetch_max_calls: int = 2  # Most speculative tool calls started per turn
+    
+    # Chat Session Store Configuration
+    session_max_count: int = 10000  # Least recently used sessions are evicted beyond this
+    session_ttl_seconds: int = 3600  # Idle sessions expire after this (0 disables)
+    session_max_messages: int = 50  # Oldest messages are trimmed beyond this (0 disables)
+    session_backend: str = "memory"  # "memory" (per worker) or "redis" (shared across workers)
+    redis_url: str = "redis://localhost:6379/0"
+    session_cache_size: int = 1000  # Local read-through cache size for shared backends
+    
+    # Prompt History Policy (what part of a session is sent to the LLM)
+    history_max_turns: int = 10  # Most recent turns sent verbatim (0 disables)
+    history_token_budget: int = 3000  # Approximate token cap for the history (0 disables)
+    history_summary_enabled: bool = True  # Condense older turns into a system note
+    history_summary_max_chars: int = 800
+    
+    # Tool Output Encoding (tool results are sent back to the LLM as prompt tokens)
+    tool_output_compact: bool = True  # Compact JSON without nulls; false restores indented JSON
+    tool_output_max_bytes: int = 3000  # Default per-tool budget (~4 bytes per token, 0 disables)
+    
+    # Rule-Based Fast Path (answers simple queries without the LLM)
+    fast_path_enabled: bool = False
+    fast_path_min_confidence: float = 0.8  # Queries scoring below this go to the LLM
+    
+    # Entity Cache (rows fetched by ID, e.g. the package priced for a booking)
+    entity_cache_enabled: bool = True
+    entity_cache_size: int = 2000
+    entity_cache_ttl_seconds: int = 300  # Bookings invalidate the booked item immediately
+    entity_cache_negative_ttl_seconds: int = 30  # Unknown IDs are remembered this long (0 disables)
+    
+    # Search Cache (list query results shared by all users, keyed on the normalized filters)
+    search_cache_enabled: bool = True
+    search_cache_size: int = 500  # Per table
+    search_cache_ttl_seconds: int = 120  # Tables not listed below
+    search_cache_table_ttls: Dict[str, int] = {  # JSON in the environment, e.g. {"places": 600}
+        "hotels": 300,
+        "rooms": 60,  # available_count changes with bookings
+        "packages": 60,  # available_slots changes with bookings
+        "places": 900
+    }
+    
+    # Location Gazetteer (place names found in messages and used to normalize tool arguments)
+    gazetteer_enabled: bool = True  # Learn names from the catalog; off keeps the curated list only
+    gazetteer_refresh_seconds: int = 3600  # Reload interval for new cities and destinations (0 disables)
+    
+    # Fuzzy Location Matching (pg_trgm similarity on hotels.city, packages.destination, places.city)
+    fuzzy_location_fallback: bool = True  # Retry a location search that matched nothing, closest spelling first
+    
+    # Catalog Snapshot (in-memory copy of hotels, packages and places that answers searches locally)
+    catalog_snapshot_enabled: bool = False
+    catalog_snapshot_refresh_seconds: int = 300  # Full reload interval (raise it when the delta sync is on)
+    catalog_snapshot_page_size: int = 1000  # Rows per request while loading (PostgREST max-rows)
+    
+    # Catalog Delta Sync (applies rows changed since the last poll, by updated_at, to the caches and snapshot)
+    catalog_sync_enabled: bool = False
+    catalog_sync_interval_seconds: int = 15
+    catalog_sync_overlap_seconds: int = 5  # Re-read window for rows committed late with an earlier updated_at
+    
+    # Response Cache (reuses answers to repeated first-turn queries)
+    response_cache_enabled: bool = True
+    response_cache_size: int = 1000
+    response_cache_ttl_seconds: int = 300  # Keep short: answers reflect live catalog data
+    response_cache_similarity: float = 0.0  # Near-match threshold, e.g. 0.9 (0 = exact matches only)
+    
     model_config = SettingsConfigDict(
         env_file=".env",
         case_sensitive=False,
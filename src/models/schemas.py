@@ -29,6 +29,9 @@ class ToolUsed(BaseModel):
     """Information about a tool that was used"""
     tool: str = Field(..., description="Name of the tool")
     input: Dict[str, Any] = Field(..., description="Input parameters to the tool")
+    duration_ms: Optional[float] = Field(None, description="Time the tool call took, in milliseconds")
+    memoized: bool = Field(False, description="Whether the result was reused from an identical call in the same turn")
+    prefetched: bool = Field(False, description="Whether the result came from a query started before the LLM asked for it")
 
 
 class ChatResponse(BaseModel):
@@ -38,6 +41,7 @@ class ChatResponse(BaseModel):
     session_id: str = Field(..., description="Session ID")
     tools_used: List[ToolUsed] = Field(default_factory=list, description="Tools used to generate response")
     message_count: int = Field(0, description="Number of messages in conversation")
+    metadata: Dict[str, Any] = Field(default_factory=dict, description="Processing details (e.g. fast path routing)")
     timestamp: datetime = Field(default_factory=datetime.now, description="Response timestamp")
     
     class Config:
@@ -3,6 +3,7 @@ FastAPI Routes
 API endpoints for the GoTravel AI Backend
 """
 from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import StreamingResponse
 from src.models import (
     ChatRequest, ChatResponse, ChatErrorResponse,
     SessionInfoRequest, SessionInfoResponse,
@@ -11,10 +12,20 @@ from src.models import (
     CreateBookingRequest, BookingResponse
 )
 from src.services.agent import travel_agent
-from src.services.database import supabase_client
+from src.services.database import (
+    async_supabase_client,
+    catalog_snapshot,
+    catalog_sync,
+    entity_cache,
+    search_cache,
+    PACKAGE_PRICING
+)
+from src.utils.gazetteer import location_gazetteer
 from src.config import settings
 import logging
 from datetime import datetime
+from typing import Any, AsyncIterator, Dict
+import json
 import uuid
 
 logger = logging.getLogger(__name__)
@@ -38,7 +49,7 @@ async def health_check():
     # Check Supabase connection
     try:
         # Try a simple query
-        result = supabase_client.client.table("hotels").select("id").limit(1).execute()
+        await async_supabase_client.ping()
         services_status["database"] = "connected"
     except Exception as e:
         logger.error(f"Database health check failed: {e}")
@@ -75,11 +86,60 @@ async def health_check():
 
 # ==================== CHAT ENDPOINTS ====================
 
+def _chat_response(result: Dict[str, Any]) -> ChatResponse:
+    """Build the chat response model from an agent result"""
+    return ChatResponse(
+        success=True,
+        response=result.get("response"),
+        session_id=result.get("session_id"),
+        tools_used=[
+            {
+                "tool": t["tool"],
+                "input": t["input"],
+                "duration_ms": t.get("duration_ms"),
+                "memoized": t.get("memoized", False),
+                "prefetched": t.get("prefetched", False)
+            }
+            for t in result.get("tools_used", [])
+        ],
+        message_count=result.get("message_count", 0),
+        metadata=result.get("metadata", {}),
+        timestamp=datetime.now()
+    )
+
+
+def _raise_for_failed_turn(result: Dict[str, Any]) -> None:
+    """Raise the HTTP error for a failed agent result (503 with Retry-After when overloaded)"""
+    if result.get("retry_after"):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=result.get("error", "Server is busy"),
+            headers={"Retry-After": str(result["retry_after"])}
+        )
+    raise HTTPException(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        detail=result.get("error", "Failed to process message")
+    )
+
+
+def _sse_event(event: str, data: Dict[str, Any]) -> str:
+    """Format a server-sent event"""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+async def _prepend(first: Dict[str, Any], rest: AsyncIterator[Dict[str, Any]]) -> AsyncIterator[Dict[str, Any]]:
+    """Yield an already-consumed first event followed by the rest of the stream"""
+    yield first
+    async for event in rest:
+        yield event
+
+
 @router.post(
     "/chat",
     response_model=ChatResponse,
     responses={
-        500: {"model": ChatErrorResponse, "description": "Internal server error"}
+        500: {"model": ChatErrorResponse, "description": "Internal server error"},
+        503: {"model": ChatErrorResponse, "description": "Server busy, retry after the Retry-After header"}
     },
     summary="Chat with AI Assistant",
     description="Send a message to the AI travel assistant and receive a response"
@@ -106,22 +166,9 @@ async def chat(request: ChatRequest):
         )
         
         if not result.get("success"):
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=result.get("error", "Failed to process message")
-            )
+            _raise_for_failed_turn(result)
         
-        return ChatResponse(
-            success=True,
-            response=result.get("response"),
-            session_id=result.get("session_id"),
-            tools_used=[
-                {"tool": t["tool"], "input": t["input"]}
-                for t in result.get("tools_used", [])
-            ],
-            message_count=result.get("message_count", 0),
-            timestamp=datetime.now()
-        )
+        return _chat_response(result)
         
     except HTTPException:
         raise
@@ -133,6 +180,58 @@ async def chat(request: ChatRequest):
         )
 
 
+@router.post(
+    "/chat/stream",
+    responses={
+        503: {"model": ChatErrorResponse, "description": "Server busy, retry after the Retry-After header"}
+    },
+    summary="Chat with AI Assistant (streaming)",
+    description=(
+        "Send a message and receive the response as server-sent events: "
+        "'token' events with incremental text, 'tool_start'/'tool_end' events "
+        "while tools run, and a final 'done' event with the same payload as /chat"
+    ),
+    response_class=StreamingResponse
+)
+async def chat_stream(request: ChatRequest):
+    """Streaming variant of the chat endpoint using server-sent events"""
+    # Generate session ID if not provided
+    session_id = request.session_id or f"session_{uuid.uuid4().hex[:12]}"
+    
+    events = travel_agent.stream_message(
+        message=request.message,
+        session_id=session_id,
+        user_context={"user_id": request.user_id} if request.user_id else None
+    )
+    
+    # Look at the first event before committing to a 200 stream, so load
+    # shedding still answers with 503 + Retry-After
+    first_event = await events.__anext__()
+    if first_event["event"] == "error" and first_event["data"].get("retry_after"):
+        await events.aclose()
+        _raise_for_failed_turn(first_event["data"])
+    
+    async def event_stream() -> AsyncIterator[str]:
+        async for event in _prepend(first_event, events):
+            if event["event"] == "done":
+                payload = _chat_response(event["data"]).model_dump(mode="json")
+                yield _sse_event("done", payload)
+            elif event["event"] == "error":
+                payload = ChatErrorResponse(
+                    error=event["data"].get("error", "Failed to process message"),
+                    session_id=session_id
+                ).model_dump(mode="json")
+                yield _sse_event("error", payload)
+            else:
+                yield _sse_event(event["event"], event["data"])
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.post(
     "/session/info",
     response_model=SessionInfoResponse,
@@ -142,7 +241,7 @@ async def chat(request: ChatRequest):
 async def get_session_info(request: SessionInfoRequest):
     """Get information about a specific chat session"""
     try:
-        info = travel_agent.get_session_info(request.session_id)
+        info = await travel_agent.get_session_info(request.session_id)
         return SessionInfoResponse(
             exists=info.get("exists", False),
             session_id=request.session_id,
@@ -165,7 +264,7 @@ async def get_session_info(request: SessionInfoRequest):
 async def clear_session_history(request: ClearHistoryRequest):
     """Clear chat history for a session"""
     try:
-        success = travel_agent.clear_history(request.session_id)
+        success = await travel_agent.clear_history(request.session_id)
         return ClearHistoryResponse(
             success=success,
             session_id=request.session_id,
@@ -179,6 +278,32 @@ async def clear_session_history(request: ClearHistoryRequest):
         )
 
 
+# ==================== METRICS ====================
+
+@router.get(
+    "/metrics",
+    summary="Runtime Metrics",
+    description="Get in-process runtime metrics such as session store size and evictions"
+)
+async def get_metrics():
+    """Runtime metrics for this worker"""
+    metrics = {
+        "timestamp": datetime.now().isoformat(),
+        **travel_agent.get_metrics(),
+        "database_pool": async_supabase_client.pool_stats()
+    }
+    if entity_cache is not None:
+        metrics["entity_cache"] = entity_cache.stats()
+    if search_cache is not None:
+        metrics["search_cache"] = search_cache.stats()
+    if catalog_snapshot is not None:
+        metrics["catalog_snapshot"] = catalog_snapshot.stats()
+    if catalog_sync is not None:
+        metrics["catalog_sync"] = catalog_sync.stats()
+    metrics["gazetteer"] = location_gazetteer.stats()
+    return metrics
+
+
 # ==================== DIRECT BOOKING ENDPOINT ====================
 
 @router.post(
@@ -202,7 +327,7 @@ async def create_booking_direct(request: CreateBookingRequest):
         
         # Get item details
         if request.booking_type == "package":
-            item = supabase_client.get_package_by_id(request.item_id)
+            item = await async_supabase_client.get_package_by_id(request.item_id, columns=PACKAGE_PRICING)
             if not item:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
@@ -211,7 +336,7 @@ async def create_booking_direct(request: CreateBookingRequest):
             total_amount = float(item.get("price", 0)) * request.total_participants
             currency = item.get("currency", "BDT")
         else:
-            item = supabase_client.get_hotel_by_id(request.item_id)
+            item = await async_supabase_client.get_hotel_by_id(request.item_id, columns="id")
             if not item:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
@@ -225,7 +350,7 @@ async def create_booking_direct(request: CreateBookingRequest):
         user_id = request.user_id or str(uuid.uuid4())
         
         # Create booking
-        booking = supabase_client.create_booking(
+        booking = await async_supabase_client.create_booking(
             user_id=user_id,
             booking_type=request.booking_type,
             item_id=request.item_id,
@@ -244,6 +369,10 @@ async def create_booking_direct(request: CreateBookingRequest):
                 detail="Failed to create booking"
             )
         
+        # Availability changed, so cached chat answers may be stale
+        if travel_agent.response_cache is not None:
+            travel_agent.response_cache.invalidate()
+        
         return BookingResponse(
             success=True,
             message="Booking created successfully",
@@ -278,10 +407,12 @@ async def root():
         "description": "AI-powered travel booking assistant using FastAPI, LangChain, and Supabase",
         "endpoints": {
             "chat": "/api/chat",
+            "chat_stream": "/api/chat/stream",
             "health": "/api/health",
             "session_info": "/api/session/info",
             "clear_session": "/api/session/clear",
             "create_booking": "/api/booking",
+            "metrics": "/api/metrics",
             "docs": "/docs",
             "redoc": "/redoc"
         },
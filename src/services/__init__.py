@@ -1,7 +1,11 @@
 """
 Services Package
 """
-from .database import supabase_client, SupabaseClient
+from .database import supabase_client, SupabaseClient, async_supabase_client, AsyncSupabaseClient
 from .agent import travel_agent, TravelAgent
 
-__all__ = ["supabase_client", "SupabaseClient", "travel_agent", "TravelAgent"]
+__all__ = [
+    "supabase_client", "SupabaseClient",
+    "async_supabase_client", "AsyncSupabaseClient",
+    "travel_agent", "TravelAgent"
+]
@@ -0,0 +1,117 @@
+"""
+LLM Admission Control
+Bounds concurrent agent runs per worker with a bounded, deadline-limited wait queue
+"""
+from typing import Any, AsyncIterator, Deque, Dict
+from collections import deque
+from contextlib import asynccontextmanager
+import asyncio
+import math
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request is shed instead of queued"""
+
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__(f"Server is busy ({reason}), retry in {retry_after}s")
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """
+    Limits how many agent runs call the LLM at once.
+
+    Up to ``max_concurrency`` runs proceed; up to ``max_queue`` more wait at
+    most ``queue_timeout_seconds`` for a slot. Anything beyond that is
+    rejected immediately with a Retry-After estimate based on recent run
+    times, so spikes turn into fast 503s instead of provider 429s.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        max_queue: int = 32,
+        queue_timeout_seconds: float = 10.0,
+        sample_size: int = 1000
+    ):
+        """
+        Args:
+            max_concurrency: Agent runs allowed at the same time
+            max_queue: Requests allowed to wait for a slot
+            queue_timeout_seconds: Longest a request may wait before it is rejected
+            sample_size: Number of recent wait times kept for percentiles
+        """
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout_seconds = queue_timeout_seconds
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._wait_times: Deque[float] = deque(maxlen=sample_size)
+        self._avg_run_seconds = 2.0
+
+        # Metrics
+        self.active = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.rejected_queue_full = 0
+        self.rejected_timeout = 0
+
+    def retry_after(self) -> int:
+        """Seconds until a slot is likely free, from the queue length and recent run times"""
+        backlog = (self.waiting + 1) / max(1, self.max_concurrency)
+        return max(1, min(60, math.ceil(backlog * self._avg_run_seconds)))
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[None]:
+        """
+        Hold a concurrency slot for the duration of the block
+
+        Raises:
+            AdmissionRejected: The queue is full or the wait deadline passed
+        """
+        if self._semaphore.locked() and self.waiting >= self.max_queue:
+            self.rejected_queue_full += 1
+            raise AdmissionRejected("queue_full", self.retry_after())
+
+        self.waiting += 1
+        start = time.monotonic()
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self.queue_timeout_seconds)
+        except asyncio.TimeoutError:
+            self.rejected_timeout += 1
+            raise AdmissionRejected("queue_timeout", self.retry_after())
+        finally:
+            self.waiting -= 1
+            self._wait_times.append(time.monotonic() - start)
+
+        self.active += 1
+        self.admitted += 1
+        run_start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.active -= 1
+            self._semaphore.release()
+            # Exponentially weighted average of run time for Retry-After estimates
+            self._avg_run_seconds = 0.9 * self._avg_run_seconds + 0.1 * (time.monotonic() - run_start)
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth, wait time and rejection counters"""
+        waits = sorted(self._wait_times)
+        return {
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "queue_timeout_seconds": self.queue_timeout_seconds,
+            "active": self.active,
+            "queue_depth": self.waiting,
+            "admitted": self.admitted,
+            "rejected_queue_full": self.rejected_queue_full,
+            "rejected_timeout": self.rejected_timeout,
+            "wait_ms_avg": round(sum(waits) / len(waits) * 1000, 1) if waits else 0.0,
+            "wait_ms_p95": round(waits[min(len(waits) - 1, int(len(waits) * 0.95))] * 1000, 1) if waits else 0.0,
+            "avg_run_seconds": round(self._avg_run_seconds, 2)
+        }
@@ -2,15 +2,32 @@
 AI Agent Module using LangChain and Google Gemini
 Handles intelligent conversation and tool calling for the travel assistant
 """
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, AsyncIterator
 from langchain_google_genai import ChatGoogleGenerativeAI
+from langchain_core.language_models import BaseChatModel
 from langchain.agents import AgentExecutor, create_tool_calling_agent
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
-from langchain_core.chat_history import BaseChatMessageHistory, InMemoryChatMessageHistory
+from langchain_core.chat_history import BaseChatMessageHistory
+from langchain_core.callbacks import BaseCallbackManager, UsageMetadataCallbackHandler
+from langchain_core.tools import BaseTool
+from langchain_core.runnables import RunnableConfig, RunnableLambda
+from langchain_core.runnables.config import patch_config
 from langchain_core.runnables.history import RunnableWithMessageHistory
 from src.config import settings
 from src.services.tools import tools
+from src.services.session_store import SessionStore, create_session_store
+from src.services.cache import TTLCache
+from src.services.tool_selection import ToolSelector
+from src.services.model_cascade import FAST, STRONG, ModelCascade
+from src.services.prefetch import SpeculativePrefetcher
+from src.services.fast_path import FastPathRouter
+from src.services.response_cache import ResponseCache
+from src.services.history_policy import HistoryPolicy
+from src.services.admission import AdmissionController, AdmissionRejected
+from src.services.turn_context import TurnContext, current_turn, turn_scope
+from src.utils.helpers import match_intents
+import time
 import logging
 
 logger = logging.getLogger(__name__)
@@ -58,17 +75,54 @@ Remember: Your goal is to make travel planning easy, enjoyable, and efficient fo
 class TravelAgent:
     """Main AI Agent for travel assistance"""
     
-    def __init__(self):
-        """Initialize the travel agent with LLM and tools"""
+    def __init__(
+        self,
+        session_store: Optional[SessionStore] = None,
+        llm: Optional[BaseChatModel] = None,
+        fast_llm: Optional[BaseChatModel] = None
+    ):
+        """
+        Initialize the travel agent with LLM and tools
+        
+        Args:
+            session_store: Chat history store (defaults to the configured store)
+            llm: Chat model to use instead of Gemini (e.g. a scripted fake for benchmarks)
+            fast_llm: Chat model for the cascade's fast tier instead of settings.fast_model_name
+        """
         
         # Initialize the LLM
-        self.llm = ChatGoogleGenerativeAI(
+        self.llm = llm or ChatGoogleGenerativeAI(
             model=settings.model_name,
             temperature=settings.temperature,
             max_tokens=settings.max_tokens,
             google_api_key=settings.google_api_key
         )
         
+        # Optional cheaper model for simple turns, escalating to self.llm when unsure
+        self.model_cascade = None
+        self.fast_llm = None
+        if settings.cascade_enabled:
+            self.model_cascade = ModelCascade(
+                max_fast_words=settings.cascade_max_fast_words,
+                max_fast_constraints=settings.cascade_max_fast_constraints,
+                costs={
+                    FAST: {
+                        "input": settings.fast_llm_input_cost_per_million,
+                        "output": settings.fast_llm_output_cost_per_million
+                    },
+                    STRONG: {
+                        "input": settings.llm_input_cost_per_million,
+                        "output": settings.llm_output_cost_per_million
+                    }
+                }
+            )
+            self.fast_llm = fast_llm or ChatGoogleGenerativeAI(
+                model=settings.fast_model_name,
+                temperature=settings.temperature,
+                max_tokens=settings.max_tokens,
+                google_api_key=settings.google_api_key
+            )
+        
         # Create the prompt template
         self.prompt = ChatPromptTemplate.from_messages([
             ("system", SYSTEM_PROMPT),
@@ -77,31 +131,336 @@ class TravelAgent:
             MessagesPlaceholder(variable_name="agent_scratchpad"),
         ])
         
-        # Create the agent
-        self.agent = create_tool_calling_agent(
-            llm=self.llm,
-            tools=tools,
+        # Create the agent executor with every tool bound
+        self.agent_executor = self._build_executor(tools)
+        self.agent = self.agent_executor.agent
+        
+        # Executors for the smaller tool subsets and the fast tier, built on first use
+        self.tool_selector = (
+            ToolSelector(
+                [t.name for t in tools],
+                max_sessions=settings.session_max_count,
+                ttl_seconds=settings.session_ttl_seconds or None
+            )
+            if settings.tool_selection_enabled else None
+        )
+        self._subset_executors = TTLCache(max_size=64)
+        
+        # Bounded store for chat histories (LRU + idle TTL)
+        self.session_store = session_store or create_session_store()
+        
+        # Bounds concurrent LLM runs in this worker, shedding load beyond the queue
+        self.admission = AdmissionController(
+            max_concurrency=settings.llm_max_concurrency,
+            max_queue=settings.llm_queue_size,
+            queue_timeout_seconds=settings.llm_queue_timeout_seconds
+        )
+        
+        # Caps how much of the stored history is sent to the LLM each turn
+        self.history_policy = HistoryPolicy(
+            max_turns=settings.history_max_turns,
+            token_budget=settings.history_token_budget,
+            summarize=settings.history_summary_enabled,
+            summary_max_chars=settings.history_summary_max_chars
+        )
+        
+        # Wrap the executor once so every request reuses the same pipeline
+        self.agent_with_history = RunnableWithMessageHistory(
+            RunnableLambda(self._apply_history_policy, name="history_policy")
+            | RunnableLambda(self._run_agent, name="agent_turn"),
+            self.get_chat_history,
+            input_messages_key="input",
+            history_messages_key="chat_history",
+        )
+        
+        # Cache of answers to repeated first-turn queries
+        self.response_cache = (
+            ResponseCache(
+                max_size=settings.response_cache_size,
+                ttl_seconds=settings.response_cache_ttl_seconds or None,
+                similarity_threshold=settings.response_cache_similarity
+            )
+            if settings.response_cache_enabled else None
+        )
+        
+        # Optional rule-based router that answers simple queries without the LLM
+        self.fast_path = (
+            FastPathRouter(min_confidence=settings.fast_path_min_confidence)
+            if settings.fast_path_enabled else None
+        )
+        
+        # Starts the likely tool query while the LLM is still planning the turn
+        self.prefetcher = (
+            SpeculativePrefetcher(max_calls=settings.prefetch_max_calls)
+            if settings.prefetch_enabled else None
+        )
+    
+    def _build_executor(self, tool_list: List[BaseTool], llm: Optional[BaseChatModel] = None) -> AgentExecutor:
+        """
+        Create an agent executor whose LLM (self.llm by default) is offered the given tools
+        
+        The executor itself can still run every tool, so a call to a tool
+        outside the subset (e.g. one remembered from earlier in the chat)
+        works instead of failing.
+        """
+        agent = create_tool_calling_agent(
+            llm=llm or self.llm,
+            tools=tool_list,
             prompt=self.prompt
         )
         
-        # Create agent executor
-        self.agent_executor = AgentExecutor(
-            agent=self.agent,
+        # Step-by-step tracing only in debug mode
+        return AgentExecutor(
+            agent=agent,
             tools=tools,
-            verbose=True,
+            verbose=settings.debug,
             max_iterations=5,
             handle_parsing_errors=True,
             return_intermediate_steps=True
         )
+    
+    def _executor_for_turn(self, inputs: Dict[str, Any], tier: str = STRONG) -> AgentExecutor:
+        """Pick the executor bound to the turn's tool subset (the full set by default) and model tier"""
+        tool_names = inputs.get("tool_names")
+        if not tool_names and tier == STRONG:
+            return self.agent_executor
         
-        # Store for chat histories (in production, use Redis or database)
-        self.chat_histories: Dict[str, InMemoryChatMessageHistory] = {}
+        names = frozenset(tool_names or [t.name for t in tools])
+        executor = self._subset_executors.get((tier, names))
+        if executor is None:
+            executor = self._build_executor(
+                [t for t in tools if t.name in names],
+                llm=self.fast_llm if tier == FAST else None
+            )
+            self._subset_executors.set((tier, names), executor)
+        return executor
+    
+    async def _run_tier(
+        self,
+        tier: str,
+        inputs: Dict[str, Any],
+        config: RunnableConfig,
+        runs: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Run the turn on one model tier, recording its latency and token usage"""
+        usage = UsageMetadataCallbackHandler()
+        callbacks = config.get("callbacks")
+        if isinstance(callbacks, BaseCallbackManager):
+            callbacks = callbacks.copy()
+            callbacks.add_handler(usage, inherit=True)
+        else:
+            callbacks = [*(callbacks or []), usage]
+        
+        start = time.perf_counter()
+        try:
+            return await self._executor_for_turn(inputs, tier).ainvoke(
+                inputs, config=patch_config(config, callbacks=callbacks, run_name=f"model_{tier}")
+            )
+        finally:
+            runs.append(self.model_cascade.record_run(tier, time.perf_counter() - start, usage.usage_metadata))
+    
+    async def _run_agent(self, inputs: Dict[str, Any], config: RunnableConfig) -> Dict[str, Any]:
+        """
+        Run the agent for one turn
+        
+        With the model cascade on, turns routed to the fast tier are redone on
+        the strong model when the fast model errors, skips an expected tool
+        call or gives a low-confidence answer. Only the accepted answer is
+        returned (and saved to the chat history).
+        """
+        if self.model_cascade is None:
+            return await self._executor_for_turn(inputs).ainvoke(inputs, config=config)
+        
+        runs: List[Dict[str, Any]] = []
+        if inputs.get("model_tier") == FAST:
+            try:
+                result = await self._run_tier(FAST, inputs, config, runs)
+                reason = self.model_cascade.escalation_reason(result, inputs.get("intents", []))
+            except Exception as e:
+                logger.warning(f"Fast model failed: {e}")
+                reason = "error"
+            if reason is None:
+                return {**result, "model_runs": runs}
+            
+            self.model_cascade.record_escalation(reason)
+            logger.info(f"Escalating turn to the strong model ({reason})")
+            turn = current_turn()
+            if turn is not None:
+                # Tool results stay memoized for the strong run; only the timings are dropped
+                turn.discard_calls()
+        
+        result = await self._run_tier(STRONG, inputs, config, runs)
+        return {**result, "model_runs": runs}
+    
+    def _agent_input(self, message: str, session_id: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Agent input for a message, including the tool subset and model tier to use"""
+        agent_input: Dict[str, Any] = {"input": message}
+        
+        if self.tool_selector is not None:
+            selection = self.tool_selector.select(message, session_id)
+            metadata["tools"] = selection.as_metadata(len(tools))
+            agent_input["tool_names"] = selection.tool_names
+        
+        if self.model_cascade is not None:
+            intents = match_intents(message)
+            decision = self.model_cascade.route(message, intents)
+            logger.info(f"Routing turn to the {decision.tier} model ({decision.reason})")
+            metadata["model"] = decision.as_metadata()
+            agent_input.update({"model_tier": decision.tier, "intents": intents})
+        
+        return agent_input
+    
+    def _start_turn(
+        self,
+        turn: TurnContext,
+        message: str,
+        session_id: str,
+        metadata: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Build the agent input and start any speculative prefetches for the turn"""
+        agent_input = self._agent_input(message, session_id, metadata)
+        if self.prefetcher is not None:
+            self.prefetcher.start(turn, message, agent_input.get("tool_names"))
+        return agent_input
+    
+    def _turn_metadata(self, metadata: Dict[str, Any], turn: TurnContext) -> None:
+        """Add the turn's tool memo and prefetch counters to the response metadata"""
+        metadata["tool_memo"] = turn.memo_stats()
+        if self.prefetcher is not None:
+            metadata["prefetch"] = self.prefetcher.record(turn)
+    
+    @staticmethod
+    def _model_metadata(metadata: Dict[str, Any], result: Dict[str, Any]) -> None:
+        """Add the tier that answered and the per-tier runs to the response metadata"""
+        runs = result.get("model_runs")
+        if not runs or "model" not in metadata:
+            return
+        metadata["model"].update({
+            "answered_by": runs[-1]["tier"],
+            "escalated": len(runs) > 1,
+            "runs": runs
+        })
     
     def get_chat_history(self, session_id: str) -> BaseChatMessageHistory:
         """Get or create chat history for a session"""
-        if session_id not in self.chat_histories:
-            self.chat_histories[session_id] = InMemoryChatMessageHistory()
-        return self.chat_histories[session_id]
+        return self.session_store.get_history(session_id)
+    
+    def _apply_history_policy(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Window and summarize the loaded history before it reaches the prompt"""
+        chat_history, report = self.history_policy.apply(inputs.get("chat_history", []))
+        return {**inputs, "chat_history": chat_history, "history_report": report}
+    
+    @staticmethod
+    def _summarize_tool_calls(
+        intermediate_steps: List[Any],
+        turn: Optional[TurnContext] = None
+    ) -> List[Dict[str, Any]]:
+        """Extract tool names, inputs and durations from the executor's intermediate steps"""
+        tools_used = []
+        for step in intermediate_steps:
+            if len(step) >= 2:
+                action, observation = step[0], step[1]
+                tool_used = {
+                    "tool": action.tool,
+                    "input": action.tool_input,
+                }
+                if turn is not None and isinstance(action.tool_input, dict):
+                    call = turn.pop_call(action.tool, action.tool_input)
+                    if call is not None:
+                        tool_used["duration_ms"] = round(call["seconds"] * 1000, 1)
+                        if call["memoized"]:
+                            tool_used["memoized"] = True
+                        if call["prefetched"]:
+                            tool_used["prefetched"] = True
+                tools_used.append(tool_used)
+        return tools_used
+    
+    async def _direct_result(
+        self,
+        message: str,
+        session_id: str,
+        response: str,
+        tools_used: List[Dict[str, Any]],
+        metadata: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Record an answer produced without the agent and build the result"""
+        # Keep the conversation history consistent with an agent turn
+        chat_history = self.get_chat_history(session_id)
+        await chat_history.aadd_messages([
+            HumanMessage(content=message),
+            AIMessage(content=response)
+        ])
+        
+        return {
+            "success": True,
+            "response": response,
+            "session_id": session_id,
+            "tools_used": tools_used,
+            "message_count": len(await chat_history.aget_messages()),
+            "metadata": metadata
+        }
+    
+    async def _try_shortcuts(self, message: str, session_id: str) -> Dict[str, Any]:
+        """
+        Try to answer the message without running the agent
+        
+        Checks the response cache (first turns only), then the rule-based fast path.
+        
+        Returns:
+            Dictionary with "metadata" about the checks, "result" if one of them
+            answered, and "cache_slot" (key, generation) if the agent's answer
+            may be cached
+        """
+        shortcut: Dict[str, Any] = {"metadata": {}}
+        
+        if self.response_cache is not None:
+            history = await self.session_store.aget_history(session_id, create=False)
+            if history is None or not await history.aget_messages():
+                key, generation, hit = self.response_cache.lookup(message)
+                if hit is not None:
+                    metadata = {"response_cache": {"hit": True, "similarity": hit["similarity"]}}
+                    shortcut["result"] = await self._direct_result(
+                        message, session_id, hit["response"], hit["tools_used"], metadata
+                    )
+                    return shortcut
+                shortcut["metadata"]["response_cache"] = {"hit": False}
+                shortcut["cache_slot"] = (key, generation)
+        
+        if self.fast_path is not None:
+            try:
+                handled = await self.fast_path.try_handle(message)
+            except Exception as e:
+                logger.warning(f"Fast path failed, falling back to the agent: {e}")
+                return shortcut
+            
+            shortcut["metadata"]["fast_path"] = {
+                **handled["decision"].as_metadata(),
+                "used": "response" in handled
+            }
+            if "response" in handled:
+                shortcut["result"] = await self._direct_result(
+                    message, session_id, handled["response"], [handled["tool"]], shortcut["metadata"]
+                )
+        
+        return shortcut
+    
+    def _after_agent_turn(
+        self,
+        shortcut: Dict[str, Any],
+        session_id: str,
+        response: str,
+        tools_used: List[Dict[str, Any]]
+    ) -> None:
+        """Remember the tools used, cache a first-turn answer and drop cached answers after a booking"""
+        if self.tool_selector is not None:
+            self.tool_selector.record_usage(session_id, tools_used)
+        if self.response_cache is None:
+            return
+        if any(t["tool"] == "create_booking" for t in tools_used):
+            self.response_cache.invalidate()
+        elif "cache_slot" in shortcut:
+            key, generation = shortcut["cache_slot"]
+            self.response_cache.store(key, generation, response, tools_used)
     
     async def process_message(
         self,
@@ -123,77 +482,227 @@ class TravelAgent:
         try:
             logger.info(f"Processing message for session {session_id}: {message}")
             
+            # Repeated and simple queries can be answered without calling the LLM
+            shortcut = await self._try_shortcuts(message, session_id)
+            if "result" in shortcut:
+                return shortcut["result"]
+            
             # Get chat history
             chat_history = self.get_chat_history(session_id)
             
-            # Prepare the agent with history
-            agent_with_history = RunnableWithMessageHistory(
-                self.agent_executor,
-                lambda session_id: self.get_chat_history(session_id),
-                input_messages_key="input",
-                history_messages_key="chat_history",
-            )
-            
-            # Invoke the agent
-            result = await agent_with_history.ainvoke(
-                {"input": message},
-                config={"configurable": {"session_id": session_id}}
-            )
+            # Invoke the agent once a concurrency slot is free
+            with turn_scope(settings.max_parallel_tools) as turn:
+                async with self.admission.admit():
+                    result = await self.agent_with_history.ainvoke(
+                        self._start_turn(turn, message, session_id, shortcut["metadata"]),
+                        config={"configurable": {"session_id": session_id}}
+                    )
             
             # Extract response
             response_text = result.get("output", "I'm sorry, I couldn't generate a response.")
             intermediate_steps = result.get("intermediate_steps", [])
             
             # Log tool calls
-            tools_used = []
-            for step in intermediate_steps:
-                if len(step) >= 2:
-                    action, observation = step[0], step[1]
-                    tools_used.append({
-                        "tool": action.tool,
-                        "input": action.tool_input,
-                    })
+            tools_used = self._summarize_tool_calls(intermediate_steps, turn)
             
             logger.info(f"Tools used: {[t['tool'] for t in tools_used]}")
+            self._after_agent_turn(shortcut, session_id, response_text, tools_used)
+            self._model_metadata(shortcut["metadata"], result)
+            shortcut["metadata"]["history"] = result.get("history_report", {})
+            self._turn_metadata(shortcut["metadata"], turn)
             
             return {
                 "success": True,
                 "response": response_text,
                 "session_id": session_id,
                 "tools_used": tools_used,
-                "message_count": len(chat_history.messages)
+                "message_count": len(await chat_history.aget_messages()),
+                "metadata": shortcut["metadata"]
             }
             
+        except AdmissionRejected as e:
+            logger.warning(f"Rejected message for session {session_id}: {e}")
+            return _error_result(e, session_id, self.admission)
         except Exception as e:
             logger.error(f"Error processing message: {e}", exc_info=True)
-            return {
-                "success": False,
-                "response": "I apologize, but I encountered an error processing your request. Please try again.",
-                "error": str(e),
-                "session_id": session_id
+            return _error_result(e, session_id, self.admission)
+    
+    async def stream_message(
+        self,
+        message: str,
+        session_id: str = "default",
+        user_context: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Process a user message, yielding events as the agent works
+        
+        Events are dictionaries with an "event" name and a "data" payload:
+            - token: a chunk of LLM output text
+            - tool_start / tool_end: a tool call beginning or finishing
+            - escalated: the fast model's answer was discarded; text streamed so far
+              should be cleared as the strong model answers again
+            - done: the final result, same shape as process_message's return value
+            - error: processing failed
+        
+        Args:
+            message: User's input message
+            session_id: Session identifier for maintaining conversation history
+            user_context: Optional context about the user (id, preferences, etc.)
+        """
+        try:
+            logger.info(f"Streaming message for session {session_id}: {message}")
+            
+            shortcut = await self._try_shortcuts(message, session_id)
+            if "result" in shortcut:
+                yield {"event": "token", "data": {"text": shortcut["result"]["response"]}}
+                yield {"event": "done", "data": shortcut["result"]}
+                return
+            
+            chat_history = self.get_chat_history(session_id)
+            result: Dict[str, Any] = {}
+            history_report: Dict[str, Any] = {}
+            fast_started = False
+            
+            with turn_scope(settings.max_parallel_tools) as turn:
+                async with self.admission.admit():
+                    async for event in self.agent_with_history.astream_events(
+                        self._start_turn(turn, message, session_id, shortcut["metadata"]),
+                        config={"configurable": {"session_id": session_id}},
+                        version="v2"
+                    ):
+                        kind = event["event"]
+                        
+                        if kind == "on_chat_model_stream":
+                            text = _chunk_text(event["data"].get("chunk"))
+                            if text:
+                                yield {"event": "token", "data": {"text": text}}
+                        
+                        elif kind == "on_tool_start":
+                            yield {
+                                "event": "tool_start",
+                                "data": {"tool": event["name"], "input": event["data"].get("input", {})}
+                            }
+                        
+                        elif kind == "on_tool_end":
+                            yield {"event": "tool_end", "data": {"tool": event["name"]}}
+                        
+                        elif kind == "on_chain_start" and event["name"] == "model_fast":
+                            fast_started = True
+                        
+                        elif kind == "on_chain_start" and event["name"] == "model_strong" and fast_started:
+                            yield {"event": "escalated", "data": {"from": FAST, "to": STRONG}}
+                        
+                        elif kind == "on_chain_end" and event["name"] == "history_policy":
+                            history_report = (event["data"].get("output") or {}).get("history_report", {})
+                        
+                        elif kind == "on_chain_end" and not event.get("parent_ids"):
+                            # Root run finished: this carries the executor's final output
+                            result = event["data"].get("output") or {}
+            
+            tools_used = self._summarize_tool_calls(result.get("intermediate_steps", []), turn)
+            logger.info(f"Tools used: {[t['tool'] for t in tools_used]}")
+            response_text = result.get("output", "I'm sorry, I couldn't generate a response.")
+            self._after_agent_turn(shortcut, session_id, response_text, tools_used)
+            self._model_metadata(shortcut["metadata"], result)
+            shortcut["metadata"]["history"] = history_report
+            self._turn_metadata(shortcut["metadata"], turn)
+            
+            yield {
+                "event": "done",
+                "data": {
+                    "success": True,
+                    "response": response_text,
+                    "session_id": session_id,
+                    "tools_used": tools_used,
+                    "message_count": len(await chat_history.aget_messages()),
+                    "metadata": shortcut["metadata"]
+                }
             }
+            
+        except AdmissionRejected as e:
+            logger.warning(f"Rejected streaming message for session {session_id}: {e}")
+            yield {"event": "error", "data": _error_result(e, session_id, self.admission)}
+        except Exception as e:
+            logger.error(f"Error streaming message: {e}", exc_info=True)
+            yield {"event": "error", "data": _error_result(e, session_id, self.admission)}
     
-    def clear_history(self, session_id: str) -> bool:
+    async def clear_history(self, session_id: str) -> bool:
         """Clear chat history for a session"""
-        if session_id in self.chat_histories:
-            self.chat_histories[session_id].clear()
-            return True
-        return False
+        return await self.session_store.aclear(session_id)
     
-    def get_session_info(self, session_id: str) -> Dict[str, Any]:
+    async def get_session_info(self, session_id: str) -> Dict[str, Any]:
         """Get information about a chat session"""
-        if session_id not in self.chat_histories:
+        history = await self.session_store.aget_history(session_id, create=False)
+        if history is None:
             return {
                 "exists": False,
                 "message_count": 0
             }
         
-        history = self.chat_histories[session_id]
         return {
             "exists": True,
-            "message_count": len(history.messages),
+            "message_count": len(await history.aget_messages()),
             "session_id": session_id
         }
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get runtime metrics for the agent's stores"""
+        metrics = {
+            "admission": self.admission.stats(),
+            "sessions": self.session_store.stats(),
+            "history": self.history_policy.stats()
+        }
+        if self.response_cache is not None:
+            metrics["response_cache"] = self.response_cache.stats()
+        if self.fast_path is not None:
+            metrics["fast_path"] = self.fast_path.stats()
+        if self.tool_selector is not None:
+            metrics["tool_selection"] = self.tool_selector.stats()
+        if self.model_cascade is not None:
+            metrics["model_cascade"] = self.model_cascade.stats()
+        if self.prefetcher is not None:
+            metrics["prefetch"] = self.prefetcher.stats()
+        return metrics
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    """Whether an error is the LLM provider throttling us (HTTP 429 / RESOURCE_EXHAUSTED)"""
+    if isinstance(error, AdmissionRejected):
+        return True
+    text = str(error)
+    return (
+        type(error).__name__ == "ResourceExhausted"
+        or getattr(error, "code", None) == 429
+        or text.startswith("429 ")
+        or "RESOURCE_EXHAUSTED" in text
+    )
+
+
+def _error_result(error: Exception, session_id: str, admission: AdmissionController) -> Dict[str, Any]:
+    """Build the failed-turn result; overload errors carry a retry_after hint"""
+    result = {
+        "success": False,
+        "response": "I apologize, but I encountered an error processing your request. Please try again.",
+        "error": str(error),
+        "session_id": session_id
+    }
+    if _is_rate_limited(error):
+        result["response"] = "I'm handling a lot of requests right now. Please try again in a moment."
+        result["retry_after"] = getattr(error, "retry_after", None) or admission.retry_after()
+    return result
+
+
+def _chunk_text(chunk: Any) -> str:
+    """Get the text of a streamed message chunk (content may be a list of parts)"""
+    if chunk is None:
+        return ""
+    content = chunk.content
+    if isinstance(content, str):
+        return content
+    return "".join(
+        part.get("text", "") if isinstance(part, dict) else str(part)
+        for part in content
+    )
 
 
 # Create a global agent instance
@@ -0,0 +1,172 @@
+"""
+In-Process Caches
+Size-bounded LRU cache with TTL expiry, shared by the session store and other caches
+"""
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional, Tuple
+from collections import OrderedDict
+import threading
+import time
+
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache with a maximum size and per-entry TTL.
+
+    With ``sliding=True`` the TTL is an idle timeout: every successful read
+    pushes the expiry forward. Otherwise entries expire a fixed time after
+    they were written.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: Optional[float] = None,
+        sliding: bool = False,
+        on_evict: Optional[Callable[[Hashable, Any, str], None]] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            max_size: Maximum number of entries kept (0 or less means unbounded)
+            ttl_seconds: Entry lifetime in seconds (None disables expiry)
+            sliding: Refresh the expiry on every read
+            on_evict: Optional callback(key, value, reason) where reason is
+                'evicted' (LRU) or 'expired' (TTL)
+            clock: Monotonic time source, overridable for tests
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.sliding = sliding
+        self.on_evict = on_evict
+        self._clock = clock
+        self._data: "OrderedDict[Hashable, Tuple[Any, Optional[float]]]" = OrderedDict()
+        self._lock = threading.RLock()
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _expiry(self) -> Optional[float]:
+        if self.ttl_seconds is None:
+            return None
+        return self._clock() + self.ttl_seconds
+
+    def _is_expired(self, expires_at: Optional[float], now: float) -> bool:
+        return expires_at is not None and expires_at <= now
+
+    def _drop(self, key: Hashable, reason: str) -> None:
+        value, _ = self._data.pop(key)
+        if reason == "expired":
+            self.expirations += 1
+        else:
+            self.evictions += 1
+        if self.on_evict:
+            self.on_evict(key, value, reason)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value (marking it most recently used) or default"""
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+
+            value, expires_at = entry
+            if self._is_expired(expires_at, self._clock()):
+                self._drop(key, "expired")
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            if self.sliding:
+                self._data[key] = (value, self._expiry())
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Insert or replace a value, evicting least recently used entries if full"""
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+            self._data[key] = (value, self._expiry())
+
+            if self.max_size > 0:
+                while len(self._data) > self.max_size:
+                    oldest = next(iter(self._data))
+                    self._drop(oldest, "evicted")
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove an entry without counting it as an eviction"""
+        with self._lock:
+            entry = self._data.pop(key, _MISSING)
+            if entry is _MISSING:
+                return default
+            return entry[0]
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._data.clear()
+
+    def purge_expired(self) -> int:
+        """Drop every expired entry and return how many were removed"""
+        with self._lock:
+            now = self._clock()
+            if self.sliding:
+                # Recency order equals expiry order, so stop at the first live entry
+                expired = []
+                for key, (_, expires_at) in self._data.items():
+                    if not self._is_expired(expires_at, now):
+                        break
+                    expired.append(key)
+            else:
+                expired = [
+                    key for key, (_, expires_at) in self._data.items()
+                    if self._is_expired(expires_at, now)
+                ]
+            for key in expired:
+                self._drop(key, "expired")
+            return len(expired)
+
+    def keys(self) -> Iterator[Hashable]:
+        """Snapshot of current keys, least recently used first"""
+        with self._lock:
+            return iter(list(self._data.keys()))
+
+    def items(self) -> Iterator[Tuple[Hashable, Any]]:
+        """Snapshot of live (key, value) pairs, without touching recency or counters"""
+        with self._lock:
+            now = self._clock()
+            return iter([
+                (key, value) for key, (value, expires_at) in self._data.items()
+                if not self._is_expired(expires_at, now)
+            ])
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            return entry is not _MISSING and not self._is_expired(entry[1], self._clock())
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache size and hit/miss/eviction counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations
+            }
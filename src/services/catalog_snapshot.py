@@ -0,0 +1,398 @@
+"""
+Catalog Snapshot
+In-memory, column-oriented copy of the hotels, packages and places tables,
+with a local query engine that answers the Supabase clients' searches
+"""
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+from src.utils.helpers import parse_timestamp
+import asyncio
+import re
+import threading
+import time
+import numpy as np
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+Rows = List[Dict[str, Any]]
+
+# How each filtered or sorted column is indexed (others are only stored)
+TEXT_COLUMNS = {"city", "country", "destination", "category", "state_province"}
+NUMBER_COLUMNS = {"price", "available_slots", "duration_days", "rating", "popular_ranking", "visit_count"}
+FLAG_COLUMNS = {"is_active", "is_featured"}
+
+
+def _like_regex(value: str) -> "re.Pattern[str]":
+    """Regex for ilike '%value%' where value itself contains % or _ wildcards"""
+    parts = (".*" if ch == "%" else "." if ch == "_" else re.escape(ch) for ch in value)
+    return re.compile(f".*{''.join(parts)}.*", re.IGNORECASE | re.DOTALL)
+
+
+def _lower(value: Any) -> Optional[str]:
+    return value.lower() if isinstance(value, str) else None
+
+
+def _number(value: Any) -> float:
+    return np.nan if value is None else float(value)
+
+
+def _flag(value: Any) -> int:
+    # 1 true, 0 false, -1 null
+    return -1 if value is None else int(bool(value))
+
+
+class ColumnTable:
+    """
+    One table's rows stored column by column: a list of values per column,
+    plus lowercased text for the ilike filters and float/flag arrays for the
+    numeric filters and sort keys, so a search is a few vectorized masks.
+    """
+
+    def __init__(self, rows: Rows, columns: List[str]):
+        self.size = len(rows)
+        self.positions: Dict[Any, int] = {row.get("id"): i for i, row in enumerate(rows)}
+        self.values: Dict[str, List[Any]] = {c: [row.get(c) for row in rows] for c in columns}
+        self.text: Dict[str, List[Optional[str]]] = {
+            c: [_lower(v) for v in self.values[c]]
+            for c in columns if c in TEXT_COLUMNS
+        }
+        self.numbers: Dict[str, np.ndarray] = {
+            c: np.array([_number(v) for v in self.values[c]], dtype=np.float64)
+            for c in columns if c in NUMBER_COLUMNS
+        }
+        self.flags: Dict[str, np.ndarray] = {
+            c: np.array([_flag(v) for v in self.values[c]], dtype=np.int8)
+            for c in columns if c in FLAG_COLUMNS
+        }
+
+    def upsert(self, rows: Rows) -> int:
+        """
+        Apply changed rows: update existing ones in place by id and append new
+        ones (cost grows with the number of changes, not the table size)
+
+        Returns:
+            How many rows were new
+        """
+        added = []
+        for row in {row.get("id"): row for row in rows}.values():
+            i = self.positions.get(row.get("id"))
+            if i is None:
+                added.append(row)
+                continue
+            for c, values in self.values.items():
+                values[i] = row.get(c)
+            for c, text in self.text.items():
+                text[i] = _lower(row.get(c))
+            for c, numbers in self.numbers.items():
+                numbers[i] = _number(row.get(c))
+            for c, flags in self.flags.items():
+                flags[i] = _flag(row.get(c))
+
+        if added:
+            for row in added:
+                self.positions[row.get("id")] = self.size
+                self.size += 1
+            for c, values in self.values.items():
+                values.extend(row.get(c) for row in added)
+            for c, text in self.text.items():
+                text.extend(_lower(row.get(c)) for row in added)
+            for c, numbers in self.numbers.items():
+                self.numbers[c] = np.concatenate([numbers, [_number(row.get(c)) for row in added]])
+            for c, flags in self.flags.items():
+                self.flags[c] = np.concatenate([flags, np.array([_flag(row.get(c)) for row in added], dtype=np.int8)])
+        return len(added)
+
+    def everything(self) -> np.ndarray:
+        return np.ones(self.size, dtype=bool)
+
+    def ilike(self, column: str, value: str) -> np.ndarray:
+        """Rows where column ilike '%value%' (null never matches)"""
+        if "%" in value or "_" in value:
+            regex = _like_regex(value)
+            return np.fromiter(
+                (v is not None and regex.fullmatch(v) is not None for v in self.text[column]),
+                dtype=bool, count=self.size
+            )
+        needle = value.lower()
+        return np.fromiter(
+            (v is not None and needle in v for v in self.text[column]),
+            dtype=bool, count=self.size
+        )
+
+    def is_true(self, column: str) -> np.ndarray:
+        return self.flags[column] == 1
+
+    def equals_flag(self, column: str, value: bool) -> np.ndarray:
+        return self.flags[column] == int(value)
+
+    def order(self, indices: np.ndarray, column: str, desc: bool) -> np.ndarray:
+        """Sort row indices like Postgres: nulls last ascending, first descending"""
+        values = self.numbers[column][indices]
+        nulls = np.isnan(values)
+        present = indices[~nulls]
+        keys = values[~nulls]
+        present = present[np.argsort(-keys if desc else keys, kind="stable")]
+        return np.concatenate([indices[nulls], present]) if desc else np.concatenate([present, indices[nulls]])
+
+    def rows(self, indices: np.ndarray, columns: List[str]) -> Rows:
+        return [{c: self.values[c][i] for c in columns} for i in indices.tolist()]
+
+
+# ==================== QUERY PLANS ====================
+# Each mirrors the matching _QueryBuilder query in src/services/database.py:
+# same filters (including which falsy values are ignored) and same ordering.
+
+def _hotel_mask(table: ColumnTable, f: Dict[str, Any]) -> np.ndarray:
+    mask = table.everything()
+    if f.get("city"):
+        mask &= table.ilike("city", f["city"])
+    if f.get("country"):
+        mask &= table.ilike("country", f["country"])
+    return mask
+
+
+def _search_hotels(table: ColumnTable, f: Dict[str, Any]) -> np.ndarray:
+    return np.flatnonzero(_hotel_mask(table, f))
+
+
+def _hotels_sorted_by_price(table: ColumnTable, f: Dict[str, Any]) -> np.ndarray:
+    # Ordered by rating, as the remote query does
+    return table.order(np.flatnonzero(_hotel_mask(table, f)), "rating", desc=not f["ascending"])
+
+
+def _bookable_packages(table: ColumnTable) -> np.ndarray:
+    return table.is_true("is_active") & (table.numbers["available_slots"] > 0)
+
+
+def _search_packages(table: ColumnTable, f: Dict[str, Any]) -> np.ndarray:
+    mask = _bookable_packages(table)
+    for column in ("destination", "country", "category"):
+        if f.get(column):
+            mask &= table.ilike(column, f[column])
+    # NaN comparisons are False, so null prices drop out like in SQL
+    if f.get("max_price"):
+        mask &= table.numbers["price"] <= f["max_price"]
+    if f.get("min_price"):
+        mask &= table.numbers["price"] >= f["min_price"]
+    if f.get("duration_days"):
+        mask &= table.numbers["duration_days"] == f["duration_days"]
+    return np.flatnonzero(mask)
+
+
+def _packages_by_price(table: ColumnTable, f: Dict[str, Any]) -> np.ndarray:
+    mask = _bookable_packages(table)
+    if f.get("destination"):
+        mask &= table.ilike("destination", f["destination"])
+    return table.order(np.flatnonzero(mask), "price", desc=not f.get("ascending", True))
+
+
+def _search_places(table: ColumnTable, f: Dict[str, Any]) -> np.ndarray:
+    mask = table.is_true("is_active")
+    for column in ("country", "city", "category"):
+        if f.get(column):
+            mask &= table.ilike(column, f[column])
+    if f.get("near_city"):
+        mask &= table.ilike("city", f["near_city"]) | table.ilike("state_province", f["near_city"])
+    if f.get("is_featured") is not None:
+        mask &= table.equals_flag("is_featured", f["is_featured"])
+    return table.order(np.flatnonzero(mask), "popular_ranking", desc=True)
+
+
+def _popular_places(table: ColumnTable, f: Dict[str, Any]) -> np.ndarray:
+    # The sorts are stable, so sorting by visit_count first breaks popular_ranking ties by it
+    by_visits = table.order(np.flatnonzero(table.is_true("is_active")), "visit_count", desc=True)
+    return table.order(by_visits, "popular_ranking", desc=True)
+
+
+PLANS: Dict[str, tuple] = {
+    "search_hotels": ("hotels", _search_hotels),
+    "get_hotels_sorted_by_price": ("hotels", _hotels_sorted_by_price),
+    "search_packages": ("packages", _search_packages),
+    "get_cheapest_packages": ("packages", _packages_by_price),
+    "get_packages_sorted_by_price": ("packages", _packages_by_price),
+    "search_places": ("places", _search_places),
+    "get_popular_places": ("places", _popular_places),
+}
+
+
+class CatalogSnapshot:
+    """
+    Copy of the catalog tables held in memory and refreshed in the
+    background, so searches are in-process scans instead of remote
+    ilike queries.
+
+    search() answers a client method from the snapshot, or returns None when
+    it can't (table not loaded yet, marked stale by a booking, or a column
+    outside the snapshot requested), and the caller falls back to the database.
+
+    Between full reloads, CatalogSync can apply changed rows with apply().
+    Deactivated rows (is_active = false) stay in the arrays as tombstones
+    that the searches filter out.
+    """
+
+    def __init__(self, table_columns: Dict[str, str], refresh_seconds: float = 300, page_size: int = 1000):
+        """
+        Args:
+            table_columns: Columns kept per table (comma-separated, like a select())
+            refresh_seconds: Interval between background reloads
+            page_size: Rows fetched per request while loading
+        """
+        self.table_columns = {
+            table: [c.strip() for c in columns.split(",") if c.strip()]
+            for table, columns in table_columns.items()
+        }
+        self.refresh_seconds = refresh_seconds
+        self.page_size = page_size
+        self._tables: Dict[str, ColumnTable] = {}
+        self._stale: set = set()
+        self._lock = threading.RLock()
+        self._wake: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.loaded_at: Optional[float] = None
+
+        # Metrics
+        self.answered = 0
+        self.declined = 0
+        self.refreshes = 0
+        self.refresh_failures = 0
+        self.last_refresh_ms = 0.0
+
+    @property
+    def ready(self) -> bool:
+        return bool(self._tables)
+
+    def search(self, method: str, filters: Dict[str, Any]) -> Optional[Rows]:
+        """
+        Run a client search method locally
+
+        Args:
+            method: Client method name (e.g. "search_packages")
+            filters: The method's arguments, including limit and columns
+
+        Returns:
+            The rows the database would return, or None if the snapshot can't answer
+        """
+        plan = PLANS.get(method)
+        columns = [c.strip() for c in filters.get("columns", "*").split(",")]
+        # Held for the whole scan so apply() never changes a table mid-search
+        with self._lock:
+            table = self._tables.get(plan[0]) if plan else None
+            # Full-text searches are matched and ranked by Postgres
+            usable = table is not None and plan[0] not in self._stale and not filters.get("text")
+            if not usable or not set(columns) <= table.values.keys():
+                self.declined += 1
+                return None
+
+            indices = plan[1](table, filters)
+            if filters.get("limit") is not None:
+                indices = indices[:filters["limit"]]
+            self.answered += 1
+            return table.rows(indices, columns)
+
+    def apply(self, table: str, rows: Rows) -> bool:
+        """
+        Apply changed rows of a table fetched since the last sync, and answer
+        from it again if a booking had marked it stale
+
+        Returns:
+            False if the table isn't loaded (nothing to apply to)
+        """
+        with self._lock:
+            loaded = self._tables.get(table)
+            if loaded is None:
+                return False
+            loaded.upsert(rows)
+            self._stale.discard(table)
+            return True
+
+    def watermark(self, table: str) -> Optional[datetime]:
+        """Latest updated_at in a loaded table (None if unknown)"""
+        with self._lock:
+            loaded = self._tables.get(table)
+            if loaded is None or "updated_at" not in loaded.values:
+                return None
+            stamps = (parse_timestamp(v) for v in loaded.values["updated_at"])
+            return max((stamp for stamp in stamps if stamp), default=None)
+
+    def mark_stale(self, table: str) -> None:
+        """Stop answering from a table until it is reloaded (call after writing to it)"""
+        with self._lock:
+            if table not in self._tables:
+                return
+            self._stale.add(table)
+        if self._wake is not None and self._loop is not None:
+            # May be called from the sync client's threads
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    def listen(self) -> asyncio.Event:
+        """
+        Event set whenever a table goes stale, for the background task that
+        keeps the snapshot current (call from that task)
+        """
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        if self._stale:
+            self._wake.set()
+        return self._wake
+
+    async def refresh(self, client) -> bool:
+        """
+        Reload every table from the database and swap the snapshot in
+
+        Args:
+            client: AsyncSupabaseClient to load from
+
+        Returns:
+            True on success (on failure the previous snapshot is kept)
+        """
+        start = time.perf_counter()
+        try:
+            tables = {}
+            for table, columns in self.table_columns.items():
+                rows = await client.fetch_table(table, ",".join(columns), self.page_size)
+                tables[table] = ColumnTable(rows, columns)
+        except Exception as e:
+            self.refresh_failures += 1
+            logger.warning(f"Catalog snapshot refresh failed: {e}")
+            return False
+
+        with self._lock:
+            self._tables = tables
+            self._stale.clear()
+            self.loaded_at = time.time()
+            self.refreshes += 1
+            self.last_refresh_ms = round((time.perf_counter() - start) * 1000, 1)
+        logger.info(
+            f"Catalog snapshot loaded ({', '.join(f'{t}: {tables[t].size}' for t in tables)}) "
+            f"in {self.last_refresh_ms} ms"
+        )
+        return True
+
+    async def run(self, client) -> None:
+        """Background task: reload every refresh_seconds, or soon after a table goes stale"""
+        wake = self.listen()
+        while True:
+            try:
+                await asyncio.wait_for(wake.wait(), timeout=self.refresh_seconds)
+            except asyncio.TimeoutError:
+                pass
+            wake.clear()
+            await self.refresh(client)
+
+    def stats(self) -> Dict[str, Any]:
+        """Table sizes, snapshot age and how many searches it answered"""
+        with self._lock:
+            lookups = self.answered + self.declined
+            return {
+                "tables": {table: t.size for table, t in self._tables.items()},
+                "stale": sorted(self._stale),
+                "age_seconds": round(time.time() - self.loaded_at, 1) if self.loaded_at else None,
+                "answered": self.answered,
+                "declined": self.declined,
+                "answer_rate": round(self.answered / lookups, 4) if lookups else 0.0,
+                "refreshes": self.refreshes,
+                "refresh_failures": self.refresh_failures,
+                "last_refresh_ms": self.last_refresh_ms
+            }
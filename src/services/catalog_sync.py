@@ -0,0 +1,201 @@
+"""
+Catalog Delta Sync
+Polls the catalog tables for rows changed since the last sync (by updated_at)
+and applies them to the in-process caches and the catalog snapshot
+"""
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+from datetime import datetime, timedelta
+from src.services.catalog_snapshot import CatalogSnapshot
+from src.services.entity_cache import EntityCache
+from src.services.search_cache import SearchCache
+from src.utils.helpers import parse_timestamp
+import asyncio
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class CatalogSync:
+    """
+    Keeps in-process catalog data current from the updated_at trigger columns.
+
+    Every interval_seconds each table is queried for rows with updated_at at
+    or after its watermark (rewound by overlap_seconds, so rows committed
+    late with an earlier timestamp are still picked up; rows already applied
+    are skipped). Timestamps are compared as datetimes, since Postgres
+    prints a varying number of fractional digits. Changed rows are applied to the snapshot in place and
+    invalidate their entity cache entries and the table's search results,
+    so a sync costs in proportion to what changed, not to the catalog size.
+    on_change is then called with the table name, for caches outside this
+    module (the agent's response cache).
+
+    Every synced table needs the update_updated_at_column trigger (hotels
+    and rooms get theirs in 010_catalog_updated_at_triggers.sql); without
+    it edits keep the old updated_at and are never seen.
+
+    Deletes are seen through is_active = false tombstones. Hotels have no
+    is_active column, so a hard-deleted row only disappears on the periodic
+    full snapshot reload.
+    """
+
+    def __init__(
+        self,
+        table_columns: Dict[str, str],
+        interval_seconds: float = 15,
+        overlap_seconds: float = 5,
+        page_size: int = 1000,
+        snapshot: Optional[CatalogSnapshot] = None,
+        entity_cache: Optional[EntityCache] = None,
+        search_cache: Optional[SearchCache] = None,
+        on_change: Optional[Callable[[str], None]] = None
+    ):
+        """
+        Args:
+            table_columns: Columns fetched per changed row, per table (must include id and updated_at)
+            interval_seconds: Time between polls
+            overlap_seconds: How far each poll reaches back before the watermark
+            page_size: Rows fetched per request
+            snapshot: Catalog snapshot to apply changes to (it is also fully reloaded
+                every snapshot.refresh_seconds)
+            entity_cache: Entity cache to invalidate changed rows in
+            search_cache: Search cache to invalidate changed tables in
+            on_change: Called with the table name after changed rows were applied
+        """
+        self.table_columns = table_columns
+        self.interval_seconds = interval_seconds
+        self.overlap_seconds = overlap_seconds
+        self.page_size = page_size
+        self.snapshot = snapshot
+        self.entity_cache = entity_cache
+        self.search_cache = search_cache
+        self.on_change = on_change
+        self.watermarks: Dict[str, Optional[datetime]] = {table: None for table in table_columns}
+        # (id, updated_at) applied in the overlap window, so re-reads are skipped
+        self._seen: Dict[str, Set[Tuple[Any, Optional[datetime]]]] = {table: set() for table in table_columns}
+
+        # Metrics
+        self.polls = 0
+        self.failures = 0
+        self.full_reloads = 0
+        self.rows_applied: Dict[str, int] = {table: 0 for table in table_columns}
+        self.last_rows: Dict[str, int] = {table: 0 for table in table_columns}
+        self.synced_at: Dict[str, Optional[float]] = {table: None for table in table_columns}
+        self.last_sync_ms = 0.0
+
+    async def start(self, client) -> None:
+        """Set the watermarks from the loaded snapshot, or the newest row of each table"""
+        for table in self.table_columns:
+            watermark = self.snapshot.watermark(table) if self.snapshot is not None else None
+            if watermark is None:
+                try:
+                    watermark = parse_timestamp(await client.latest_update(table))
+                except Exception as e:
+                    logger.warning(f"Could not read the {table} watermark: {e}")
+            self.watermarks[table] = watermark
+            self._seen[table].clear()
+            self.synced_at[table] = time.time()
+
+    async def sync_table(self, client, table: str) -> int:
+        """
+        Fetch and apply one table's changes since its watermark
+
+        Returns:
+            Number of changed rows applied
+        """
+        overlap = timedelta(seconds=self.overlap_seconds)
+        watermark = self.watermarks[table]
+        since = (watermark - overlap).isoformat() if watermark else None
+        rows = await client.fetch_changes(table, self.table_columns[table], since, self.page_size)
+
+        stamped = [(row, parse_timestamp(row.get("updated_at"))) for row in rows]
+        seen = self._seen[table]
+        changed = [row for row, stamp in stamped if (row.get("id"), stamp) not in seen]
+        if changed:
+            if self.snapshot is not None:
+                self.snapshot.apply(table, changed)
+            if self.entity_cache is not None:
+                for row in changed:
+                    self.entity_cache.invalidate(table, row.get("id"))
+            if self.search_cache is not None:
+                self.search_cache.invalidate(table)
+            if self.on_change is not None:
+                self.on_change(table)
+        elif self.snapshot is not None:
+            # Nothing changed since the table was marked stale, so it is current
+            self.snapshot.apply(table, [])
+
+        newest = max((stamp for _, stamp in stamped if stamp), default=None)
+        if newest and (watermark is None or newest > watermark):
+            self.watermarks[table] = watermark = newest
+        # Only rows still inside the overlap window can be read again
+        floor = watermark - overlap if watermark else None
+        self._seen[table] = {
+            (row.get("id"), stamp) for row, stamp in stamped
+            if floor is None or (stamp is not None and stamp >= floor)
+        }
+
+        self.rows_applied[table] += len(changed)
+        self.last_rows[table] = len(changed)
+        self.synced_at[table] = time.time()
+        return len(changed)
+
+    async def sync_once(self, client) -> int:
+        """Sync every table; returns the number of changed rows applied"""
+        start = time.perf_counter()
+        self.polls += 1
+        applied = 0
+        for table in self.table_columns:
+            try:
+                applied += await self.sync_table(client, table)
+            except Exception as e:
+                self.failures += 1
+                logger.warning(f"Catalog sync of {table} failed: {e}")
+        self.last_sync_ms = round((time.perf_counter() - start) * 1000, 1)
+        if applied:
+            logger.info(f"Catalog sync applied {applied} changed rows in {self.last_sync_ms} ms")
+        return applied
+
+    async def run(self, client) -> None:
+        """
+        Background task: sync every interval_seconds (sooner when a booking
+        marks a snapshot table stale) and fully reload the snapshot every
+        snapshot.refresh_seconds as a backstop for hard deletes
+        """
+        wake = self.snapshot.listen() if self.snapshot is not None else asyncio.Event()
+        last_reload = time.monotonic()
+        while True:
+            try:
+                await asyncio.wait_for(wake.wait(), timeout=self.interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+            wake.clear()
+
+            if self.snapshot is not None and time.monotonic() - last_reload >= self.snapshot.refresh_seconds:
+                last_reload = time.monotonic()
+                if await self.snapshot.refresh(client):
+                    self.full_reloads += 1
+                    await self.start(client)
+                    continue
+            await self.sync_once(client)
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-table watermark, lag and changed-row counts"""
+        now = time.time()
+        return {
+            "interval_seconds": self.interval_seconds,
+            "polls": self.polls,
+            "failures": self.failures,
+            "full_reloads": self.full_reloads,
+            "last_sync_ms": self.last_sync_ms,
+            "tables": {
+                table: {
+                    "watermark": self.watermarks[table].isoformat() if self.watermarks[table] else None,
+                    # How out of date this table can be: time since it was last synced
+                    "lag_seconds": round(now - self.synced_at[table], 1) if self.synced_at[table] else None,
+                    "last_rows": self.last_rows[table],
+                    "rows_applied": self.rows_applied[table]
+                }
+                for table in self.table_columns
+            }
+        }
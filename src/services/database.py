@@ -3,22 +3,437 @@ Supabase Database Client
 Handles all database operations for the GoTravel AI Backend
 """
 from typing import List, Dict, Any, Optional
+from abc import ABC, abstractmethod
 from supabase import create_client, Client
+from postgrest import AsyncPostgrestClient
+from postgrest.constants import DEFAULT_POSTGREST_CLIENT_HEADERS
+from src.services.catalog_snapshot import CatalogSnapshot
+from src.services.catalog_sync import CatalogSync
+from src.services.entity_cache import EntityCache
+from src.services.search_cache import SearchCache
+from src.utils.helpers import canonical_location
 from src.config import settings
+import httpx
+import uuid
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-class SupabaseClient:
+# ==================== COLUMN PROJECTIONS ====================
+# Named select() column lists. Summaries and cards carry only the columns the
+# tools and fast path format; *_DETAIL fetches the full row (images, itinerary
+# and other large columns included).
+
+HOTEL_SUMMARY = "id,name,city,country,address,rating,reviews_count,phone,contact_email,description"
+HOTEL_DETAIL = "*"
+
+ROOM_SUMMARY = "id,hotel_id,room_type,price_per_night,currency,capacity,bed_type,amenities,available_count"
+ROOM_DETAIL = "*"
+
+PACKAGE_SUMMARY = (
+    "id,name,destination,country,category,duration_days,price,currency,"
+    "max_participants,available_slots,rating,reviews_count,included_services,description"
+)
+PACKAGE_PRICING = "id,name,price,currency,available_slots"
+PACKAGE_DETAIL = "*"
+
+PLACE_CARD = (
+    "id,name,city,country,category,rating,popular_ranking,"
+    "famous_for,activities,best_time_to_visit,description"
+)
+PLACE_DETAIL = "*"
+
+FAVORITE_SUMMARY = "id,item_type,item_id,created_at"
+
+# Columns kept by the in-memory catalog snapshot: the summaries plus the
+# columns the searches filter on, and updated_at for the delta sync
+CATALOG_SNAPSHOT_COLUMNS = {
+    "hotels": HOTEL_SUMMARY + ",updated_at",
+    "packages": PACKAGE_SUMMARY + ",is_active,updated_at",
+    "places": PLACE_CARD + ",state_province,visit_count,is_active,is_featured,updated_at",
+}
+
+# Columns the delta sync fetches for each changed row
+CATALOG_SYNC_COLUMNS = {
+    **CATALOG_SNAPSHOT_COLUMNS,
+    "rooms": "id,hotel_id,updated_at",
+}
+
+# Location columns the gazetteer (src/utils/gazetteer.py) learns names from
+GAZETTEER_COLUMNS = {
+    "hotels": "city,country",
+    "packages": "destination,country",
+    "places": "city,state_province,country",
+}
+
+
+class _QueryBuilder(ABC):
+    """
+    Query construction shared by the sync and async clients.
+    
+    Each method returns an unexecuted PostgREST request builder; the clients
+    only differ in whether they call execute() directly or await it.
+    """
+    
+    entity_cache: Optional[EntityCache] = None
+    search_cache: Optional[SearchCache] = None
+    catalog_snapshot: Optional[CatalogSnapshot] = None
+    
+    @abstractmethod
+    def _table(self, name: str):
+        """Request builder for a table"""
+    
+    @abstractmethod
+    def _rpc(self, name: str, params: Dict[str, Any]):
+        """Request builder for a database function call"""
+    
+    def _catalog_query(self, table: str, text: Optional[str], columns: str, fuzzy_location: Optional[str] = None):
+        # A misspelled location goes through search_<table>_fuzzy()
+        # (supabase/migrations/009_trigram_location_search.sql), which returns
+        # rows whose location is trigram-similar to it, closest first
+        if fuzzy_location:
+            return self._rpc(f"search_{table}_fuzzy", {"search": fuzzy_location}).select(columns)
+        # Free text goes through the table's search_<table>_text() function
+        # (supabase/migrations/008_full_text_search.sql), which matches on the
+        # GIN-indexed tsvector; its rank column (011_ranked_text_search.sql)
+        # is ordered on here, since PostgREST may not keep the function's order
+        if text:
+            return (
+                self._rpc(f"search_{table}_text", {"search": text})
+                .select(columns)
+                .order("rank", desc=True)
+                .order("id")
+            )
+        return self._table(table).select(columns)
+    
+    def _fuzzy_fallback(self, rows: List[Dict[str, Any]], location: Optional[str], text: Optional[str]) -> bool:
+        # Only an empty location search is retried; keyword searches keep their own ranking
+        return not rows and bool(location) and not text and settings.fuzzy_location_fallback
+    
+    def _snapshot_search(self, method: str, filters: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        if self.catalog_snapshot is None:
+            return None
+        return self.catalog_snapshot.search(method, filters)
+    
+    def _invalidate_booked_item(self, booking: Optional[Dict[str, Any]], booking_type: str, item_id: str) -> None:
+        # A booking changes the item's availability, so its cached row and lists are stale
+        if not booking:
+            return
+        table = f"{booking_type}s"
+        if self.entity_cache is not None:
+            self.entity_cache.invalidate(table, item_id)
+        if self.search_cache is not None:
+            self.search_cache.invalidate(table)
+        if self.catalog_snapshot is not None:
+            self.catalog_snapshot.mark_stale(table)
+    
+    def _ping_query(self):
+        return self._table("hotels").select("id").limit(1)
+    
+    def _table_page_query(self, table: str, columns: str, start: int, end: int):
+        return self._table(table).select(columns).order("id").range(start, end)
+    
+    def _changes_query(self, table: str, columns: str, since: Optional[str], start: int, end: int):
+        query = self._table(table).select(columns)
+        if since:
+            query = query.gte("updated_at", since)
+        return query.order("updated_at").order("id").range(start, end)
+    
+    def _latest_update_query(self, table: str):
+        return self._table(table).select("updated_at").order("updated_at", desc=True).limit(1)
+    
+    # ==================== HOTELS ====================
+    
+    def _search_hotels_query(
+        self,
+        city: Optional[str],
+        country: Optional[str],
+        limit: int,
+        columns: str,
+        text: Optional[str] = None,
+        fuzzy: bool = False
+    ):
+        query = self._catalog_query("hotels", text, columns, city if fuzzy else None)
+        
+        if city and not fuzzy:
+            query = query.ilike("city", f"%{city}%")
+        if country:
+            query = query.ilike("country", f"%{country}%")
+        
+        return query.limit(limit)
+    
+    def _hotel_by_id_query(self, hotel_id: str, columns: str):
+        return self._table("hotels").select(columns).eq("id", hotel_id)
+    
+    def _hotel_rooms_query(self, hotel_id: str, columns: str):
+        return (
+            self._table("rooms")
+            .select(columns)
+            .eq("hotel_id", hotel_id)
+            .gt("available_count", 0)
+            .order("price_per_night")
+        )
+    
+    def _hotels_sorted_by_price_query(
+        self,
+        city: Optional[str],
+        country: Optional[str],
+        ascending: bool,
+        limit: int,
+        columns: str
+    ):
+        # This is a simplified version - you may need to join with rooms table for accurate pricing
+        query = self._table("hotels").select(columns)
+        
+        if city:
+            query = query.ilike("city", f"%{city}%")
+        if country:
+            query = query.ilike("country", f"%{country}%")
+        
+        # Order by rating as proxy for price tier (in production, join with rooms table)
+        return query.order("rating", desc=not ascending).limit(limit)
+    
+    # ==================== PACKAGES ====================
+    
+    def _search_packages_query(
+        self,
+        destination: Optional[str],
+        country: Optional[str],
+        category: Optional[str],
+        max_price: Optional[float],
+        min_price: Optional[float],
+        duration_days: Optional[int],
+        limit: int,
+        columns: str,
+        text: Optional[str] = None,
+        fuzzy: bool = False
+    ):
+        query = (
+            self._catalog_query("packages", text, columns, destination if fuzzy else None)
+            .eq("is_active", True)
+            .gt("available_slots", 0)
+        )
+        
+        if destination and not fuzzy:
+            query = query.ilike("destination", f"%{destination}%")
+        if country:
+            query = query.ilike("country", f"%{country}%")
+        if category:
+            query = query.ilike("category", f"%{category}%")
+        if max_price:
+            query = query.lte("price", max_price)
+        if min_price:
+            query = query.gte("price", min_price)
+        if duration_days:
+            query = query.eq("duration_days", duration_days)
+        
+        return query.limit(limit)
+    
+    def _package_by_id_query(self, package_id: str, columns: str):
+        return self._table("packages").select(columns).eq("id", package_id)
+    
+    def _packages_by_price_query(self, ascending: bool, limit: int, columns: str, destination: Optional[str] = None):
+        query = (
+            self._table("packages")
+            .select(columns)
+            .eq("is_active", True)
+            .gt("available_slots", 0)
+        )
+        
+        if destination:
+            query = query.ilike("destination", f"%{destination}%")
+        
+        return query.order("price", desc=not ascending).limit(limit)
+    
+    # ==================== PLACES ====================
+    
+    def _search_places_query(
+        self,
+        country: Optional[str],
+        city: Optional[str],
+        category: Optional[str],
+        near_city: Optional[str],
+        is_featured: Optional[bool],
+        limit: int,
+        columns: str,
+        text: Optional[str] = None,
+        fuzzy: bool = False
+    ):
+        query = self._catalog_query("places", text, columns, city if fuzzy else None).eq("is_active", True)
+        
+        if country:
+            query = query.ilike("country", f"%{country}%")
+        if city and not fuzzy:
+            query = query.ilike("city", f"%{city}%")
+        if category:
+            query = query.ilike("category", f"%{category}%")
+        if near_city:
+            # Search in city or state_province fields
+            query = query.or_(
+                f"city.ilike.%{near_city}%,state_province.ilike.%{near_city}%"
+            )
+        if is_featured is not None:
+            query = query.eq("is_featured", is_featured)
+        if text or fuzzy:
+            # Keep the text match or similarity ranking
+            return query.limit(limit)
+        
+        return query.order("popular_ranking", desc=True).limit(limit)
+    
+    def _place_by_id_query(self, place_id: str, columns: str):
+        return self._table("places").select(columns).eq("id", place_id)
+    
+    def _popular_places_query(self, limit: int, columns: str):
+        return (
+            self._table("places")
+            .select(columns)
+            .eq("is_active", True)
+            .order("popular_ranking", desc=True)
+            .order("visit_count", desc=True)
+            .limit(limit)
+        )
+    
+    # ==================== USER FAVORITES ====================
+    
+    def _user_favorites_query(self, user_id: str, item_type: Optional[str], limit: int, columns: str):
+        query = (
+            self._table("user_favorites")
+            .select(columns)
+            .eq("user_id", user_id)
+        )
+        
+        if item_type:
+            query = query.eq("item_type", item_type)
+        
+        return query.order("created_at", desc=True).limit(limit)
+    
+    def _add_favorite_query(self, user_id: str, item_type: str, item_id: str):
+        favorite_data = {
+            "user_id": user_id,
+            "item_type": item_type,
+            "item_id": item_id
+        }
+        return self._table("user_favorites").insert(favorite_data)
+    
+    def _remove_favorite_query(self, user_id: str, item_type: str, item_id: str):
+        return (
+            self._table("user_favorites")
+            .delete()
+            .eq("user_id", user_id)
+            .eq("item_type", item_type)
+            .eq("item_id", item_id)
+        )
+    
+    # ==================== BOOKINGS ====================
+    
+    def _create_booking_query(
+        self,
+        user_id: str,
+        booking_type: str,
+        item_id: str,
+        primary_guest_name: str,
+        primary_guest_email: str,
+        primary_guest_phone: str,
+        total_amount: float,
+        **kwargs
+    ):
+        booking_data = {
+            "user_id": user_id,
+            "booking_type": booking_type,
+            "item_id": item_id,
+            "booking_reference": f"BK{uuid.uuid4().hex[:8].upper()}",
+            "primary_guest_name": primary_guest_name,
+            "primary_guest_email": primary_guest_email,
+            "primary_guest_phone": primary_guest_phone,
+            "total_amount": total_amount,
+            "base_price": kwargs.get("base_price", total_amount),
+            "currency": kwargs.get("currency", "BDT"),
+            "total_participants": kwargs.get("total_participants", 1),
+            "booking_status": "pending",
+            "payment_status": "pending",
+            **kwargs
+        }
+        return self._table("bookings").insert(booking_data)
+    
+    def _booking_by_reference_query(self, booking_reference: str, columns: str):
+        return (
+            self._table("bookings")
+            .select(columns)
+            .eq("booking_reference", booking_reference)
+        )
+    
+    def _user_bookings_query(self, user_id: str, limit: int, columns: str):
+        return (
+            self._table("bookings")
+            .select(columns)
+            .eq("user_id", user_id)
+            .order("created_at", desc=True)
+            .limit(limit)
+        )
+
+
+class SupabaseClient(_QueryBuilder):
     """Client for interacting with Supabase database"""
     
-    def __init__(self):
-        """Initialize Supabase client"""
+    def __init__(
+        self,
+        entity_cache: Optional[EntityCache] = None,
+        search_cache: Optional[SearchCache] = None,
+        catalog_snapshot: Optional[CatalogSnapshot] = None
+    ):
+        """
+        Initialize Supabase client
+        
+        Args:
+            entity_cache: Optional cache for get_*_by_id lookups
+            search_cache: Optional cache for search and list queries
+            catalog_snapshot: Optional in-memory catalog that answers searches locally
+        """
         self.client: Client = create_client(
             settings.supabase_url,
             settings.supabase_key
         )
+        self.entity_cache = entity_cache
+        self.search_cache = search_cache
+        self.catalog_snapshot = catalog_snapshot
+    
+    def _table(self, name: str):
+        return self.client.table(name)
+    
+    def _rpc(self, name: str, params: Dict[str, Any]):
+        return self.client.rpc(name, params)
+    
+    def _search(self, method: str, table: str, filters: Dict[str, Any], query) -> List[Dict[str, Any]]:
+        """Run a list query, answering from the catalog snapshot or the search cache when possible"""
+        rows = self._snapshot_search(method, filters)
+        if rows is not None:
+            return rows
+        if self.search_cache is None:
+            return query.execute().data
+        return self.search_cache.get_or_fetch_sync(method, table, filters, lambda: query.execute().data)
+    
+    def _get_entity(self, table: str, entity_id: str, columns: str, query) -> Optional[Dict[str, Any]]:
+        """Fetch one row by ID, answering from and filling the entity cache"""
+        cache = self.entity_cache
+        if cache is not None:
+            hit, row = cache.get(table, entity_id, columns)
+            if hit:
+                return row
+            generation = cache.generation
+        try:
+            response = query(entity_id, columns).execute()
+        except Exception as e:
+            logger.error(f"Error fetching {table[:-1]} {entity_id}: {e}")
+            return None
+        row = response.data[0] if response.data else None
+        if cache is not None:
+            cache.set(table, entity_id, columns, row, generation)
+        return row
+    
+    def ping(self) -> None:
+        """Run a trivial query, raising if the database can't be reached"""
+        self._ping_query().execute()
     
     # ==================== HOTELS ====================
     
@@ -26,56 +441,55 @@ class SupabaseClient:
         self,
         city: Optional[str] = None,
         country: Optional[str] = None,
-        limit: int = 10
+        text: Optional[str] = None,
+        limit: int = 10,
+        columns: str = HOTEL_DETAIL
     ) -> List[Dict[str, Any]]:
         """
         Search for hotels based on various filters
         
         Args:
-            city: Filter by city name
+            city: Filter by city name (if nothing matches, retried with the
+                closest spellings, e.g. "Coxs Bazar" -> "Cox's Bazar")
             country: Filter by country name
+            text: Free-text keywords matched against name, description and
+                address, best match first (e.g. "beachfront pool")
             limit: Maximum number of results
+            columns: Columns to fetch (e.g. HOTEL_SUMMARY)
             
         Returns:
             List of hotel records
         """
+        city = canonical_location(city, "hotels", "city")
+        country = canonical_location(country, "hotels", "country")
+        filters = {"city": city, "country": country, "text": text, "limit": limit, "columns": columns}
         try:
-            query = self.client.table("hotels").select("*")
-            
-            if city:
-                query = query.ilike("city", f"%{city}%")
-            if country:
-                query = query.ilike("country", f"%{country}%")
-            
-            query = query.limit(limit)
-            response = query.execute()
-            
-            return response.data
+            hotels = self._search(
+                "search_hotels", "hotels", filters,
+                self._search_hotels_query(city, country, limit, columns, text)
+            )
+            if self._fuzzy_fallback(hotels, city, text):
+                hotels = self._search(
+                    "search_hotels_fuzzy", "hotels", filters,
+                    self._search_hotels_query(city, country, limit, columns, fuzzy=True)
+                )
+            return hotels
         except Exception as e:
             logger.error(f"Error searching hotels: {e}")
             return []
     
-    def get_hotel_by_id(self, hotel_id: str) -> Optional[Dict[str, Any]]:
-        """Get a specific hotel by ID"""
-        try:
-            response = self.client.table("hotels").select("*").eq("id", hotel_id).execute()
-            return response.data[0] if response.data else None
-        except Exception as e:
-            logger.error(f"Error fetching hotel {hotel_id}: {e}")
-            return None
+    def get_hotel_by_id(self, hotel_id: str, columns: str = HOTEL_DETAIL) -> Optional[Dict[str, Any]]:
+        """Get a specific hotel by ID (read through the entity cache)"""
+        return self._get_entity("hotels", hotel_id, columns, self._hotel_by_id_query)
     
-    def get_hotel_rooms(self, hotel_id: str) -> List[Dict[str, Any]]:
+    def get_hotel_rooms(self, hotel_id: str, columns: str = ROOM_DETAIL) -> List[Dict[str, Any]]:
         """Get available rooms for a hotel"""
         try:
-            response = (
-                self.client.table("rooms")
-                .select("*")
-                .eq("hotel_id", hotel_id)
-                .gt("available_count", 0)
-                .order("price_per_night")
-                .execute()
+            return self._search(
+                "get_hotel_rooms", "rooms",
+                {"hotel_id": hotel_id, "columns": columns},
+                self._hotel_rooms_query(hotel_id, columns)
             )
-            return response.data
         except Exception as e:
             logger.error(f"Error fetching rooms for hotel {hotel_id}: {e}")
             return []
@@ -90,91 +504,91 @@ class SupabaseClient:
         max_price: Optional[float] = None,
         min_price: Optional[float] = None,
         duration_days: Optional[int] = None,
-        limit: int = 10
+        text: Optional[str] = None,
+        limit: int = 10,
+        columns: str = PACKAGE_DETAIL
     ) -> List[Dict[str, Any]]:
         """
         Search for travel packages based on various filters
         
         Args:
-            destination: Destination filter
+            destination: Destination filter (if nothing matches, retried with
+                the closest spellings)
             country: Country filter
             category: Category filter (e.g., adventure, luxury, beach)
             max_price: Maximum price filter
             min_price: Minimum price filter
             duration_days: Duration in days
+            text: Free-text keywords matched against name, description,
+                destination and category, best match first (e.g. "tea garden trek")
             limit: Maximum number of results
+            columns: Columns to fetch (e.g. PACKAGE_SUMMARY)
             
         Returns:
             List of package records
         """
+        destination = canonical_location(destination, "packages", "destination")
+        country = canonical_location(country, "packages", "country")
+        filters = {
+            "destination": destination, "country": country, "category": category,
+            "max_price": max_price, "min_price": min_price, "duration_days": duration_days,
+            "text": text, "limit": limit, "columns": columns
+        }
         try:
-            query = (
-                self.client.table("packages")
-                .select("*")
-                .eq("is_active", True)
-                .gt("available_slots", 0)
+            packages = self._search(
+                "search_packages", "packages", filters,
+                self._search_packages_query(
+                    destination, country, category, max_price, min_price, duration_days, limit, columns, text
+                )
             )
-            
-            if destination:
-                query = query.ilike("destination", f"%{destination}%")
-            if country:
-                query = query.ilike("country", f"%{country}%")
-            if category:
-                query = query.ilike("category", f"%{category}%")
-            if max_price:
-                query = query.lte("price", max_price)
-            if min_price:
-                query = query.gte("price", min_price)
-            if duration_days:
-                query = query.eq("duration_days", duration_days)
-            
-            query = query.limit(limit)
-            response = query.execute()
-            
-            return response.data
+            if self._fuzzy_fallback(packages, destination, text):
+                packages = self._search(
+                    "search_packages_fuzzy", "packages", filters,
+                    self._search_packages_query(
+                        destination, country, category, max_price, min_price, duration_days, limit, columns,
+                        fuzzy=True
+                    )
+                )
+            return packages
         except Exception as e:
             logger.error(f"Error searching packages: {e}")
             return []
     
-    def get_package_by_id(self, package_id: str) -> Optional[Dict[str, Any]]:
-        """Get a specific package by ID"""
-        try:
-            response = self.client.table("packages").select("*").eq("id", package_id).execute()
-            return response.data[0] if response.data else None
-        except Exception as e:
-            logger.error(f"Error fetching package {package_id}: {e}")
-            return None
+    def get_package_by_id(self, package_id: str, columns: str = PACKAGE_DETAIL) -> Optional[Dict[str, Any]]:
+        """Get a specific package by ID (read through the entity cache)"""
+        return self._get_entity("packages", package_id, columns, self._package_by_id_query)
     
-    def get_cheapest_packages(self, limit: int = 5) -> List[Dict[str, Any]]:
-        """Get the cheapest available packages"""
+    def get_cheapest_packages(
+        self,
+        destination: Optional[str] = None,
+        limit: int = 5,
+        columns: str = PACKAGE_DETAIL
+    ) -> List[Dict[str, Any]]:
+        """Get the cheapest available packages, optionally to one destination"""
+        destination = canonical_location(destination, "packages", "destination")
         try:
-            response = (
-                self.client.table("packages")
-                .select("*")
-                .eq("is_active", True)
-                .gt("available_slots", 0)
-                .order("price")
-                .limit(limit)
-                .execute()
+            return self._search(
+                "get_cheapest_packages", "packages",
+                {"destination": destination, "limit": limit, "columns": columns},
+                self._packages_by_price_query(True, limit, columns, destination)
             )
-            return response.data
         except Exception as e:
             logger.error(f"Error fetching cheapest packages: {e}")
             return []
     
-    def get_packages_sorted_by_price(self, ascending: bool = True, limit: int = 10) -> List[Dict[str, Any]]:
+    def get_packages_sorted_by_price(
+        self,
+        ascending: bool = True,
+        limit: int = 10,
+        columns: str = PACKAGE_DETAIL
+    ) -> List[Dict[str, Any]]:
         """Get packages sorted by price"""
         try:
-            response = (
-                self.client.table("packages")
-                .select("*")
-                .eq("is_active", True)
-                .gt("available_slots", 0)
-                .order("price", desc=not ascending)
-                .limit(limit)
-                .execute()
+            return self._search(
+                "get_packages_sorted_by_price", "packages",
+                {"ascending": ascending, "limit": limit, "columns": columns},
+                self._packages_by_price_query(ascending, limit, columns)
             )
-            return response.data
         except Exception as e:
             logger.error(f"Error fetching packages sorted by price: {e}")
             return []
@@ -188,114 +602,101 @@ class SupabaseClient:
         category: Optional[str] = None,
         near_city: Optional[str] = None,
         is_featured: Optional[bool] = None,
-        limit: int = 10
+        text: Optional[str] = None,
+        limit: int = 10,
+        columns: str = PLACE_DETAIL
     ) -> List[Dict[str, Any]]:
         """
         Search for tourist places based on various filters
         
         Args:
             country: Country filter
-            city: City filter
+            city: City filter (if nothing matches, retried with the closest spellings)
             category: Category filter (beach, mountain, historical, etc.)
             near_city: Find places near a specific city
             is_featured: Filter by featured places
+            text: Free-text keywords matched against name, description and
+                location, best match first instead of by popularity (e.g. "waterfall hiking")
             limit: Maximum number of results
+            columns: Columns to fetch (e.g. PLACE_CARD)
             
         Returns:
             List of place records
         """
+        country = canonical_location(country, "places", "country")
+        city = canonical_location(city, "places", "city")
+        near_city = canonical_location(near_city, "places", "city", "state_province")
+        filters = {
+            "country": country, "city": city, "category": category,
+            "near_city": near_city, "is_featured": is_featured,
+            "text": text, "limit": limit, "columns": columns
+        }
         try:
-            query = (
-                self.client.table("places")
-                .select("*")
-                .eq("is_active", True)
+            places = self._search(
+                "search_places", "places", filters,
+                self._search_places_query(country, city, category, near_city, is_featured, limit, columns, text)
             )
-            
-            if country:
-                query = query.ilike("country", f"%{country}%")
-            if city:
-                query = query.ilike("city", f"%{city}%")
-            if category:
-                query = query.ilike("category", f"%{category}%")
-            if near_city:
-                # Search in city or state_province fields
-                query = query.or_(
-                    f"city.ilike.%{near_city}%,state_province.ilike.%{near_city}%"
+            if self._fuzzy_fallback(places, city, text):
+                places = self._search(
+                    "search_places_fuzzy", "places", filters,
+                    self._search_places_query(
+                        country, city, category, near_city, is_featured, limit, columns, fuzzy=True
+                    )
                 )
-            if is_featured is not None:
-                query = query.eq("is_featured", is_featured)
-            
-            query = query.order("popular_ranking", desc=True).limit(limit)
-            response = query.execute()
-            
-            return response.data
+            return places
         except Exception as e:
             logger.error(f"Error searching places: {e}")
             return []
     
-    def get_place_by_id(self, place_id: str) -> Optional[Dict[str, Any]]:
-        """Get a specific place by ID"""
-        try:
-            response = self.client.table("places").select("*").eq("id", place_id).execute()
-            return response.data[0] if response.data else None
-        except Exception as e:
-            logger.error(f"Error fetching place {place_id}: {e}")
-            return None
+    def get_place_by_id(self, place_id: str, columns: str = PLACE_DETAIL) -> Optional[Dict[str, Any]]:
+        """Get a specific place by ID (read through the entity cache)"""
+        return self._get_entity("places", place_id, columns, self._place_by_id_query)
     
-    def get_popular_places(self, limit: int = 10) -> List[Dict[str, Any]]:
+    def get_popular_places(self, limit: int = 10, columns: str = PLACE_DETAIL) -> List[Dict[str, Any]]:
         """Get most popular places"""
         try:
-            response = (
-                self.client.table("places")
-                .select("*")
-                .eq("is_active", True)
-                .order("popular_ranking", desc=True)
-                .order("visit_count", desc=True)
-                .limit(limit)
-                .execute()
+            return self._search(
+                "get_popular_places", "places",
+                {"limit": limit, "columns": columns},
+                self._popular_places_query(limit, columns)
             )
-            return response.data
         except Exception as e:
             logger.error(f"Error fetching popular places: {e}")
             return []
     
-    def get_hotels_sorted_by_price(self, city: Optional[str] = None, country: Optional[str] = None, ascending: bool = True, limit: int = 10) -> List[Dict[str, Any]]:
+    def get_hotels_sorted_by_price(
+        self,
+        city: Optional[str] = None,
+        country: Optional[str] = None,
+        ascending: bool = True,
+        limit: int = 10,
+        columns: str = HOTEL_DETAIL
+    ) -> List[Dict[str, Any]]:
         """Get hotels sorted by average room price"""
+        city = canonical_location(city, "hotels", "city")
+        country = canonical_location(country, "hotels", "country")
         try:
-            # This is a simplified version - you may need to join with rooms table for accurate pricing
-            query = self.client.table("hotels").select("*")
-            
-            if city:
-                query = query.ilike("city", f"%{city}%")
-            if country:
-                query = query.ilike("country", f"%{country}%")
-            
-            # Order by rating as proxy for price tier (in production, join with rooms table)
-            query = query.order("rating", desc=not ascending).limit(limit)
-            response = query.execute()
-            
-            return response.data
+            return self._search(
+                "get_hotels_sorted_by_price", "hotels",
+                {"city": city, "country": country, "ascending": ascending, "limit": limit, "columns": columns},
+                self._hotels_sorted_by_price_query(city, country, ascending, limit, columns)
+            )
         except Exception as e:
             logger.error(f"Error fetching hotels sorted by price: {e}")
             return []
     
     # ==================== USER FAVORITES ====================
     
-    def get_user_favorites(self, user_id: str, item_type: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
+    def get_user_favorites(
+        self,
+        user_id: str,
+        item_type: Optional[str] = None,
+        limit: int = 20,
+        columns: str = "*"
+    ) -> List[Dict[str, Any]]:
         """Get user's favorite items"""
         try:
-            query = (
-                self.client.table("user_favorites")
-                .select("*")
-                .eq("user_id", user_id)
-            )
-            
-            if item_type:
-                query = query.eq("item_type", item_type)
-            
-            query = query.order("created_at", desc=True).limit(limit)
-            response = query.execute()
-            
+            response = self._user_favorites_query(user_id, item_type, limit, columns).execute()
             return response.data
         except Exception as e:
             logger.error(f"Error fetching user favorites: {e}")
@@ -304,13 +705,7 @@ class SupabaseClient:
     def add_user_favorite(self, user_id: str, item_type: str, item_id: str) -> Optional[Dict[str, Any]]:
         """Add item to user favorites"""
         try:
-            favorite_data = {
-                "user_id": user_id,
-                "item_type": item_type,
-                "item_id": item_id
-            }
-            
-            response = self.client.table("user_favorites").insert(favorite_data).execute()
+            response = self._add_favorite_query(user_id, item_type, item_id).execute()
             return response.data[0] if response.data else None
         except Exception as e:
             logger.error(f"Error adding favorite: {e}")
@@ -319,14 +714,7 @@ class SupabaseClient:
     def remove_user_favorite(self, user_id: str, item_type: str, item_id: str) -> bool:
         """Remove item from user favorites"""
         try:
-            response = (
-                self.client.table("user_favorites")
-                .delete()
-                .eq("user_id", user_id)
-                .eq("item_type", item_type)
-                .eq("item_id", item_id)
-                .execute()
-            )
+            self._remove_favorite_query(user_id, item_type, item_id).execute()
             return True
         except Exception as e:
             logger.error(f"Error removing favorite: {e}")
@@ -362,61 +750,585 @@ class SupabaseClient:
             Created booking record
         """
         try:
-            import uuid
+            response = self._create_booking_query(
+                user_id, booking_type, item_id,
+                primary_guest_name, primary_guest_email, primary_guest_phone,
+                total_amount, **kwargs
+            ).execute()
+            booking = response.data[0] if response.data else None
+            self._invalidate_booked_item(booking, booking_type, item_id)
+            return booking
+        except Exception as e:
+            logger.error(f"Error creating booking: {e}")
+            return None
+    
+    def get_booking_by_reference(self, booking_reference: str, columns: str = "*") -> Optional[Dict[str, Any]]:
+        """Get booking by reference number"""
+        try:
+            response = self._booking_by_reference_query(booking_reference, columns).execute()
+            return response.data[0] if response.data else None
+        except Exception as e:
+            logger.error(f"Error fetching booking {booking_reference}: {e}")
+            return None
+    
+    def get_user_bookings(self, user_id: str, limit: int = 10, columns: str = "*") -> List[Dict[str, Any]]:
+        """Get all bookings for a user"""
+        try:
+            response = self._user_bookings_query(user_id, limit, columns).execute()
+            return response.data
+        except Exception as e:
+            logger.error(f"Error fetching bookings for user {user_id}: {e}")
+            return []
+
+
+class _PooledPostgrestClient(AsyncPostgrestClient):
+    """AsyncPostgrestClient whose HTTP session uses the given connection pool settings"""
+    
+    def __init__(self, base_url: str, *, limits: httpx.Limits, http2: bool, **kwargs):
+        # create_session runs inside the base __init__, so set these first
+        self._limits = limits
+        self._http2 = http2
+        super().__init__(base_url, **kwargs)
+    
+    def create_session(self, base_url, headers, timeout, verify=True, proxy=None) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=base_url,
+            headers=headers,
+            timeout=timeout,
+            verify=verify,
+            proxy=proxy,
+            follow_redirects=True,
+            http2=self._http2,
+            limits=self._limits
+        )
+
+
+class AsyncSupabaseClient(_QueryBuilder):
+    """
+    Async client for the Supabase REST API.
+    
+    Exposes the same methods as SupabaseClient as coroutines so callers on the
+    event loop (async tools, routes) never block on database I/O.
+    
+    All queries of a worker share one HTTP session, so requests reuse
+    keep-alive (or multiplexed HTTP/2) connections instead of paying a new
+    TCP/TLS handshake; the pool is sized by the SUPABASE_POOL_* settings.
+    """
+    
+    def __init__(
+        self,
+        entity_cache: Optional[EntityCache] = None,
+        search_cache: Optional[SearchCache] = None,
+        catalog_snapshot: Optional[CatalogSnapshot] = None
+    ):
+        """
+        Initialize the async PostgREST client and its connection pool
+        
+        Args:
+            entity_cache: Optional cache for get_*_by_id lookups
+            search_cache: Optional cache for search and list queries
+            catalog_snapshot: Optional in-memory catalog that answers searches locally
+        """
+        self.entity_cache = entity_cache
+        self.search_cache = search_cache
+        self.catalog_snapshot = catalog_snapshot
+        self.limits = httpx.Limits(
+            max_connections=settings.supabase_pool_max_connections,
+            max_keepalive_connections=settings.supabase_pool_max_keepalive,
+            keepalive_expiry=settings.supabase_pool_keepalive_seconds
+        )
+        self.client = _PooledPostgrestClient(
+            f"{settings.supabase_url}/rest/v1",
+            headers={
+                **DEFAULT_POSTGREST_CLIENT_HEADERS,
+                "apiKey": settings.supabase_key,
+                "Authorization": f"Bearer {settings.supabase_key}"
+            },
+            timeout=settings.supabase_timeout_seconds,
+            limits=self.limits,
+            http2=settings.supabase_http2
+        )
+    
+    def _table(self, name: str):
+        return self.client.from_(name)
+    
+    def _rpc(self, name: str, params: Dict[str, Any]):
+        return self.client.rpc(name, params)
+    
+    async def _search(self, method: str, table: str, filters: Dict[str, Any], query) -> List[Dict[str, Any]]:
+        """Run a list query, answering from the catalog snapshot or the search cache when possible"""
+        rows = self._snapshot_search(method, filters)
+        if rows is not None:
+            return rows
+        if self.search_cache is None:
+            return (await query.execute()).data
+        
+        async def fetch() -> List[Dict[str, Any]]:
+            return (await query.execute()).data
+        
+        return await self.search_cache.get_or_fetch(method, table, filters, fetch)
+    
+    async def _get_entity(self, table: str, entity_id: str, columns: str, query) -> Optional[Dict[str, Any]]:
+        """Fetch one row by ID, answering from and filling the entity cache"""
+        cache = self.entity_cache
+        if cache is not None:
+            hit, row = cache.get(table, entity_id, columns)
+            if hit:
+                return row
+            generation = cache.generation
+        try:
+            response = await query(entity_id, columns).execute()
+        except Exception as e:
+            logger.error(f"Error fetching {table[:-1]} {entity_id}: {e}")
+            return None
+        row = response.data[0] if response.data else None
+        if cache is not None:
+            cache.set(table, entity_id, columns, row, generation)
+        return row
+    
+    async def ping(self) -> None:
+        """Run a trivial query, raising if the database can't be reached (also warms the pool)"""
+        await self._ping_query().execute()
+    
+    async def fetch_table(self, table: str, columns: str, page_size: int = 1000) -> List[Dict[str, Any]]:
+        """
+        Fetch every row of a table, page by page (raises on errors)
+        
+        Args:
+            table: Table name
+            columns: Columns to fetch
+            page_size: Rows per request (PostgREST caps a response at its max-rows)
+        """
+        rows: List[Dict[str, Any]] = []
+        while True:
+            response = await self._table_page_query(table, columns, len(rows), len(rows) + page_size - 1).execute()
+            rows.extend(response.data)
+            if len(response.data) < page_size:
+                return rows
+    
+    async def fetch_changes(
+        self,
+        table: str,
+        columns: str,
+        since: Optional[str],
+        page_size: int = 1000
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch the rows of a table updated at or after a timestamp, oldest first (raises on errors)
+        
+        Args:
+            table: Table name
+            columns: Columns to fetch
+            since: ISO timestamp (None fetches every row)
+            page_size: Rows per request
+        """
+        rows: List[Dict[str, Any]] = []
+        while True:
+            response = await self._changes_query(table, columns, since, len(rows), len(rows) + page_size - 1).execute()
+            rows.extend(response.data)
+            if len(response.data) < page_size:
+                return rows
+    
+    async def latest_update(self, table: str) -> Optional[str]:
+        """Newest updated_at in a table (None if it is empty; raises on errors)"""
+        response = await self._latest_update_query(table).execute()
+        return response.data[0]["updated_at"] if response.data else None
+    
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connections"""
+        await self.client.aclose()
+    
+    def pool_stats(self) -> Dict[str, Any]:
+        """Connection pool limits of the shared HTTP session"""
+        return {
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+            "keepalive_expiry_seconds": self.limits.keepalive_expiry,
+            "http2": settings.supabase_http2
+        }
+    
+    # ==================== HOTELS ====================
+    
+    async def search_hotels(
+        self,
+        city: Optional[str] = None,
+        country: Optional[str] = None,
+        text: Optional[str] = None,
+        limit: int = 10,
+        columns: str = HOTEL_DETAIL
+    ) -> List[Dict[str, Any]]:
+        """
+        Search for hotels based on various filters
+        
+        Args:
+            city: Filter by city name (if nothing matches, retried with the
+                closest spellings, e.g. "Coxs Bazar" -> "Cox's Bazar")
+            country: Filter by country name
+            text: Free-text keywords matched against name, description and
+                address, best match first (e.g. "beachfront pool")
+            limit: Maximum number of results
+            columns: Columns to fetch (e.g. HOTEL_SUMMARY)
+            
+        Returns:
+            List of hotel records
+        """
+        city = canonical_location(city, "hotels", "city")
+        country = canonical_location(country, "hotels", "country")
+        filters = {"city": city, "country": country, "text": text, "limit": limit, "columns": columns}
+        try:
+            hotels = await self._search(
+                "search_hotels", "hotels", filters,
+                self._search_hotels_query(city, country, limit, columns, text)
+            )
+            if self._fuzzy_fallback(hotels, city, text):
+                hotels = await self._search(
+                    "search_hotels_fuzzy", "hotels", filters,
+                    self._search_hotels_query(city, country, limit, columns, fuzzy=True)
+                )
+            return hotels
+        except Exception as e:
+            logger.error(f"Error searching hotels: {e}")
+            return []
+    
+    async def get_hotel_by_id(self, hotel_id: str, columns: str = HOTEL_DETAIL) -> Optional[Dict[str, Any]]:
+        """Get a specific hotel by ID (read through the entity cache)"""
+        return await self._get_entity("hotels", hotel_id, columns, self._hotel_by_id_query)
+    
+    async def get_hotel_rooms(self, hotel_id: str, columns: str = ROOM_DETAIL) -> List[Dict[str, Any]]:
+        """Get available rooms for a hotel"""
+        try:
+            return await self._search(
+                "get_hotel_rooms", "rooms",
+                {"hotel_id": hotel_id, "columns": columns},
+                self._hotel_rooms_query(hotel_id, columns)
+            )
+        except Exception as e:
+            logger.error(f"Error fetching rooms for hotel {hotel_id}: {e}")
+            return []
+    
+    # ==================== PACKAGES ====================
+    
+    async def search_packages(
+        self,
+        destination: Optional[str] = None,
+        country: Optional[str] = None,
+        category: Optional[str] = None,
+        max_price: Optional[float] = None,
+        min_price: Optional[float] = None,
+        duration_days: Optional[int] = None,
+        text: Optional[str] = None,
+        limit: int = 10,
+        columns: str = PACKAGE_DETAIL
+    ) -> List[Dict[str, Any]]:
+        """
+        Search for travel packages based on various filters
+        
+        Args:
+            destination: Destination filter (if nothing matches, retried with
+                the closest spellings)
+            country: Country filter
+            category: Category filter (e.g., adventure, luxury, beach)
+            max_price: Maximum price filter
+            min_price: Minimum price filter
+            duration_days: Duration in days
+            text: Free-text keywords matched against name, description,
+                destination and category, best match first (e.g. "tea garden trek")
+            limit: Maximum number of results
+            columns: Columns to fetch (e.g. PACKAGE_SUMMARY)
             
-            booking_data = {
-                "user_id": user_id,
-                "booking_type": booking_type,
-                "item_id": item_id,
-                "booking_reference": f"BK{uuid.uuid4().hex[:8].upper()}",
-                "primary_guest_name": primary_guest_name,
-                "primary_guest_email": primary_guest_email,
-                "primary_guest_phone": primary_guest_phone,
-                "total_amount": total_amount,
-                "base_price": kwargs.get("base_price", total_amount),
-                "currency": kwargs.get("currency", "BDT"),
-                "total_participants": kwargs.get("total_participants", 1),
-                "booking_status": "pending",
-                "payment_status": "pending",
-                **kwargs
-            }
+        Returns:
+            List of package records
+        """
+        destination = canonical_location(destination, "packages", "destination")
+        country = canonical_location(country, "packages", "country")
+        filters = {
+            "destination": destination, "country": country, "category": category,
+            "max_price": max_price, "min_price": min_price, "duration_days": duration_days,
+            "text": text, "limit": limit, "columns": columns
+        }
+        try:
+            packages = await self._search(
+                "search_packages", "packages", filters,
+                self._search_packages_query(
+                    destination, country, category, max_price, min_price, duration_days, limit, columns, text
+                )
+            )
+            if self._fuzzy_fallback(packages, destination, text):
+                packages = await self._search(
+                    "search_packages_fuzzy", "packages", filters,
+                    self._search_packages_query(
+                        destination, country, category, max_price, min_price, duration_days, limit, columns,
+                        fuzzy=True
+                    )
+                )
+            return packages
+        except Exception as e:
+            logger.error(f"Error searching packages: {e}")
+            return []
+    
+    async def get_package_by_id(self, package_id: str, columns: str = PACKAGE_DETAIL) -> Optional[Dict[str, Any]]:
+        """Get a specific package by ID (read through the entity cache)"""
+        return await self._get_entity("packages", package_id, columns, self._package_by_id_query)
+    
+    async def get_cheapest_packages(
+        self,
+        destination: Optional[str] = None,
+        limit: int = 5,
+        columns: str = PACKAGE_DETAIL
+    ) -> List[Dict[str, Any]]:
+        """Get the cheapest available packages, optionally to one destination"""
+        destination = canonical_location(destination, "packages", "destination")
+        try:
+            return await self._search(
+                "get_cheapest_packages", "packages",
+                {"destination": destination, "limit": limit, "columns": columns},
+                self._packages_by_price_query(True, limit, columns, destination)
+            )
+        except Exception as e:
+            logger.error(f"Error fetching cheapest packages: {e}")
+            return []
+    
+    async def get_packages_sorted_by_price(
+        self,
+        ascending: bool = True,
+        limit: int = 10,
+        columns: str = PACKAGE_DETAIL
+    ) -> List[Dict[str, Any]]:
+        """Get packages sorted by price"""
+        try:
+            return await self._search(
+                "get_packages_sorted_by_price", "packages",
+                {"ascending": ascending, "limit": limit, "columns": columns},
+                self._packages_by_price_query(ascending, limit, columns)
+            )
+        except Exception as e:
+            logger.error(f"Error fetching packages sorted by price: {e}")
+            return []
+    
+    # ==================== PLACES ====================
+    
+    async def search_places(
+        self,
+        country: Optional[str] = None,
+        city: Optional[str] = None,
+        category: Optional[str] = None,
+        near_city: Optional[str] = None,
+        is_featured: Optional[bool] = None,
+        text: Optional[str] = None,
+        limit: int = 10,
+        columns: str = PLACE_DETAIL
+    ) -> List[Dict[str, Any]]:
+        """
+        Search for tourist places based on various filters
+        
+        Args:
+            country: Country filter
+            city: City filter (if nothing matches, retried with the closest spellings)
+            category: Category filter (beach, mountain, historical, etc.)
+            near_city: Find places near a specific city
+            is_featured: Filter by featured places
+            text: Free-text keywords matched against name, description and
+                location, best match first instead of by popularity (e.g. "waterfall hiking")
+            limit: Maximum number of results
+            columns: Columns to fetch (e.g. PLACE_CARD)
             
-            response = self.client.table("bookings").insert(booking_data).execute()
+        Returns:
+            List of place records
+        """
+        country = canonical_location(country, "places", "country")
+        city = canonical_location(city, "places", "city")
+        near_city = canonical_location(near_city, "places", "city", "state_province")
+        filters = {
+            "country": country, "city": city, "category": category,
+            "near_city": near_city, "is_featured": is_featured,
+            "text": text, "limit": limit, "columns": columns
+        }
+        try:
+            places = await self._search(
+                "search_places", "places", filters,
+                self._search_places_query(country, city, category, near_city, is_featured, limit, columns, text)
+            )
+            if self._fuzzy_fallback(places, city, text):
+                places = await self._search(
+                    "search_places_fuzzy", "places", filters,
+                    self._search_places_query(
+                        country, city, category, near_city, is_featured, limit, columns, fuzzy=True
+                    )
+                )
+            return places
+        except Exception as e:
+            logger.error(f"Error searching places: {e}")
+            return []
+    
+    async def get_place_by_id(self, place_id: str, columns: str = PLACE_DETAIL) -> Optional[Dict[str, Any]]:
+        """Get a specific place by ID (read through the entity cache)"""
+        return await self._get_entity("places", place_id, columns, self._place_by_id_query)
+    
+    async def get_popular_places(self, limit: int = 10, columns: str = PLACE_DETAIL) -> List[Dict[str, Any]]:
+        """Get most popular places"""
+        try:
+            return await self._search(
+                "get_popular_places", "places",
+                {"limit": limit, "columns": columns},
+                self._popular_places_query(limit, columns)
+            )
+        except Exception as e:
+            logger.error(f"Error fetching popular places: {e}")
+            return []
+    
+    async def get_hotels_sorted_by_price(
+        self,
+        city: Optional[str] = None,
+        country: Optional[str] = None,
+        ascending: bool = True,
+        limit: int = 10,
+        columns: str = HOTEL_DETAIL
+    ) -> List[Dict[str, Any]]:
+        """Get hotels sorted by average room price"""
+        city = canonical_location(city, "hotels", "city")
+        country = canonical_location(country, "hotels", "country")
+        try:
+            return await self._search(
+                "get_hotels_sorted_by_price", "hotels",
+                {"city": city, "country": country, "ascending": ascending, "limit": limit, "columns": columns},
+                self._hotels_sorted_by_price_query(city, country, ascending, limit, columns)
+            )
+        except Exception as e:
+            logger.error(f"Error fetching hotels sorted by price: {e}")
+            return []
+    
+    # ==================== USER FAVORITES ====================
+    
+    async def get_user_favorites(
+        self,
+        user_id: str,
+        item_type: Optional[str] = None,
+        limit: int = 20,
+        columns: str = "*"
+    ) -> List[Dict[str, Any]]:
+        """Get user's favorite items"""
+        try:
+            response = await self._user_favorites_query(user_id, item_type, limit, columns).execute()
+            return response.data
+        except Exception as e:
+            logger.error(f"Error fetching user favorites: {e}")
+            return []
+    
+    async def add_user_favorite(self, user_id: str, item_type: str, item_id: str) -> Optional[Dict[str, Any]]:
+        """Add item to user favorites"""
+        try:
+            response = await self._add_favorite_query(user_id, item_type, item_id).execute()
             return response.data[0] if response.data else None
+        except Exception as e:
+            logger.error(f"Error adding favorite: {e}")
+            return None
+    
+    async def remove_user_favorite(self, user_id: str, item_type: str, item_id: str) -> bool:
+        """Remove item from user favorites"""
+        try:
+            await self._remove_favorite_query(user_id, item_type, item_id).execute()
+            return True
+        except Exception as e:
+            logger.error(f"Error removing favorite: {e}")
+            return False
+    
+    # ==================== BOOKINGS ====================
+    
+    async def create_booking(
+        self,
+        user_id: str,
+        booking_type: str,
+        item_id: str,
+        primary_guest_name: str,
+        primary_guest_email: str,
+        primary_guest_phone: str,
+        total_amount: float,
+        **kwargs
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Create a new booking
+        
+        Args:
+            user_id: User ID making the booking
+            booking_type: 'package' or 'hotel'
+            item_id: Package ID or Hotel ID
+            primary_guest_name: Name of primary guest
+            primary_guest_email: Email of primary guest
+            primary_guest_phone: Phone of primary guest
+            total_amount: Total booking amount
+            **kwargs: Additional booking details
+            
+        Returns:
+            Created booking record
+        """
+        try:
+            response = await self._create_booking_query(
+                user_id, booking_type, item_id,
+                primary_guest_name, primary_guest_email, primary_guest_phone,
+                total_amount, **kwargs
+            ).execute()
+            booking = response.data[0] if response.data else None
+            self._invalidate_booked_item(booking, booking_type, item_id)
+            return booking
         except Exception as e:
             logger.error(f"Error creating booking: {e}")
             return None
     
-    def get_booking_by_reference(self, booking_reference: str) -> Optional[Dict[str, Any]]:
+    async def get_booking_by_reference(self, booking_reference: str, columns: str = "*") -> Optional[Dict[str, Any]]:
         """Get booking by reference number"""
         try:
-            response = (
-                self.client.table("bookings")
-                .select("*")
-                .eq("booking_reference", booking_reference)
-                .execute()
-            )
+            response = await self._booking_by_reference_query(booking_reference, columns).execute()
             return response.data[0] if response.data else None
         except Exception as e:
             logger.error(f"Error fetching booking {booking_reference}: {e}")
             return None
     
-    def get_user_bookings(self, user_id: str, limit: int = 10) -> List[Dict[str, Any]]:
+    async def get_user_bookings(self, user_id: str, limit: int = 10, columns: str = "*") -> List[Dict[str, Any]]:
         """Get all bookings for a user"""
         try:
-            response = (
-                self.client.table("bookings")
-                .select("*")
-                .eq("user_id", user_id)
-                .order("created_at", desc=True)
-                .limit(limit)
-                .execute()
-            )
+            response = await self._user_bookings_query(user_id, limit, columns).execute()
             return response.data
         except Exception as e:
             logger.error(f"Error fetching bookings for user {user_id}: {e}")
             return []
 
 
-# Create a global instance
-supabase_client = SupabaseClient()
+# Create global instances (both clients share the same caches)
+entity_cache = (
+    EntityCache(
+        max_size=settings.entity_cache_size,
+        ttl_seconds=settings.entity_cache_ttl_seconds or None,
+        negative_ttl_seconds=settings.entity_cache_negative_ttl_seconds
+    )
+    if settings.entity_cache_enabled else None
+)
+search_cache = (
+    SearchCache(
+        table_ttls=settings.search_cache_table_ttls,
+        default_ttl_seconds=settings.search_cache_ttl_seconds or None,
+        max_size=settings.search_cache_size
+    )
+    if settings.search_cache_enabled else None
+)
+catalog_snapshot = (
+    CatalogSnapshot(
+        table_columns=CATALOG_SNAPSHOT_COLUMNS,
+        refresh_seconds=settings.catalog_snapshot_refresh_seconds,
+        page_size=settings.catalog_snapshot_page_size
+    )
+    if settings.catalog_snapshot_enabled else None
+)
+catalog_sync = (
+    CatalogSync(
+        table_columns=CATALOG_SYNC_COLUMNS,
+        interval_seconds=settings.catalog_sync_interval_seconds,
+        overlap_seconds=settings.catalog_sync_overlap_seconds,
+        page_size=settings.catalog_snapshot_page_size,
+        snapshot=catalog_snapshot,
+        entity_cache=entity_cache,
+        search_cache=search_cache
+    )
+    if settings.catalog_sync_enabled else None
+)
+supabase_client = SupabaseClient(entity_cache, search_cache, catalog_snapshot)
+async_supabase_client = AsyncSupabaseClient(entity_cache, search_cache, catalog_snapshot)
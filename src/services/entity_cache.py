@@ -0,0 +1,135 @@
+"""
+Entity Cache
+Read-through cache of single catalog rows fetched by ID (hotels, packages, places)
+"""
+from typing import Any, Dict, Optional, Tuple
+from src.services.cache import TTLCache
+import threading
+
+
+class EntityCache:
+    """
+    Size-bounded, TTL-expiring cache of rows keyed on (table, id, columns),
+    used by the Supabase clients' get_*_by_id methods.
+
+    IDs that were not found are cached too (negative caching), with their own
+    shorter TTL, so repeated lookups of a bad ID don't each hit the database.
+    Query errors are never cached.
+
+    invalidate() drops a row after a write that changes it (e.g. a booking
+    changing a package's available_slots); a fetch that was already in
+    flight when the row was invalidated is not stored.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 2000,
+        ttl_seconds: Optional[float] = 300,
+        negative_ttl_seconds: Optional[float] = 30
+    ):
+        """
+        Args:
+            max_size: Maximum number of cached rows (and, separately, of not-found IDs)
+            ttl_seconds: How long a row stays fresh (None disables expiry)
+            negative_ttl_seconds: How long a not-found ID is remembered (0 disables negative caching)
+        """
+        self._rows = TTLCache(max_size=max_size, ttl_seconds=ttl_seconds)
+        self._missing = (
+            TTLCache(max_size=max_size, ttl_seconds=negative_ttl_seconds)
+            if negative_ttl_seconds != 0 else None
+        )
+        self._lock = threading.Lock()
+        self.generation = 0
+
+        # Metrics
+        self.negative_hits = 0
+        self.invalidations = 0
+
+    def get(self, table: str, entity_id: str, columns: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        Look up a row
+
+        Returns:
+            (hit, row) where row is None for a cached not-found ID
+        """
+        key = (table, entity_id, columns)
+        row = self._rows.get(key)
+        if row is not None:
+            return True, dict(row)
+        if self._missing is not None and self._missing.get(key) is not None:
+            with self._lock:
+                self.negative_hits += 1
+            return True, None
+        return False, None
+
+    def set(
+        self,
+        table: str,
+        entity_id: str,
+        columns: str,
+        row: Optional[Dict[str, Any]],
+        generation: int
+    ) -> bool:
+        """
+        Cache a fetched row, or a not-found ID when row is None
+
+        Args:
+            generation: The cache generation read before the fetch started
+
+        Returns:
+            True if the result was cached
+        """
+        with self._lock:
+            if generation != self.generation:
+                return False
+
+        key = (table, entity_id, columns)
+        if row is not None:
+            self._rows.set(key, dict(row))
+            return True
+        if self._missing is not None:
+            self._missing.set(key, True)
+            return True
+        return False
+
+    def invalidate(self, table: str, entity_id: str) -> None:
+        """Drop every cached projection of a row (call after writing to it)"""
+        with self._lock:
+            self.generation += 1
+            self.invalidations += 1
+        for cache in (self._rows, self._missing):
+            if cache is None:
+                continue
+            for key in cache.keys():
+                if key[0] == table and key[1] == entity_id:
+                    cache.pop(key)
+
+    def clear(self) -> None:
+        """Drop every cached row and not-found ID"""
+        with self._lock:
+            self.generation += 1
+            self.invalidations += 1
+        self._rows.clear()
+        if self._missing is not None:
+            self._missing.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Row cache counters plus not-found hits and invalidations"""
+        rows = self._rows.stats()
+        hits = rows["hits"] + self.negative_hits
+        # A negative hit was first counted as a miss by the row cache
+        misses = rows["misses"] - self.negative_hits
+        lookups = hits + misses
+        return {
+            "size": rows["size"],
+            "max_size": rows["max_size"],
+            "ttl_seconds": rows["ttl_seconds"],
+            "negative_size": len(self._missing) if self._missing is not None else 0,
+            "hits": hits,
+            "negative_hits": self.negative_hits,
+            "misses": misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "evictions": rows["evictions"] + (self._missing.evictions if self._missing is not None else 0),
+            "expirations": rows["expirations"],
+            "invalidations": self.invalidations
+        }
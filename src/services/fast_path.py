@@ -0,0 +1,202 @@
+"""
+Rule-Based Fast Path
+Answers simple single-intent queries straight from the database without calling the LLM
+"""
+from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, field
+from src.services.database import async_supabase_client, HOTEL_SUMMARY, PACKAGE_SUMMARY, PLACE_CARD
+from src.utils.helpers import (
+    clean_text, extract_location, format_list_response,
+    match_intents, parse_price_range
+)
+import re
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+CHEAP_WORDS = ("cheap", "cheapest", "budget", "affordable", "lowest price")
+POPULAR_WORDS = ("popular", "top", "best", "famous", "must visit", "must-visit")
+PRICE_WORDS = ("under", "below", "less than", "over", "above", "more than", "at least", "between", "bdt", "taka", "tk")
+EXPENSIVE_WORDS = ("expensive", "priciest", "premium", "high end", "high-end")
+CATEGORY_WORDS = (
+    "adventure", "luxury", "beach", "cultural", "historical", "heritage", "mountain",
+    "nature", "wildlife", "religious", "honeymoon", "family", "romantic"
+)
+DURATION_PATTERN = re.compile(
+    r"\b(?:\d+|a|one|two|three|four|five|six|seven)[\s-]*(?:day|night|week)s?\b|\bweekend\b|\bovernight\b"
+)
+
+# Words that suggest the message depends on earlier turns or asks for several things
+CONTEXT_WORDS = {"it", "there", "that", "those", "them", "these", "this", "same"}
+CONJUNCTION_WORDS = {"and", "also", "then", "but", "or", "plus", "with"}
+
+FOLLOW_UP = "\n\nWould you like more details about any of these? 😊"
+
+
+@dataclass
+class FastPathDecision:
+    """Outcome of classifying a message for the fast path"""
+    intent: str
+    confidence: float
+    route: Optional[str] = None
+    args: Dict[str, Any] = field(default_factory=dict)
+
+    def as_metadata(self) -> Dict[str, Any]:
+        return {
+            "intent": self.intent,
+            "route": self.route,
+            "confidence": round(self.confidence, 2)
+        }
+
+
+class FastPathRouter:
+    """
+    Routes high-confidence, single-intent queries (e.g. "hotels in Dhaka",
+    "cheapest packages to Sylhet", "popular places") directly to
+    SupabaseClient and renders the result with format_list_response.
+
+    A message with a constraint the route's query can't apply (a price cue
+    on hotels, a category, a duration) is declined and goes to the LLM.
+    """
+
+    def __init__(self, min_confidence: float = 0.8):
+        self.min_confidence = min_confidence
+
+        # Metrics
+        self.considered = 0
+        self.handled = 0
+        self.below_threshold = 0
+        self.empty_results = 0
+        self.routes: Dict[str, int] = {}
+
+    def classify(self, message: str) -> FastPathDecision:
+        """Pick a route for the message and score how safe it is to skip the LLM"""
+        text = clean_text(message).lower()
+        words = re.findall(r"[a-z0-9']+", text)
+        intents = match_intents(text)
+
+        if len(intents) != 1:
+            return FastPathDecision(intent=intents[0] if intents else "general", confidence=0.0)
+
+        intent = intents[0]
+        location = extract_location(text)
+        city = location.get("city")
+        # Bare numbers are usually durations or group sizes, so only parse prices with a cue
+        price = {"min": None, "max": None}
+        price_cue = bool(re.search(r"\d", text)) and any(word in text for word in PRICE_WORDS)
+        if price_cue:
+            price = parse_price_range(text)
+        cheap = any(word in text for word in CHEAP_WORDS)
+        expensive = any(word in text for word in EXPENSIVE_WORDS)
+        # Categories and durations are left to the LLM, which can pick the filter value
+        refined = any(word in words for word in CATEGORY_WORDS) or bool(DURATION_PATTERN.search(text))
+
+        # Decline anything the route's call would drop: answering "hotels in
+        # Dhaka under 5000" with every hotel in Dhaka is worse than the LLM
+        if refined or expensive or (price_cue and not (price["max"] or price["min"])):
+            return FastPathDecision(intent=intent, confidence=0.0)
+
+        route, args = None, {}
+        if intent == "hotel" and city and not (cheap or price_cue):
+            route, args = "search_hotels", {"city": city}
+        elif intent == "package":
+            if cheap:
+                # Price order can't be combined with a price range here
+                if not price_cue:
+                    route, args = "get_cheapest_packages", {"destination": city} if city else {}
+            elif city or price["max"] or price["min"]:
+                route = "search_packages"
+                args = {
+                    key: value for key, value in {
+                        "destination": city,
+                        "max_price": price["max"],
+                        "min_price": price["min"]
+                    }.items() if value
+                }
+        elif intent == "place" and not (cheap or price_cue):
+            if city:
+                route, args = "search_places", {"city": city}
+            elif any(word in text for word in POPULAR_WORDS):
+                route, args = "get_popular_places", {}
+
+        if route is None:
+            return FastPathDecision(intent=intent, confidence=0.0)
+
+        # Base score for a supported route with a concrete slot filled
+        confidence = 0.8
+        if len(words) <= 6:
+            confidence += 0.2
+        elif len(words) <= 10:
+            confidence += 0.1
+        elif len(words) > 14:
+            confidence -= 0.3
+        if CONTEXT_WORDS.intersection(words):
+            confidence -= 0.4
+        if CONJUNCTION_WORDS.intersection(words):
+            confidence -= 0.3
+
+        return FastPathDecision(
+            intent=intent,
+            confidence=max(0.0, min(1.0, confidence)),
+            route=route,
+            args=args
+        )
+
+    async def _fetch(self, route: str, args: Dict[str, Any]) -> List[Dict[str, Any]]:
+        if route == "search_hotels":
+            return await async_supabase_client.search_hotels(city=args["city"], limit=10, columns=HOTEL_SUMMARY)
+        if route == "get_cheapest_packages":
+            return await async_supabase_client.get_cheapest_packages(limit=5, columns=PACKAGE_SUMMARY, **args)
+        if route == "search_packages":
+            return await async_supabase_client.search_packages(limit=10, columns=PACKAGE_SUMMARY, **args)
+        if route == "search_places":
+            return await async_supabase_client.search_places(city=args["city"], limit=10, columns=PLACE_CARD)
+        if route == "get_popular_places":
+            return await async_supabase_client.get_popular_places(limit=10, columns=PLACE_CARD)
+        raise ValueError(f"Unknown fast path route: {route}")
+
+    async def try_handle(self, message: str) -> Dict[str, Any]:
+        """
+        Try to answer a message on the fast path
+
+        Returns:
+            Dictionary with the decision metadata and, if the fast path answered,
+            the rendered "response" and the equivalent "tool" call
+        """
+        decision = self.classify(message)
+        self.considered += 1
+        result: Dict[str, Any] = {"decision": decision}
+
+        if decision.route is None or decision.confidence < self.min_confidence:
+            self.below_threshold += 1
+            return result
+
+        items = await self._fetch(decision.route, decision.args)
+        if not items:
+            # Let the LLM handle empty results so it can suggest alternatives
+            self.empty_results += 1
+            return result
+
+        item_type = {"search_hotels": "hotel", "search_places": "place", "get_popular_places": "place"}.get(
+            decision.route, "package"
+        )
+        self.handled += 1
+        self.routes[decision.route] = self.routes.get(decision.route, 0) + 1
+        logger.info(f"Fast path answered via {decision.route} (confidence {decision.confidence:.2f})")
+
+        result["response"] = format_list_response(items, item_type) + FOLLOW_UP
+        result["tool"] = {"tool": decision.route, "input": decision.args}
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Fast path usage counters"""
+        return {
+            "min_confidence": self.min_confidence,
+            "considered": self.considered,
+            "handled": self.handled,
+            "usage_rate": round(self.handled / self.considered, 4) if self.considered else 0.0,
+            "below_threshold": self.below_threshold,
+            "empty_results": self.empty_results,
+            "routes": dict(self.routes)
+        }
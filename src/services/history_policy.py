@@ -0,0 +1,172 @@
+"""
+Conversation History Policy
+Caps the chat history sent to the LLM with turn windowing, a token budget and a rolling summary
+"""
+from typing import Any, Dict, List, Tuple
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# Rough size of a token for budgeting (no tokenizer round-trip per turn)
+CHARS_PER_TOKEN = 4
+MESSAGE_OVERHEAD_TOKENS = 4
+
+SUMMARY_PREFIX = "Summary of the earlier conversation (older messages were omitted):"
+
+
+def message_text(message: BaseMessage) -> str:
+    """Plain text of a message (content may be a list of parts)"""
+    content = message.content
+    if isinstance(content, str):
+        return content
+    return " ".join(
+        part.get("text", "") if isinstance(part, dict) else str(part)
+        for part in content
+    )
+
+
+def estimate_tokens(messages: List[BaseMessage]) -> int:
+    """Approximate prompt tokens for a list of messages"""
+    return sum(
+        len(message_text(message)) // CHARS_PER_TOKEN + MESSAGE_OVERHEAD_TOKENS
+        for message in messages
+    )
+
+
+def split_turns(messages: List[BaseMessage]) -> List[List[BaseMessage]]:
+    """Group messages into turns, each starting at a human message"""
+    turns: List[List[BaseMessage]] = []
+    for message in messages:
+        if isinstance(message, HumanMessage) or not turns:
+            turns.append([message])
+        else:
+            turns[-1].append(message)
+    return turns
+
+
+def _clip(text: str, limit: int) -> str:
+    text = " ".join(text.split())
+    return text if len(text) <= limit else text[:limit - 1].rstrip() + "…"
+
+
+class HistoryPolicy:
+    """
+    Decides which part of a session's history goes into the prompt.
+
+    Keeps at most ``max_turns`` recent turns, then drops further old turns
+    until the history fits ``token_budget``. Dropped turns are condensed into
+    a short extractive summary (what the user asked, how the assistant
+    opened its answer) passed as a system note, so references to earlier
+    requests still resolve. The stored history itself is not modified.
+    """
+
+    def __init__(
+        self,
+        max_turns: int = 10,
+        token_budget: int = 3000,
+        summarize: bool = True,
+        summary_max_chars: int = 800
+    ):
+        """
+        Args:
+            max_turns: Most recent turns kept verbatim (0 disables)
+            token_budget: Approximate token cap for the history (0 disables)
+            summarize: Condense dropped turns into a system note
+            summary_max_chars: Maximum summary length; the most recent
+                dropped turns win when it overflows
+        """
+        self.max_turns = max_turns
+        self.token_budget = token_budget
+        self.summarize = summarize
+        self.summary_max_chars = summary_max_chars
+        self._lock = threading.Lock()
+
+        # Metrics
+        self.turns_processed = 0
+        self.turns_trimmed = 0
+        self.tokens_before = 0
+        self.tokens_after = 0
+
+    def _summary(self, dropped: List[List[BaseMessage]]) -> str:
+        lines = []
+        for turn in dropped:
+            user = _clip(message_text(turn[0]), 120) if isinstance(turn[0], HumanMessage) else ""
+            replies = [message_text(m) for m in turn[1:] if m.type == "ai" and message_text(m).strip()]
+            line = f"- User: {user}" if user else "-"
+            if replies:
+                line += f" | Assistant: {_clip(replies[-1], 100)}"
+            lines.append(line)
+
+        # Keep the most recent lines that fit
+        kept: List[str] = []
+        size = len(SUMMARY_PREFIX)
+        for line in reversed(lines):
+            if size + len(line) + 1 > self.summary_max_chars:
+                break
+            kept.append(line)
+            size += len(line) + 1
+        if not kept:
+            return ""
+        return "\n".join([SUMMARY_PREFIX] + list(reversed(kept)))
+
+    def apply(self, messages: List[BaseMessage]) -> Tuple[List[BaseMessage], Dict[str, Any]]:
+        """
+        Apply the policy to a session's history
+
+        Args:
+            messages: Full stored history, oldest first
+
+        Returns:
+            (messages to send, report with token counts before/after)
+        """
+        turns = split_turns(messages)
+        kept = turns
+        if self.max_turns > 0 and len(kept) > self.max_turns:
+            kept = kept[-self.max_turns:]
+
+        if self.token_budget > 0:
+            # Always keep the latest turn, even if it alone is over budget
+            sizes = [estimate_tokens(turn) for turn in kept]
+            while len(kept) > 1 and sum(sizes) > self.token_budget:
+                kept, sizes = kept[1:], sizes[1:]
+
+        dropped = turns[:len(turns) - len(kept)]
+        result = [message for turn in kept for message in turn]
+        if dropped and self.summarize:
+            summary = self._summary(dropped)
+            if summary:
+                result = [SystemMessage(content=summary)] + result
+
+        report = {
+            "messages": len(messages),
+            "sent_messages": len(result),
+            "summarized_turns": len(dropped) if self.summarize else 0,
+            "tokens_before": estimate_tokens(messages),
+            "tokens_after": estimate_tokens(result)
+        }
+        report["tokens_saved"] = max(0, report["tokens_before"] - report["tokens_after"])
+
+        with self._lock:
+            self.turns_processed += 1
+            self.turns_trimmed += 1 if dropped else 0
+            self.tokens_before += report["tokens_before"]
+            self.tokens_after += report["tokens_after"]
+
+        return result, report
+
+    def stats(self) -> Dict[str, Any]:
+        """Policy settings and cumulative token savings"""
+        with self._lock:
+            saved = max(0, self.tokens_before - self.tokens_after)
+            return {
+                "max_turns": self.max_turns,
+                "token_budget": self.token_budget,
+                "summarize": self.summarize,
+                "turns_processed": self.turns_processed,
+                "turns_trimmed": self.turns_trimmed,
+                "tokens_saved": saved,
+                "saved_ratio": round(saved / self.tokens_before, 4) if self.tokens_before else 0.0
+            }
@@ -0,0 +1,172 @@
+"""
+Model Cascade
+Routes easy turns to a faster, cheaper model and escalates to the stronger one when needed
+"""
+from typing import Any, Dict, List, Optional
+from dataclasses import dataclass
+from src.utils.helpers import clean_text
+import re
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+FAST = "fast"
+STRONG = "strong"
+
+# Intents whose turns always go to the strong model
+STRONG_INTENTS = {"booking"}
+
+# Words that add a constraint to a request ("3-star hotels in Sylhet under 5000 with a pool")
+CONSTRAINT_WORDS = {
+    "and", "with", "but", "under", "below", "over", "above", "between", "near",
+    "within", "before", "after", "during", "without", "except", "plan", "itinerary", "compare"
+}
+
+# Phrases that mark an answer the fast model was unsure about
+LOW_CONFIDENCE_PHRASES = (
+    "i'm not sure", "i am not sure", "i don't know", "i do not know",
+    "i couldn't", "i could not", "i can't", "i cannot", "i'm unable", "i am unable",
+    "unable to", "not able to", "could you clarify", "please clarify"
+)
+
+
+@dataclass
+class TierDecision:
+    """Model tier chosen for one turn"""
+    tier: str
+    reason: str
+
+    def as_metadata(self) -> Dict[str, Any]:
+        return {"tier": self.tier, "reason": self.reason}
+
+
+class ModelCascade:
+    """
+    Chooses between a fast model (single lookups and small talk) and a strong
+    model (bookings and multi-constraint planning) for each agent turn.
+
+    A fast-tier turn is escalated to the strong model when it errors, answers
+    a lookup without calling a tool, or returns an empty or hedging answer.
+    Latency, token usage and estimated cost are tracked per tier.
+    """
+
+    def __init__(
+        self,
+        max_fast_words: int = 16,
+        max_fast_constraints: int = 2,
+        min_answer_chars: int = 20,
+        costs: Optional[Dict[str, Dict[str, float]]] = None
+    ):
+        """
+        Args:
+            max_fast_words: Longer messages go to the strong model
+            max_fast_constraints: Messages with more constraint words or numbers go to the strong model
+            min_answer_chars: Shorter fast-tier answers are treated as low confidence
+            costs: USD per million tokens per tier, e.g. {"fast": {"input": 0.075, "output": 0.3}}
+        """
+        self.max_fast_words = max_fast_words
+        self.max_fast_constraints = max_fast_constraints
+        self.min_answer_chars = min_answer_chars
+        self.costs = costs or {}
+
+        # Metrics
+        self.routed = {FAST: 0, STRONG: 0}
+        self.escalations: Dict[str, int] = {}
+        self._tiers = {
+            tier: {"runs": 0, "seconds": 0.0, "input_tokens": 0, "output_tokens": 0, "cost_usd": 0.0}
+            for tier in (FAST, STRONG)
+        }
+
+    def route(self, message: str, intents: List[str]) -> TierDecision:
+        """Pick the model tier for a message given its intents from match_intents"""
+        text = clean_text(message).lower()
+        words = re.findall(r"[a-z0-9']+", text)
+        constraints = sum(1 for word in words if word in CONSTRAINT_WORDS or word.isdigit())
+
+        if STRONG_INTENTS.intersection(intents):
+            decision = TierDecision(STRONG, "booking")
+        elif len(intents) > 1:
+            decision = TierDecision(STRONG, "multi_intent")
+        elif len(words) > self.max_fast_words or constraints > self.max_fast_constraints:
+            decision = TierDecision(STRONG, "multi_constraint")
+        else:
+            decision = TierDecision(FAST, "lookup" if intents else "small_talk")
+
+        self.routed[decision.tier] += 1
+        return decision
+
+    def escalation_reason(self, result: Dict[str, Any], intents: List[str]) -> Optional[str]:
+        """Why a fast-tier result should be redone by the strong model (None to keep it)"""
+        output = result.get("output") or ""
+        if not isinstance(output, str):
+            output = str(output)
+        if intents and not result.get("intermediate_steps"):
+            return "no_tool_call"
+        if len(output.strip()) < self.min_answer_chars:
+            return "short_answer"
+        lowered = output.lower()
+        if any(phrase in lowered for phrase in LOW_CONFIDENCE_PHRASES):
+            return "low_confidence"
+        return None
+
+    def record_escalation(self, reason: str) -> None:
+        self.escalations[reason] = self.escalations.get(reason, 0) + 1
+
+    def record_run(self, tier: str, seconds: float, usage: Dict[str, Dict[str, int]]) -> Dict[str, Any]:
+        """
+        Add one model-tier run to the metrics
+
+        Args:
+            tier: FAST or STRONG
+            seconds: Wall time of the executor run
+            usage: Token usage per model name (UsageMetadataCallbackHandler.usage_metadata)
+
+        Returns:
+            Summary of the run for logging and response metadata
+        """
+        input_tokens = sum(u.get("input_tokens", 0) for u in usage.values())
+        output_tokens = sum(u.get("output_tokens", 0) for u in usage.values())
+        prices = self.costs.get(tier, {})
+        cost = (input_tokens * prices.get("input", 0.0) + output_tokens * prices.get("output", 0.0)) / 1_000_000
+
+        totals = self._tiers[tier]
+        totals["runs"] += 1
+        totals["seconds"] += seconds
+        totals["input_tokens"] += input_tokens
+        totals["output_tokens"] += output_tokens
+        totals["cost_usd"] += cost
+
+        run = {
+            "tier": tier,
+            "latency_ms": round(seconds * 1000, 1),
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "cost_usd": round(cost, 6)
+        }
+        logger.info(
+            f"Model tier {tier}: {run['latency_ms']} ms, "
+            f"{input_tokens} in / {output_tokens} out tokens, ${run['cost_usd']}"
+        )
+        return run
+
+    def stats(self) -> Dict[str, Any]:
+        """Routing counts, escalations and per-tier latency and cost"""
+        tiers = {}
+        for tier, totals in self._tiers.items():
+            runs = totals["runs"]
+            tiers[tier] = {
+                "routed": self.routed[tier],
+                "runs": runs,
+                "avg_latency_ms": round(totals["seconds"] / runs * 1000, 1) if runs else 0.0,
+                "input_tokens": totals["input_tokens"],
+                "output_tokens": totals["output_tokens"],
+                "cost_usd": round(totals["cost_usd"], 6)
+            }
+        fast_routed = self.routed[FAST]
+        escalated = sum(self.escalations.values())
+        return {
+            "tiers": tiers,
+            "escalations": dict(self.escalations),
+            "escalation_rate": round(escalated / fast_routed, 3) if fast_routed else 0.0
+        }
@@ -0,0 +1,115 @@
+"""
+Speculative Tool Prefetch
+Starts the tool call a message most likely needs while the LLM is still planning
+"""
+from typing import Any, Dict, List, Optional, Tuple
+from src.services.tools import ASYNC_IMPLEMENTATIONS, UNMEMOIZED_TOOLS
+from src.services.turn_context import TurnContext
+from src.utils.helpers import clean_text, extract_location, match_intents
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+CHEAP_WORDS = ("cheap", "cheapest", "budget", "affordable", "lowest price")
+POPULAR_WORDS = ("popular", "top", "best", "famous", "must visit", "must-visit")
+
+
+class SpeculativePrefetcher:
+    """
+    Predicts the tool calls for a message from its intents and location
+    (e.g. "hotels in Sylhet" -> search_hotels(city="Sylhet")) and starts
+    them concurrently with the first LLM call.
+
+    Results land in the turn's tool memo, so when the LLM makes the
+    predicted call it is answered without another database round trip.
+    Predictions the LLM never used are counted as wasted.
+    """
+
+    def __init__(self, max_calls: int = 2, allowed_tools: Optional[List[str]] = None):
+        """
+        Args:
+            max_calls: Most prefetches started per turn
+            allowed_tools: Tools that may be prefetched (defaults to every read-only tool)
+        """
+        self.max_calls = max_calls
+        self.allowed_tools = set(allowed_tools or ASYNC_IMPLEMENTATIONS) - UNMEMOIZED_TOOLS
+
+        # Metrics
+        self.turns = 0
+        self.started = 0
+        self.hits = 0
+        self.tools: Dict[str, Dict[str, int]] = {}
+
+    def predict(self, message: str) -> List[Tuple[str, Dict[str, Any]]]:
+        """Likely (tool, args) calls for a message, most likely first"""
+        text = clean_text(message).lower()
+        # Locate on the raw message: clean_text drops the apostrophe in "Cox's Bazar"
+        city = extract_location(message).get("city")
+
+        predictions: List[Tuple[str, Dict[str, Any]]] = []
+        for intent in match_intents(text):
+            if intent == "hotel" and city:
+                predictions.append(("search_hotels", {"city": city}))
+            elif intent == "package":
+                if city:
+                    predictions.append(("search_packages", {"destination": city}))
+                elif any(word in text for word in CHEAP_WORDS):
+                    predictions.append(("get_cheapest_packages", {}))
+            elif intent == "place":
+                if city:
+                    predictions.append(("search_places", {"city": city}))
+                elif any(word in text for word in POPULAR_WORDS):
+                    predictions.append(("get_popular_places", {}))
+            elif intent == "weather" and city:
+                predictions.append(("get_weather", {"city": city}))
+
+        return [p for p in predictions if p[0] in self.allowed_tools][:self.max_calls]
+
+    def start(self, turn: TurnContext, message: str, tool_names: Optional[List[str]] = None) -> List[str]:
+        """
+        Start the predicted calls for a message in the turn
+
+        Args:
+            turn: The current agent turn
+            message: User's input message
+            tool_names: Tools bound for this turn (None for the full set); others are skipped
+
+        Returns:
+            Names of the tools whose prefetch was started
+        """
+        self.turns += 1
+        started = []
+        for tool, args in self.predict(message):
+            if tool_names is not None and tool not in tool_names:
+                continue
+            implementation = ASYNC_IMPLEMENTATIONS[tool]
+            if turn.prefetch(tool, args, lambda f=implementation, a=args: f(**a)):
+                started.append(tool)
+        if started:
+            logger.info(f"Prefetching {started}")
+        return started
+
+    def record(self, turn: TurnContext) -> Dict[str, Any]:
+        """Add a finished turn's prefetch outcome to the metrics and return it"""
+        report = turn.prefetch_stats()
+        self.started += report["started"]
+        self.hits += report["hits"]
+        for tool in report["tools"]:
+            counts = self.tools.setdefault(tool, {"started": 0, "hits": 0})
+            counts["started"] += 1
+        for tool in report["hit_tools"]:
+            self.tools[tool]["hits"] += 1
+        return {key: report[key] for key in ("started", "hits", "wasted")}
+
+    def stats(self) -> Dict[str, Any]:
+        """Prefetch counters and the share of prefetches the LLM never used"""
+        wasted = self.started - self.hits
+        return {
+            "turns": self.turns,
+            "started": self.started,
+            "hits": self.hits,
+            "wasted": wasted,
+            "wasted_rate": round(wasted / self.started, 4) if self.started else 0.0,
+            "tools": {tool: dict(counts) for tool, counts in self.tools.items()}
+        }
@@ -0,0 +1,224 @@
+"""
+Chat Response Cache
+Reuses answers to repeated session-independent first-turn queries instead of re-running the agent
+"""
+from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass
+from src.services.cache import TTLCache
+from src.utils.helpers import clean_text, extract_location, normalize_locations
+import hashlib
+import re
+import threading
+import numpy as np
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# Only answers built purely from shared catalog data may be reused across users
+CACHEABLE_TOOLS = {
+    "search_hotels", "get_hotel_rooms", "get_hotels_by_price",
+    "search_packages", "get_cheapest_packages", "get_packages_by_price",
+    "search_places", "get_popular_places", "get_weather"
+}
+
+# Leading politeness words that don't change what is being asked
+FILLER_PREFIX = re.compile(
+    r"^(?:(?:hi|hello|hey|please|pls|can you|could you|would you|show me|tell me|give me|find me|i want|i need|"
+    r"i am looking for|i'm looking for|im looking for|looking for|list|find|show|get)\s+)+"
+)
+
+EMBEDDING_DIM = 512
+
+
+def normalize_query(message: str) -> str:
+    """
+    Normalize a chat message into a cache key
+
+    Lowercases, applies clean_text, strips punctuation and leading filler
+    words, and resolves location aliases (e.g. "Show me hotels in CTG!" and
+    "hotels in chittagong" map to the same key).
+    """
+    text = clean_text(message).lower()
+    text = re.sub(r"[.,!?]+", " ", text)
+    text = re.sub(r"\s+", " ", text).strip()
+    text = FILLER_PREFIX.sub("", text)
+    return normalize_locations(text)
+
+
+def embed_query(normalized: str) -> np.ndarray:
+    """
+    Locally computed embedding: hashed character trigrams, L2-normalized
+
+    Cheap and deterministic; good at catching spelling and word-order variants
+    of the same query, not at paraphrases.
+    """
+    vector = np.zeros(EMBEDDING_DIM, dtype=np.float32)
+    padded = f"  {normalized} "
+    for i in range(len(padded) - 2):
+        digest = hashlib.blake2b(padded[i:i + 3].encode(), digest_size=4).digest()
+        vector[int.from_bytes(digest, "little") % EMBEDDING_DIM] += 1.0
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+def query_slots(normalized: str) -> Tuple[Optional[str], Tuple[str, ...]]:
+    """Location and numbers in a query; near-matches must agree on these exactly"""
+    return extract_location(normalized)["city"], tuple(re.findall(r"\d+", normalized))
+
+
+@dataclass
+class CachedResponse:
+    """A reusable agent answer"""
+    response: str
+    tools_used: List[Dict[str, Any]]
+    embedding: Optional[np.ndarray] = None
+    slots: Optional[Tuple[Optional[str], Tuple[str, ...]]] = None
+
+
+class ResponseCache:
+    """
+    Size-bounded, TTL-expiring cache of agent answers keyed on the normalized
+    message, with an optional embedding-similarity fallback.
+
+    Entries are tied to the catalog generation: invalidate() (called when a
+    booking changes availability) drops everything, and answers computed
+    before an invalidation are not stored afterwards.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        ttl_seconds: Optional[float] = 300,
+        similarity_threshold: float = 0.0
+    ):
+        """
+        Args:
+            max_size: Maximum number of cached answers
+            ttl_seconds: How long an answer stays fresh (None disables expiry)
+            similarity_threshold: Minimum cosine similarity for a near-match hit
+                (0 disables similarity lookups)
+        """
+        self.similarity_threshold = similarity_threshold
+        self._cache = TTLCache(max_size=max_size, ttl_seconds=ttl_seconds)
+        self._lock = threading.Lock()
+        self.generation = 0
+
+        # Metrics
+        self.exact_hits = 0
+        self.similar_hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.invalidations = 0
+
+    def lookup(self, message: str) -> Tuple[str, int, Optional[Dict[str, Any]]]:
+        """
+        Find a cached answer for a message
+
+        Returns:
+            (normalized key, catalog generation, hit) where hit is None on a miss
+            or a dictionary with the response, tools_used and similarity
+        """
+        key = normalize_query(message)
+        with self._lock:
+            generation = self.generation
+
+        entry = self._cache.get(key)
+        if entry is not None:
+            with self._lock:
+                self.exact_hits += 1
+            return key, generation, {"response": entry.response, "tools_used": entry.tools_used, "similarity": 1.0}
+
+        if self.similarity_threshold > 0:
+            match = self._nearest(embed_query(key), query_slots(key))
+            if match is not None:
+                entry, similarity = match
+                with self._lock:
+                    self.similar_hits += 1
+                return key, generation, {
+                    "response": entry.response,
+                    "tools_used": entry.tools_used,
+                    "similarity": round(similarity, 4)
+                }
+
+        with self._lock:
+            self.misses += 1
+        return key, generation, None
+
+    def _nearest(
+        self,
+        embedding: np.ndarray,
+        slots: Tuple[Optional[str], Tuple[str, ...]]
+    ) -> Optional[Tuple[CachedResponse, float]]:
+        # "hotels in dhaka" and "hotels in sylhet" look alike but are different questions
+        entries = [
+            entry for _, entry in self._cache.items()
+            if entry.embedding is not None and entry.slots == slots
+        ]
+        if not entries:
+            return None
+
+        similarities = np.stack([entry.embedding for entry in entries]) @ embedding
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.similarity_threshold:
+            return None
+        return entries[best], float(similarities[best])
+
+    def store(self, key: str, generation: int, response: str, tools_used: List[Dict[str, Any]]) -> bool:
+        """
+        Cache an agent answer if it is safe to share
+
+        Args:
+            key: Normalized key returned by lookup()
+            generation: Catalog generation returned by lookup()
+            response: The agent's answer
+            tools_used: Tools the agent called to produce it
+
+        Returns:
+            True if the answer was cached
+        """
+        # Answers that needed no data, or used user-specific tools, are not shared
+        if not tools_used or any(t["tool"] not in CACHEABLE_TOOLS for t in tools_used):
+            return False
+
+        with self._lock:
+            if generation != self.generation:
+                return False
+            self.stores += 1
+
+        entry = CachedResponse(response=response, tools_used=tools_used)
+        if self.similarity_threshold > 0:
+            entry.embedding = embed_query(key)
+            entry.slots = query_slots(key)
+        self._cache.set(key, entry)
+        return True
+
+    def invalidate(self) -> None:
+        """Drop every cached answer (the catalog or availability changed)"""
+        with self._lock:
+            self.generation += 1
+            self.invalidations += 1
+        self._cache.clear()
+        logger.info("Response cache invalidated")
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache size and hit-rate counters"""
+        storage = self._cache.stats()
+        with self._lock:
+            hits = self.exact_hits + self.similar_hits
+            lookups = hits + self.misses
+            return {
+                "size": storage["size"],
+                "max_size": storage["max_size"],
+                "ttl_seconds": storage["ttl_seconds"],
+                "similarity_threshold": self.similarity_threshold,
+                "lookups": lookups,
+                "exact_hits": self.exact_hits,
+                "similar_hits": self.similar_hits,
+                "misses": self.misses,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+                "stores": self.stores,
+                "evictions": storage["evictions"],
+                "expirations": storage["expirations"],
+                "invalidations": self.invalidations
+            }
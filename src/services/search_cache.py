@@ -0,0 +1,218 @@
+"""
+Search Result Cache
+Caches catalog list queries keyed on the method and its normalized filters,
+coalescing concurrent identical misses into one upstream request
+"""
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+from src.services.cache import TTLCache
+import asyncio
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+Rows = List[Dict[str, Any]]
+
+
+def search_key(method: str, filters: Dict[str, Any]) -> Hashable:
+    """
+    Cache key for a query: the method plus its filters, dropping unset ones
+    and normalizing text (the ilike filters are case-insensitive, so
+    "Cox's Bazar" and " cox's  bazar" select the same rows)
+    """
+    normalized = []
+    for name, value in sorted(filters.items()):
+        if value is None:
+            continue
+        if isinstance(value, str):
+            value = " ".join(value.lower().split())
+        normalized.append((name, value))
+    return (method, tuple(normalized))
+
+
+class _Flight:
+    """An upstream request in progress on the sync client"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.rows: Optional[Rows] = None
+        self.error: Optional[BaseException] = None
+
+
+class SearchCache:
+    """
+    Per-table, TTL-expiring cache of list query results (search_hotels,
+    search_packages, get_cheapest_packages, ...).
+
+    Single-flight: while a query is being fetched, identical requests wait
+    for that fetch instead of sending their own, so a burst of N identical
+    misses (e.g. everyone asking for the cheapest packages after a marketing
+    push) costs one PostgREST request. Failed fetches are not cached.
+
+    invalidate(table) drops a table's results after a write to it; a fetch
+    that was already in flight is then not stored.
+    """
+
+    def __init__(
+        self,
+        table_ttls: Dict[str, Optional[float]],
+        default_ttl_seconds: Optional[float] = 120,
+        max_size: int = 500
+    ):
+        """
+        Args:
+            table_ttls: Result lifetime in seconds per table (None disables expiry)
+            default_ttl_seconds: Lifetime for tables not in table_ttls
+            max_size: Maximum number of cached results per table
+        """
+        self.table_ttls = dict(table_ttls)
+        self.default_ttl_seconds = default_ttl_seconds
+        self.max_size = max_size
+        self._tables: Dict[str, TTLCache] = {}
+        self._generations: Dict[str, int] = {}
+        self._flights: Dict[Hashable, "asyncio.Task[Rows]"] = {}
+        self._sync_flights: Dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+
+        # Metrics
+        self.fetches = 0
+        self.coalesced = 0
+        self.invalidations = 0
+
+    def _cache(self, table: str) -> TTLCache:
+        with self._lock:
+            cache = self._tables.get(table)
+            if cache is None:
+                ttl = self.table_ttls.get(table, self.default_ttl_seconds)
+                cache = self._tables[table] = TTLCache(max_size=self.max_size, ttl_seconds=ttl or None)
+            return cache
+
+    def _lookup(self, table: str, key: Hashable) -> Optional[Rows]:
+        rows = self._cache(table).get(key)
+        # Callers get their own list and dicts, the cached copy stays untouched
+        return [dict(row) for row in rows] if rows is not None else None
+
+    def _store(self, table: str, key: Hashable, rows: Rows, generation: int) -> None:
+        with self._lock:
+            if generation != self._generations.get(table, 0):
+                return
+        self._cache(table).set(key, [dict(row) for row in rows])
+
+    def _generation(self, table: str) -> int:
+        with self._lock:
+            return self._generations.get(table, 0)
+
+    async def get_or_fetch(
+        self,
+        method: str,
+        table: str,
+        filters: Dict[str, Any],
+        fetch: Callable[[], Awaitable[Rows]]
+    ) -> Rows:
+        """
+        Return the cached result for a query, or fetch it once for every
+        concurrent caller asking for the same thing
+
+        Args:
+            method: Client method name (part of the key)
+            table: Table the query reads (selects the TTL and invalidation group)
+            filters: Every argument that shapes the result, including limit and columns
+            fetch: Coroutine function running the query upstream
+        """
+        key = search_key(method, filters)
+        rows = self._lookup(table, key)
+        if rows is not None:
+            return rows
+
+        task = self._flights.get(key)
+        if task is None:
+            self.fetches += 1
+            task = asyncio.ensure_future(self._fetch(table, key, fetch, self._generation(table)))
+            self._flights[key] = task
+            task.add_done_callback(lambda t, k=key: self._finish(k, t))
+        else:
+            self.coalesced += 1
+
+        # A cancelled caller must not cancel the fetch the others are waiting on
+        rows = await asyncio.shield(task)
+        return [dict(row) for row in rows]
+
+    async def _fetch(self, table: str, key: Hashable, fetch: Callable[[], Awaitable[Rows]], generation: int) -> Rows:
+        rows = await fetch()
+        self._store(table, key, rows, generation)
+        return rows
+
+    def _finish(self, key: Hashable, task: "asyncio.Task[Rows]") -> None:
+        self._flights.pop(key, None)
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug(f"Search fetch failed for {key}: {task.exception()}")
+
+    def get_or_fetch_sync(
+        self,
+        method: str,
+        table: str,
+        filters: Dict[str, Any],
+        fetch: Callable[[], Rows]
+    ) -> Rows:
+        """Blocking version of get_or_fetch() for the sync client (coalesces across threads)"""
+        key = search_key(method, filters)
+        rows = self._lookup(table, key)
+        if rows is not None:
+            return rows
+
+        with self._lock:
+            flight = self._sync_flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._sync_flights[key] = _Flight()
+                self.fetches += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return [dict(row) for row in flight.rows]
+
+        generation = self._generation(table)
+        try:
+            flight.rows = fetch()
+            self._store(table, key, flight.rows, generation)
+            return [dict(row) for row in flight.rows]
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._sync_flights.pop(key, None)
+            flight.done.set()
+
+    def invalidate(self, table: str) -> None:
+        """Drop every cached result read from a table (call after writing to it)"""
+        with self._lock:
+            self._generations[table] = self._generations.get(table, 0) + 1
+            self.invalidations += 1
+            cache = self._tables.get(table)
+        if cache is not None:
+            cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters overall and per table, plus coalesced requests"""
+        with self._lock:
+            tables = dict(self._tables)
+        per_table = {table: cache.stats() for table, cache in tables.items()}
+        hits = sum(t["hits"] for t in per_table.values())
+        lookups = hits + self.fetches + self.coalesced
+        return {
+            "hits": hits,
+            "fetches": self.fetches,
+            "coalesced": self.coalesced,
+            "hit_rate": round((hits + self.coalesced) / lookups, 4) if lookups else 0.0,
+            "invalidations": self.invalidations,
+            "tables": {
+                table: {key: stats[key] for key in ("size", "ttl_seconds", "hits", "evictions", "expirations")}
+                for table, stats in per_table.items()
+            }
+        }
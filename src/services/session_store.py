@@ -0,0 +1,480 @@
+"""
+Chat Session Store
+Bounded storage for per-session conversation histories
+"""
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from abc import ABC, abstractmethod
+from langchain_core.chat_history import BaseChatMessageHistory, InMemoryChatMessageHistory
+from langchain_core.messages import BaseMessage, HumanMessage, message_to_dict, messages_from_dict
+from src.config import settings
+from src.services.cache import TTLCache
+import asyncio
+import threading
+import json
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def trim_messages_to_limit(messages: List[BaseMessage], max_messages: Optional[int]) -> List[BaseMessage]:
+    """
+    Keep at most max_messages of the most recent messages.
+
+    The trimmed history always starts at a human turn so the model never sees
+    an assistant reply without the question that prompted it.
+    """
+    if not max_messages:
+        return messages
+
+    trimmed = messages[-max_messages:]
+    while trimmed and not isinstance(trimmed[0], HumanMessage):
+        trimmed = trimmed[1:]
+    return trimmed
+
+
+class BoundedChatMessageHistory(InMemoryChatMessageHistory):
+    """In-memory chat history that keeps only the most recent messages"""
+
+    max_messages: Optional[int] = None
+    on_trim: Optional[Callable[[int], None]] = None
+
+    def add_messages(self, messages: Sequence[BaseMessage]) -> None:
+        """Add messages and drop the oldest ones beyond max_messages"""
+        super().add_messages(messages)
+        trimmed = trim_messages_to_limit(self.messages, self.max_messages)
+        if len(trimmed) != len(self.messages):
+            if self.on_trim:
+                self.on_trim(len(self.messages) - len(trimmed))
+            self.messages = trimmed
+
+
+class SessionStore(ABC):
+    """Interface for chat session storage backends"""
+
+    @abstractmethod
+    def get_history(self, session_id: str, create: bool = True) -> Optional[BaseChatMessageHistory]:
+        """
+        Get the chat history for a session
+
+        Args:
+            session_id: Session identifier
+            create: Create an empty history if the session does not exist
+
+        Returns:
+            The session's chat history, or None if it does not exist and create is False
+        """
+
+    @abstractmethod
+    def clear(self, session_id: str) -> bool:
+        """Clear a session's messages, returning False if the session does not exist"""
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """Return store metrics (size, evictions, etc.)"""
+
+    async def aget_history(self, session_id: str, create: bool = True) -> Optional[BaseChatMessageHistory]:
+        """get_history() for the event loop (stores doing network I/O override it)"""
+        return self.get_history(session_id, create)
+
+    async def aclear(self, session_id: str) -> bool:
+        """clear() for the event loop (stores doing network I/O override it)"""
+        return self.clear(session_id)
+
+
+class InMemorySessionStore(SessionStore):
+    """
+    Process-local session store with LRU eviction and idle expiry.
+
+    Sessions that have not been touched for ttl_seconds are dropped, and once
+    max_sessions is reached the least recently used session is evicted.
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = 10000,
+        ttl_seconds: Optional[float] = 3600,
+        max_messages: Optional[int] = 50
+    ):
+        self.max_messages = max_messages
+        self.trimmed_messages = 0
+        self._sessions = TTLCache(
+            max_size=max_sessions,
+            ttl_seconds=ttl_seconds,
+            sliding=True,
+            on_evict=self._on_evict
+        )
+
+    def _on_evict(self, session_id: str, history: BoundedChatMessageHistory, reason: str) -> None:
+        logger.debug(f"Session {session_id} {reason} ({len(history.messages)} messages)")
+
+    def _on_trim(self, count: int) -> None:
+        self.trimmed_messages += count
+
+    def get_history(self, session_id: str, create: bool = True) -> Optional[BaseChatMessageHistory]:
+        history = self._sessions.get(session_id)
+        if history is None and create:
+            # Opportunistically drop idle sessions before growing the store
+            self._sessions.purge_expired()
+            history = BoundedChatMessageHistory(
+                max_messages=self.max_messages,
+                on_trim=self._on_trim
+            )
+            self._sessions.set(session_id, history)
+        return history
+
+    def clear(self, session_id: str) -> bool:
+        history = self._sessions.get(session_id)
+        if history is None:
+            return False
+        history.clear()
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        cache_stats = self._sessions.stats()
+        return {
+            "backend": "memory",
+            "sessions": cache_stats["size"],
+            "max_sessions": cache_stats["max_size"],
+            "ttl_seconds": cache_stats["ttl_seconds"],
+            "max_messages": self.max_messages,
+            "evicted_lru": cache_stats["evictions"],
+            "evicted_idle": cache_stats["expirations"],
+            "trimmed_messages": self.trimmed_messages
+        }
+
+
+# ==================== SHARED BACKENDS ====================
+
+class SessionBackend(ABC):
+    """
+    Shared storage for serialized chat messages.
+
+    Every mutation of a session bumps its version number, which lets workers
+    validate a locally cached copy with a single cheap lookup.
+    """
+
+    name = "backend"
+
+    @abstractmethod
+    def append(self, session_id: str, messages: List[str]) -> int:
+        """Append serialized messages and return the session's new version"""
+
+    @abstractmethod
+    def read(self, session_id: str) -> Tuple[int, List[str]]:
+        """Return the session's version and all of its serialized messages"""
+
+    @abstractmethod
+    def version(self, session_id: str) -> int:
+        """Return the session's current version (0 if it has never been written)"""
+
+    @abstractmethod
+    def exists(self, session_id: str) -> bool:
+        """Whether the session has any stored messages"""
+
+    @abstractmethod
+    def delete(self, session_id: str) -> bool:
+        """Delete a session's messages, returning False if there were none"""
+
+
+class InMemorySessionBackend(SessionBackend):
+    """
+    Process-local stand-in for a shared backend.
+
+    Behaves like RedisSessionBackend (versioning, trimming, idle expiry) so
+    several TravelAgent instances sharing one instance can simulate workers.
+    """
+
+    name = "memory-shared"
+
+    def __init__(
+        self,
+        max_messages: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.max_messages = max_messages
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._messages: Dict[str, List[str]] = {}
+        self._versions: Dict[str, int] = {}
+        self._expires_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _expire_if_idle(self, session_id: str) -> None:
+        expires_at = self._expires_at.get(session_id)
+        if expires_at is not None and expires_at <= self._clock():
+            self._messages.pop(session_id, None)
+            self._versions.pop(session_id, None)
+            self._expires_at.pop(session_id, None)
+
+    def _touch(self, session_id: str) -> None:
+        if self.ttl_seconds:
+            self._expires_at[session_id] = self._clock() + self.ttl_seconds
+
+    def append(self, session_id: str, messages: List[str]) -> int:
+        with self._lock:
+            self._expire_if_idle(session_id)
+            stored = self._messages.setdefault(session_id, [])
+            stored.extend(messages)
+            if self.max_messages and len(stored) > self.max_messages:
+                del stored[:-self.max_messages]
+            self._versions[session_id] = self._versions.get(session_id, 0) + 1
+            self._touch(session_id)
+            return self._versions[session_id]
+
+    def read(self, session_id: str) -> Tuple[int, List[str]]:
+        with self._lock:
+            self._expire_if_idle(session_id)
+            self._touch(session_id)
+            return self._versions.get(session_id, 0), list(self._messages.get(session_id, []))
+
+    def version(self, session_id: str) -> int:
+        with self._lock:
+            self._expire_if_idle(session_id)
+            self._touch(session_id)
+            return self._versions.get(session_id, 0)
+
+    def exists(self, session_id: str) -> bool:
+        with self._lock:
+            self._expire_if_idle(session_id)
+            return bool(self._messages.get(session_id))
+
+    def delete(self, session_id: str) -> bool:
+        with self._lock:
+            self._expire_if_idle(session_id)
+            existed = bool(self._messages.pop(session_id, None))
+            self._versions[session_id] = self._versions.get(session_id, 0) + 1
+            self._touch(session_id)
+            return existed
+
+
+class RedisSessionBackend(SessionBackend):
+    """
+    Redis-backed session storage shared by all workers and instances.
+
+    Each session uses a list of JSON messages plus a version counter, both
+    expiring after ttl_seconds of inactivity.
+    """
+
+    name = "redis"
+
+    def __init__(
+        self,
+        url: str,
+        max_messages: Optional[int] = None,
+        ttl_seconds: Optional[int] = None,
+        key_prefix: str = "gotravel:session:",
+        client: Any = None
+    ):
+        if client is None:
+            try:
+                import redis
+            except ImportError as e:
+                raise ImportError(
+                    "The 'redis' package is required for SESSION_BACKEND=redis"
+                ) from e
+            client = redis.Redis.from_url(url, decode_responses=True)
+
+        self.client = client
+        self.max_messages = max_messages
+        self.ttl_seconds = ttl_seconds
+        self.key_prefix = key_prefix
+
+    def _keys(self, session_id: str) -> Tuple[str, str]:
+        base = f"{self.key_prefix}{session_id}"
+        return f"{base}:messages", f"{base}:version"
+
+    def _expire(self, pipe: Any, *keys: str) -> None:
+        if self.ttl_seconds:
+            for key in keys:
+                pipe.expire(key, self.ttl_seconds)
+
+    def append(self, session_id: str, messages: List[str]) -> int:
+        messages_key, version_key = self._keys(session_id)
+        pipe = self.client.pipeline(transaction=True)
+        pipe.rpush(messages_key, *messages)
+        if self.max_messages:
+            pipe.ltrim(messages_key, -self.max_messages, -1)
+        pipe.incr(version_key)
+        self._expire(pipe, messages_key, version_key)
+        results = pipe.execute()
+        return int(results[2 if self.max_messages else 1])
+
+    def read(self, session_id: str) -> Tuple[int, List[str]]:
+        messages_key, version_key = self._keys(session_id)
+        pipe = self.client.pipeline(transaction=True)
+        pipe.get(version_key)
+        pipe.lrange(messages_key, 0, -1)
+        self._expire(pipe, messages_key, version_key)
+        results = pipe.execute()
+        return int(results[0] or 0), list(results[1])
+
+    def version(self, session_id: str) -> int:
+        messages_key, version_key = self._keys(session_id)
+        pipe = self.client.pipeline(transaction=False)
+        pipe.get(version_key)
+        self._expire(pipe, messages_key, version_key)
+        return int(pipe.execute()[0] or 0)
+
+    def exists(self, session_id: str) -> bool:
+        messages_key, _ = self._keys(session_id)
+        return bool(self.client.exists(messages_key))
+
+    def delete(self, session_id: str) -> bool:
+        messages_key, version_key = self._keys(session_id)
+        pipe = self.client.pipeline(transaction=True)
+        pipe.delete(messages_key)
+        pipe.incr(version_key)
+        self._expire(pipe, version_key)
+        return bool(pipe.execute()[0])
+
+
+class SharedChatMessageHistory(BaseChatMessageHistory):
+    """
+    Chat history stored in a SessionBackend with a local read-through cache.
+
+    Reads cost one version lookup while the cached copy is current; the full
+    message list is only fetched after another worker has changed the session.
+    The async methods run those blocking backend calls in a worker thread, so
+    a remote Redis never stalls the event loop.
+    """
+
+    def __init__(
+        self,
+        session_id: str,
+        backend: SessionBackend,
+        cache: TTLCache,
+        max_messages: Optional[int] = None
+    ):
+        self.session_id = session_id
+        self.backend = backend
+        self.cache = cache
+        self.max_messages = max_messages
+
+    @property
+    def messages(self) -> List[BaseMessage]:
+        """Messages for this session, served from cache when still current"""
+        cached = self.cache.get(self.session_id)
+        if cached is not None:
+            version, messages = cached
+            if version == self.backend.version(self.session_id):
+                return list(messages)
+
+        version, raw = self.backend.read(self.session_id)
+        messages = trim_messages_to_limit(
+            messages_from_dict([json.loads(item) for item in raw]),
+            self.max_messages
+        )
+        self.cache.set(self.session_id, (version, messages))
+        return list(messages)
+
+    async def aget_messages(self) -> List[BaseMessage]:
+        """messages, read off the event loop (backend calls are blocking network I/O)"""
+        return await asyncio.to_thread(lambda: self.messages)
+
+    async def aadd_messages(self, messages: Sequence[BaseMessage]) -> None:
+        """add_messages(), run off the event loop"""
+        await asyncio.to_thread(self.add_messages, messages)
+
+    async def aclear(self) -> None:
+        """clear(), run off the event loop"""
+        await asyncio.to_thread(self.clear)
+
+    def add_messages(self, messages: Sequence[BaseMessage]) -> None:
+        """Append messages to the backend and keep the local copy in step"""
+        cached = self.cache.get(self.session_id)
+        new_version = self.backend.append(
+            self.session_id,
+            [json.dumps(message_to_dict(m)) for m in messages]
+        )
+
+        if cached is not None and cached[0] == new_version - 1:
+            # Nobody else wrote in between, so extend the cached copy in place
+            updated = trim_messages_to_limit(cached[1] + list(messages), self.max_messages)
+            self.cache.set(self.session_id, (new_version, updated))
+        else:
+            self.cache.pop(self.session_id)
+
+    def clear(self) -> None:
+        """Delete this session's messages from the backend"""
+        self.backend.delete(self.session_id)
+        self.cache.pop(self.session_id)
+
+
+class SharedSessionStore(SessionStore):
+    """Session store backed by a SessionBackend shared across workers"""
+
+    def __init__(
+        self,
+        backend: SessionBackend,
+        cache_size: int = 1000,
+        ttl_seconds: Optional[float] = 3600,
+        max_messages: Optional[int] = 50
+    ):
+        self.backend = backend
+        self.max_messages = max_messages
+        self._cache = TTLCache(max_size=cache_size, ttl_seconds=ttl_seconds, sliding=True)
+
+    def get_history(self, session_id: str, create: bool = True) -> Optional[BaseChatMessageHistory]:
+        if not create and not self.backend.exists(session_id):
+            return None
+        return SharedChatMessageHistory(
+            session_id,
+            self.backend,
+            self._cache,
+            max_messages=self.max_messages
+        )
+
+    def clear(self, session_id: str) -> bool:
+        self._cache.pop(session_id)
+        return self.backend.delete(session_id)
+
+    async def aget_history(self, session_id: str, create: bool = True) -> Optional[BaseChatMessageHistory]:
+        # Only the existence check touches the backend
+        if not create and not await asyncio.to_thread(self.backend.exists, session_id):
+            return None
+        return self.get_history(session_id)
+
+    async def aclear(self, session_id: str) -> bool:
+        return await asyncio.to_thread(self.clear, session_id)
+
+    def stats(self) -> Dict[str, Any]:
+        cache_stats = self._cache.stats()
+        return {
+            "backend": self.backend.name,
+            "max_messages": self.max_messages,
+            "local_cache": {
+                "size": cache_stats["size"],
+                "max_size": cache_stats["max_size"],
+                "hits": cache_stats["hits"],
+                "misses": cache_stats["misses"],
+                "evictions": cache_stats["evictions"],
+                "expirations": cache_stats["expirations"]
+            }
+        }
+
+
+def create_session_store() -> SessionStore:
+    """Create the session store configured in settings"""
+    ttl_seconds = settings.session_ttl_seconds or None
+    max_messages = settings.session_max_messages or None
+
+    if settings.session_backend == "redis":
+        backend = RedisSessionBackend(
+            settings.redis_url,
+            max_messages=max_messages,
+            ttl_seconds=ttl_seconds
+        )
+        return SharedSessionStore(
+            backend,
+            cache_size=settings.session_cache_size,
+            ttl_seconds=ttl_seconds,
+            max_messages=max_messages
+        )
+
+    return InMemorySessionStore(
+        max_sessions=settings.session_max_count,
+        ttl_seconds=ttl_seconds,
+        max_messages=max_messages
+    )
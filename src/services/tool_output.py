@@ -0,0 +1,117 @@
+"""
+Tool Output Encoding
+Compact, size-budgeted JSON for tool results (they become prompt tokens on the next LLM call)
+"""
+from typing import Any, Dict, Optional
+from src.config import settings
+import json
+
+
+# Verbose field names replaced by shorter ones the LLM still reads unambiguously
+SHORT_KEYS = {
+    "description": "desc",
+    "reviews_count": "reviews",
+    "duration_days": "days",
+    "available_slots": "slots",
+    "available_count": "available",
+    "max_participants": "max_people",
+    "included_services": "includes",
+    "price_per_night": "nightly_price",
+    "feels_like": "feels",
+    "wind_speed": "wind",
+    "payment_status": "payment",
+}
+
+# Per-tool byte budgets (roughly 4 bytes per token); others use settings.tool_output_max_bytes
+TOOL_OUTPUT_BUDGETS = {
+    "get_hotel_rooms": 2000,
+    "get_user_favorites": 2000,
+    "get_weather": 600,
+    "create_booking": 800,
+}
+
+# Text fields shortened first, then dropped, when an output is over budget
+TRIMMABLE_FIELDS = ("desc",)
+TRIMMED_TEXT_CHARS = 80
+
+
+def _compact(value: Any) -> Any:
+    """Drop empty values and shorten keys, recursively"""
+    if isinstance(value, dict):
+        return {
+            SHORT_KEYS.get(key, key): _compact(item)
+            for key, item in value.items()
+            if item is not None and item != "" and item != []
+        }
+    if isinstance(value, list):
+        return [_compact(item) for item in value]
+    return value
+
+
+def _dumps(payload: Dict[str, Any]) -> str:
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+
+
+def _size(text: str) -> int:
+    return len(text.encode("utf-8"))
+
+
+def _trim_items(payload: Dict[str, Any], budget: int) -> str:
+    """Shorten, then drop, long text fields, then drop trailing items until it fits"""
+    items = payload["data"]
+
+    for field in TRIMMABLE_FIELDS:
+        for item in items:
+            text = item.get(field) if isinstance(item, dict) else None
+            if isinstance(text, str) and len(text) > TRIMMED_TEXT_CHARS:
+                item[field] = text[:TRIMMED_TEXT_CHARS].rstrip() + "…"
+        encoded = _dumps(payload)
+        if _size(encoded) <= budget:
+            return encoded
+
+        for item in items:
+            if isinstance(item, dict):
+                item.pop(field, None)
+        encoded = _dumps(payload)
+        if _size(encoded) <= budget:
+            return encoded
+
+    total = len(items)
+    while len(payload["data"]) > 1:
+        payload["data"] = payload["data"][:-1]
+        payload["omitted"] = total - len(payload["data"])
+        encoded = _dumps(payload)
+        if _size(encoded) <= budget:
+            return encoded
+
+    # A single item over budget is still sent whole rather than as broken JSON
+    return _dumps(payload)
+
+
+def encode_tool_output(payload: Dict[str, Any], tool: Optional[str] = None) -> str:
+    """
+    Serialize a tool result for the LLM
+
+    Emits compact JSON (no indentation, null/empty fields dropped, short keys)
+    and enforces the tool's byte budget by shortening descriptions and then
+    omitting trailing items from "data" (reported as "omitted").
+
+    Args:
+        payload: Result dictionary ({"success": ..., "data": ...})
+        tool: Tool name used to look up its budget
+
+    Returns:
+        JSON string
+    """
+    if not settings.tool_output_compact:
+        return json.dumps(payload, indent=2)
+
+    compacted = _compact(payload)
+    encoded = _dumps(compacted)
+
+    budget = TOOL_OUTPUT_BUDGETS.get(tool, settings.tool_output_max_bytes)
+    if budget <= 0 or _size(encoded) <= budget:
+        return encoded
+    if not isinstance(compacted.get("data"), list) or not compacted["data"]:
+        return encoded
+    return _trim_items(compacted, budget)
@@ -0,0 +1,112 @@
+"""
+Per-Turn Tool Selection
+Binds only the tools relevant to a message so each LLM call carries fewer tool schemas
+"""
+from typing import Any, Dict, Iterable, List, Optional
+from dataclasses import dataclass, field
+from src.services.cache import TTLCache
+from src.utils.helpers import match_intents
+
+
+# Tools offered for each intent from match_intents; weather rides along with
+# destination questions because trip planning often asks for both
+INTENT_TOOLS = {
+    "hotel": ["search_hotels", "get_hotel_rooms", "get_hotels_by_price", "get_weather"],
+    "package": ["search_packages", "get_cheapest_packages", "get_packages_by_price", "get_weather"],
+    "place": ["search_places", "get_popular_places", "get_weather"],
+    "weather": ["get_weather", "search_places"],
+    "booking": ["create_booking", "search_hotels", "get_hotel_rooms", "search_packages"],
+}
+
+FAVORITE_WORDS = ("favorite", "favourite", "saved", "bookmark", "wishlist")
+
+
+@dataclass
+class ToolSelection:
+    """Tools chosen for one turn (tool_names is None for the full set)"""
+    tool_names: Optional[List[str]]
+    intents: List[str] = field(default_factory=list)
+
+    def as_metadata(self, total_tools: int) -> Dict[str, Any]:
+        return {
+            "bound": len(self.tool_names) if self.tool_names else total_tools,
+            "intents": self.intents,
+            "full_set": self.tool_names is None
+        }
+
+
+class ToolSelector:
+    """
+    Picks the tool subset for a turn from the message's intents plus the
+    tools the session used in its recent turns (so follow-ups like "book
+    the second one" keep the tools they depend on).
+
+    Falls back to the full tool set when no intent is recognized, so
+    ambiguous or small-talk messages behave exactly as before.
+    """
+
+    def __init__(
+        self,
+        all_tool_names: Iterable[str],
+        max_sessions: int = 10000,
+        ttl_seconds: Optional[float] = 3600,
+        recent_turns: int = 2
+    ):
+        """
+        Args:
+            all_tool_names: Names of every available tool
+            max_sessions: Sessions whose recent tool usage is remembered
+            ttl_seconds: Idle time after which a session's usage is forgotten
+            recent_turns: Number of previous turns whose tools stay bound
+        """
+        self.all_tool_names = list(all_tool_names)
+        self.recent_turns = recent_turns
+        self._recent = TTLCache(max_size=max_sessions, ttl_seconds=ttl_seconds, sliding=True)
+
+        # Metrics
+        self.turns = 0
+        self.full_set_turns = 0
+        self.bound_tools = 0
+
+    def select(self, message: str, session_id: str) -> ToolSelection:
+        """Choose the tools to bind for a message"""
+        intents = match_intents(message)
+        names = set()
+        for intent in intents:
+            names.update(INTENT_TOOLS[intent])
+        if any(word in message.lower() for word in FAVORITE_WORDS):
+            names.add("get_user_favorites")
+
+        self.turns += 1
+        if not names:
+            self.full_set_turns += 1
+            self.bound_tools += len(self.all_tool_names)
+            return ToolSelection(tool_names=None, intents=intents)
+
+        for turn_tools in self._recent.get(session_id) or []:
+            names.update(turn_tools)
+
+        # Keep the original tool order so equal subsets share one executor
+        selected = [name for name in self.all_tool_names if name in names]
+        if len(selected) == len(self.all_tool_names):
+            self.full_set_turns += 1
+            selected = None
+        self.bound_tools += len(selected or self.all_tool_names)
+        return ToolSelection(tool_names=selected, intents=intents)
+
+    def record_usage(self, session_id: str, tools_used: List[Dict[str, Any]]) -> None:
+        """Remember which tools a turn used"""
+        used = [t["tool"] for t in tools_used if t["tool"] in self.all_tool_names]
+        if not used:
+            return
+        recent = (self._recent.get(session_id) or []) + [used]
+        self._recent.set(session_id, recent[-self.recent_turns:])
+
+    def stats(self) -> Dict[str, Any]:
+        """How often subsets were used and their average size"""
+        return {
+            "total_tools": len(self.all_tool_names),
+            "turns": self.turns,
+            "full_set_turns": self.full_set_turns,
+            "avg_bound_tools": round(self.bound_tools / self.turns, 2) if self.turns else 0.0
+        }
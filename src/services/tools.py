@@ -2,23 +2,139 @@
 LangChain Tools for Travel Assistant
 Defines all tools that the AI agent can use to fetch data and perform actions
 """
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Awaitable
 from langchain.tools import tool
-from src.services.database import supabase_client
+from langchain_core.tools import BaseTool
+from src.services.database import (
+    supabase_client,
+    async_supabase_client,
+    HOTEL_SUMMARY,
+    ROOM_SUMMARY,
+    PACKAGE_SUMMARY,
+    PACKAGE_PRICING,
+    PLACE_CARD,
+    FAVORITE_SUMMARY
+)
+from src.services.tool_output import encode_tool_output
+from src.services.turn_context import current_turn
 from src.config import settings
+import functools
 import httpx
-import json
+import uuid
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+# Tools with side effects are never served from the per-turn memo
+UNMEMOIZED_TOOLS = {"create_booking"}
+
+# Async implementations by tool name, callable outside the turn's run_tool
+# bookkeeping (used to prefetch results into the turn's memo)
+ASYNC_IMPLEMENTATIONS: Dict[str, Callable[..., Awaitable[str]]] = {}
+
+
+def async_variant(sync_tool: BaseTool) -> Callable[[Callable[..., Awaitable[str]]], Callable[..., Awaitable[str]]]:
+    """
+    Register a coroutine as the async implementation of a tool.
+    
+    AgentExecutor.ainvoke runs tools through their coroutine when one is set,
+    so the async variants keep database and HTTP I/O off the event loop's
+    critical path instead of blocking a worker thread per call.
+    
+    Inside an agent turn, calls from the same LLM step run concurrently up to
+    the turn's parallel-tool limit, each call's duration is recorded, and
+    repeated identical calls are served from the turn's memo.
+    """
+    def decorator(coroutine: Callable[..., Awaitable[str]]) -> Callable[..., Awaitable[str]]:
+        @functools.wraps(coroutine)
+        async def run_in_turn(*args: Any, **kwargs: Any) -> str:
+            turn = current_turn()
+            if turn is None:
+                return await coroutine(*args, **kwargs)
+            
+            return await turn.run_tool(
+                sync_tool.name,
+                kwargs,
+                lambda: coroutine(*args, **kwargs),
+                memoize=not args and sync_tool.name not in UNMEMOIZED_TOOLS
+            )
+        
+        sync_tool.coroutine = run_in_turn
+        ASYNC_IMPLEMENTATIONS[sync_tool.name] = coroutine
+        return coroutine
+    return decorator
+
+
 # ==================== HOTEL TOOLS ====================
 
+def _format_hotel(hotel: Dict[str, Any]) -> Dict[str, Any]:
+    """Format a hotel record for the LLM"""
+    return {
+        "id": hotel.get("id"),
+        "name": hotel.get("name"),
+        "city": hotel.get("city"),
+        "country": hotel.get("country"),
+        "address": hotel.get("address"),
+        "rating": hotel.get("rating"),
+        "reviews_count": hotel.get("reviews_count"),
+        "phone": hotel.get("phone"),
+        "email": hotel.get("contact_email"),
+        "description": hotel.get("description", "")[:200] + "..." if hotel.get("description") else ""
+    }
+
+
+def _format_hotel_search(hotels: List[Dict[str, Any]], city: Optional[str], country: Optional[str]) -> str:
+    if not hotels:
+        return encode_tool_output({
+            "success": False,
+            "message": f"No hotels found matching the criteria: city={city}, country={country}",
+            "data": []
+        })
+    
+    # Format hotel data for better readability
+    formatted_hotels = [_format_hotel(hotel) for hotel in hotels]
+    
+    return encode_tool_output({
+        "success": True,
+        "count": len(formatted_hotels),
+        "data": formatted_hotels
+    }, tool="search_hotels")
+
+
+def _format_rooms(rooms: List[Dict[str, Any]], hotel_id: str) -> str:
+    if not rooms:
+        return encode_tool_output({
+            "success": False,
+            "message": f"No available rooms found for hotel ID: {hotel_id}",
+            "data": []
+        })
+    
+    formatted_rooms = []
+    for room in rooms:
+        formatted_rooms.append({
+            "id": room.get("id"),
+            "room_type": room.get("room_type"),
+            "price_per_night": room.get("price_per_night"),
+            "currency": room.get("currency"),
+            "capacity": room.get("capacity"),
+            "bed_type": room.get("bed_type"),
+            "amenities": room.get("amenities", []),
+            "available_count": room.get("available_count")
+        })
+    
+    return encode_tool_output({
+        "success": True,
+        "count": len(formatted_rooms),
+        "data": formatted_rooms
+    }, tool="get_hotel_rooms")
+
+
 @tool
 def search_hotels(
     city: Optional[str] = None,
-    country: Optional[str] = None
+    country: Optional[str] = None,
+    keywords: Optional[str] = None
 ) -> str:
     """
     Search for hotels based on location criteria.
@@ -27,10 +143,12 @@ def search_hotels(
     - Hotels in a specific city or country
     - Accommodations
     - Places to stay
+    - Hotels with particular features (e.g., "beachfront", "rooftop pool")
     
     Args:
         city: City name to search hotels in (e.g., "Dhaka", "Cox's Bazar")
         country: Country name to search hotels in (e.g., "Bangladesh")
+        keywords: Free-text features to match in hotel names and descriptions, best match first
     
     Returns:
         JSON string with list of hotels including name, location, rating, price, and amenities
@@ -39,40 +157,34 @@ def search_hotels(
         hotels = supabase_client.search_hotels(
             city=city,
             country=country,
-            limit=10
+            text=keywords,
+            limit=10,
+            columns=HOTEL_SUMMARY
         )
-        
-        if not hotels:
-            return json.dumps({
-                "success": False,
-                "message": f"No hotels found matching the criteria: city={city}, country={country}",
-                "data": []
-            })
-        
-        # Format hotel data for better readability
-        formatted_hotels = []
-        for hotel in hotels:
-            formatted_hotels.append({
-                "id": hotel.get("id"),
-                "name": hotel.get("name"),
-                "city": hotel.get("city"),
-                "country": hotel.get("country"),
-                "address": hotel.get("address"),
-                "rating": hotel.get("rating"),
-                "reviews_count": hotel.get("reviews_count"),
-                "phone": hotel.get("phone"),
-                "email": hotel.get("contact_email"),
-                "description": hotel.get("description", "")[:200] + "..." if hotel.get("description") else ""
-            })
-        
-        return json.dumps({
-            "success": True,
-            "count": len(formatted_hotels),
-            "data": formatted_hotels
-        }, indent=2)
+        return _format_hotel_search(hotels, city, country)
     except Exception as e:
         logger.error(f"Error in search_hotels tool: {e}")
-        return json.dumps({"success": False, "error": str(e)})
+        return encode_tool_output({"success": False, "error": str(e)})
+
+
+@async_variant(search_hotels)
+async def _search_hotels_async(
+    city: Optional[str] = None,
+    country: Optional[str] = None,
+    keywords: Optional[str] = None
+) -> str:
+    try:
+        hotels = await async_supabase_client.search_hotels(
+            city=city,
+            country=country,
+            text=keywords,
+            limit=10,
+            columns=HOTEL_SUMMARY
+        )
+        return _format_hotel_search(hotels, city, country)
+    except Exception as e:
+        logger.error(f"Error in search_hotels tool: {e}")
+        return encode_tool_output({"success": False, "error": str(e)})
 
 
 @tool
@@ -92,47 +204,128 @@ def get_hotel_rooms(hotel_id: str) -> str:
         JSON string with list of available rooms with type, price, capacity, and amenities
     """
     try:
-        rooms = supabase_client.get_hotel_rooms(hotel_id)
-        
-        if not rooms:
-            return json.dumps({
-                "success": False,
-                "message": f"No available rooms found for hotel ID: {hotel_id}",
-                "data": []
-            })
-        
-        formatted_rooms = []
-        for room in rooms:
-            formatted_rooms.append({
-                "id": room.get("id"),
-                "room_type": room.get("room_type"),
-                "price_per_night": room.get("price_per_night"),
-                "currency": room.get("currency"),
-                "capacity": room.get("capacity"),
-                "bed_type": room.get("bed_type"),
-                "amenities": room.get("amenities", []),
-                "available_count": room.get("available_count")
-            })
-        
-        return json.dumps({
-            "success": True,
-            "count": len(formatted_rooms),
-            "data": formatted_rooms
-        }, indent=2)
+        rooms = supabase_client.get_hotel_rooms(hotel_id, columns=ROOM_SUMMARY)
+        return _format_rooms(rooms, hotel_id)
     except Exception as e:
         logger.error(f"Error in get_hotel_rooms tool: {e}")
-        return json.dumps({"success": False, "error": str(e)})
+        return encode_tool_output({"success": False, "error": str(e)})
+
+
+@async_variant(get_hotel_rooms)
+async def _get_hotel_rooms_async(hotel_id: str) -> str:
+    try:
+        rooms = await async_supabase_client.get_hotel_rooms(hotel_id, columns=ROOM_SUMMARY)
+        return _format_rooms(rooms, hotel_id)
+    except Exception as e:
+        logger.error(f"Error in get_hotel_rooms tool: {e}")
+        return encode_tool_output({"success": False, "error": str(e)})
 
 
 # ==================== PACKAGE TOOLS ====================
 
+def _format_package_search(packages: List[Dict[str, Any]]) -> str:
+    if not packages:
+        return encode_tool_output({
+            "success": False,
+            "message": f"No packages found matching the criteria",
+            "data": []
+        })
+    
+    formatted_packages = []
+    for pkg in packages:
+        formatted_packages.append({
+            "id": pkg.get("id"),
+            "name": pkg.get("name"),
+            "destination": pkg.get("destination"),
+            "country": pkg.get("country"),
+            "category": pkg.get("category"),
+            "duration_days": pkg.get("duration_days"),
+            "price": pkg.get("price"),
+            "currency": pkg.get("currency"),
+            "max_participants": pkg.get("max_participants"),
+            "available_slots": pkg.get("available_slots"),
+            "rating": pkg.get("rating"),
+            "reviews_count": pkg.get("reviews_count"),
+            "included_services": pkg.get("included_services", []),
+            "description": pkg.get("description", "")[:200] + "..." if pkg.get("description") else ""
+        })
+    
+    return encode_tool_output({
+        "success": True,
+        "count": len(formatted_packages),
+        "data": formatted_packages
+    }, tool="search_packages")
+
+
+def _format_cheapest_packages(packages: List[Dict[str, Any]]) -> str:
+    if not packages:
+        return encode_tool_output({
+            "success": False,
+            "message": "No packages available",
+            "data": []
+        })
+    
+    formatted_packages = []
+    for pkg in packages:
+        formatted_packages.append({
+            "id": pkg.get("id"),
+            "name": pkg.get("name"),
+            "destination": pkg.get("destination"),
+            "duration_days": pkg.get("duration_days"),
+            "price": pkg.get("price"),
+            "currency": pkg.get("currency"),
+            "category": pkg.get("category"),
+            "available_slots": pkg.get("available_slots"),
+            "description": pkg.get("description", "")[:150] + "..."
+        })
+    
+    return encode_tool_output({
+        "success": True,
+        "count": len(formatted_packages),
+        "data": formatted_packages
+    }, tool="get_cheapest_packages")
+
+
+def _format_packages_by_price(packages: List[Dict[str, Any]], sort_order: str) -> str:
+    if not packages:
+        return encode_tool_output({
+            "success": False,
+            "message": "No packages available",
+            "data": []
+        })
+    
+    formatted_packages = []
+    for pkg in packages:
+        formatted_packages.append({
+            "id": pkg.get("id"),
+            "name": pkg.get("name"),
+            "destination": pkg.get("destination"),
+            "duration_days": pkg.get("duration_days"),
+            "price": pkg.get("price"),
+            "currency": pkg.get("currency"),
+            "category": pkg.get("category"),
+            "available_slots": pkg.get("available_slots"),
+            "rating": pkg.get("rating"),
+            "reviews_count": pkg.get("reviews_count"),
+            "description": pkg.get("description", "")[:150] + "..."
+        })
+    
+    return encode_tool_output({
+        "success": True,
+        "sort_order": sort_order,
+        "count": len(formatted_packages),
+        "data": formatted_packages
+    }, tool="get_packages_by_price")
+
+
 @tool
 def search_packages(
     destination: Optional[str] = None,
     country: Optional[str] = None,
     category: Optional[str] = None,
     max_price: Optional[float] = None,
-    duration_days: Optional[int] = None
+    duration_days: Optional[int] = None,
+    keywords: Optional[str] = None
 ) -> str:
     """
     Search for travel packages based on various criteria.
@@ -148,6 +341,8 @@ def search_packages(
         category: Package category (e.g., "adventure", "luxury", "beach", "cultural")
         max_price: Maximum price filter
         duration_days: Package duration in days
+        keywords: Free-text interests to match in package names and descriptions,
+            best match first (e.g., "tea garden trek", "boat safari")
     
     Returns:
         JSON string with list of packages including name, destination, price, duration, and details
@@ -159,43 +354,40 @@ def search_packages(
             category=category,
             max_price=max_price,
             duration_days=duration_days,
-            limit=10
+            text=keywords,
+            limit=10,
+            columns=PACKAGE_SUMMARY
         )
-        
-        if not packages:
-            return json.dumps({
-                "success": False,
-                "message": f"No packages found matching the criteria",
-                "data": []
-            })
-        
-        formatted_packages = []
-        for pkg in packages:
-            formatted_packages.append({
-                "id": pkg.get("id"),
-                "name": pkg.get("name"),
-                "destination": pkg.get("destination"),
-                "country": pkg.get("country"),
-                "category": pkg.get("category"),
-                "duration_days": pkg.get("duration_days"),
-                "price": pkg.get("price"),
-                "currency": pkg.get("currency"),
-                "max_participants": pkg.get("max_participants"),
-                "available_slots": pkg.get("available_slots"),
-                "rating": pkg.get("rating"),
-                "reviews_count": pkg.get("reviews_count"),
-                "included_services": pkg.get("included_services", []),
-                "description": pkg.get("description", "")[:200] + "..." if pkg.get("description") else ""
-            })
-        
-        return json.dumps({
-            "success": True,
-            "count": len(formatted_packages),
-            "data": formatted_packages
-        }, indent=2)
+        return _format_package_search(packages)
+    except Exception as e:
+        logger.error(f"Error in search_packages tool: {e}")
+        return encode_tool_output({"success": False, "error": str(e)})
+
+
+@async_variant(search_packages)
+async def _search_packages_async(
+    destination: Optional[str] = None,
+    country: Optional[str] = None,
+    category: Optional[str] = None,
+    max_price: Optional[float] = None,
+    duration_days: Optional[int] = None,
+    keywords: Optional[str] = None
+) -> str:
+    try:
+        packages = await async_supabase_client.search_packages(
+            destination=destination,
+            country=country,
+            category=category,
+            max_price=max_price,
+            duration_days=duration_days,
+            text=keywords,
+            limit=10,
+            columns=PACKAGE_SUMMARY
+        )
+        return _format_package_search(packages)
     except Exception as e:
         logger.error(f"Error in search_packages tool: {e}")
-        return json.dumps({"success": False, "error": str(e)})
+        return encode_tool_output({"success": False, "error": str(e)})
 
 
 @tool
@@ -212,37 +404,21 @@ def get_cheapest_packages() -> str:
         JSON string with list of cheapest packages
     """
     try:
-        packages = supabase_client.get_cheapest_packages(limit=5)
-        
-        if not packages:
-            return json.dumps({
-                "success": False,
-                "message": "No packages available",
-                "data": []
-            })
-        
-        formatted_packages = []
-        for pkg in packages:
-            formatted_packages.append({
-                "id": pkg.get("id"),
-                "name": pkg.get("name"),
-                "destination": pkg.get("destination"),
-                "duration_days": pkg.get("duration_days"),
-                "price": pkg.get("price"),
-                "currency": pkg.get("currency"),
-                "category": pkg.get("category"),
-                "available_slots": pkg.get("available_slots"),
-                "description": pkg.get("description", "")[:150] + "..."
-            })
-        
-        return json.dumps({
-            "success": True,
-            "count": len(formatted_packages),
-            "data": formatted_packages
-        }, indent=2)
+        packages = supabase_client.get_cheapest_packages(limit=5, columns=PACKAGE_SUMMARY)
+        return _format_cheapest_packages(packages)
     except Exception as e:
         logger.error(f"Error in get_cheapest_packages tool: {e}")
-        return json.dumps({"success": False, "error": str(e)})
+        return encode_tool_output({"success": False, "error": str(e)})
+
+
+@async_variant(get_cheapest_packages)
+async def _get_cheapest_packages_async() -> str:
+    try:
+        packages = await async_supabase_client.get_cheapest_packages(limit=5, columns=PACKAGE_SUMMARY)
+        return _format_cheapest_packages(packages)
+    except Exception as e:
+        logger.error(f"Error in get_cheapest_packages tool: {e}")
+        return encode_tool_output({"success": False, "error": str(e)})
 
 
 @tool
@@ -264,50 +440,100 @@ def get_packages_by_price(sort_order: str = "low_to_high") -> str:
     """
     try:
         ascending = sort_order.lower() == "low_to_high"
-        packages = supabase_client.get_packages_sorted_by_price(ascending=ascending, limit=10)
-        
-        if not packages:
-            return json.dumps({
-                "success": False,
-                "message": "No packages available",
-                "data": []
-            })
-        
-        formatted_packages = []
-        for pkg in packages:
-            formatted_packages.append({
-                "id": pkg.get("id"),
-                "name": pkg.get("name"),
-                "destination": pkg.get("destination"),
-                "duration_days": pkg.get("duration_days"),
-                "price": pkg.get("price"),
-                "currency": pkg.get("currency"),
-                "category": pkg.get("category"),
-                "available_slots": pkg.get("available_slots"),
-                "rating": pkg.get("rating"),
-                "reviews_count": pkg.get("reviews_count"),
-                "description": pkg.get("description", "")[:150] + "..."
-            })
-        
-        return json.dumps({
-            "success": True,
-            "sort_order": sort_order,
-            "count": len(formatted_packages),
-            "data": formatted_packages
-        }, indent=2)
+        packages = supabase_client.get_packages_sorted_by_price(
+            ascending=ascending,
+            limit=10,
+            columns=PACKAGE_SUMMARY
+        )
+        return _format_packages_by_price(packages, sort_order)
     except Exception as e:
         logger.error(f"Error in get_packages_by_price tool: {e}")
-        return json.dumps({"success": False, "error": str(e)})
+        return encode_tool_output({"success": False, "error": str(e)})
+
+
+@async_variant(get_packages_by_price)
+async def _get_packages_by_price_async(sort_order: str = "low_to_high") -> str:
+    try:
+        ascending = sort_order.lower() == "low_to_high"
+        packages = await async_supabase_client.get_packages_sorted_by_price(
+            ascending=ascending,
+            limit=10,
+            columns=PACKAGE_SUMMARY
+        )
+        return _format_packages_by_price(packages, sort_order)
+    except Exception as e:
+        logger.error(f"Error in get_packages_by_price tool: {e}")
+        return encode_tool_output({"success": False, "error": str(e)})
 
 
 # ==================== PLACE TOOLS ====================
 
+def _format_place_search(places: List[Dict[str, Any]]) -> str:
+    if not places:
+        return encode_tool_output({
+            "success": False,
+            "message": f"No places found matching the criteria",
+            "data": []
+        })
+    
+    formatted_places = []
+    for place in places:
+        formatted_places.append({
+            "id": place.get("id"),
+            "name": place.get("name"),
+            "city": place.get("city"),
+            "country": place.get("country"),
+            "category": place.get("category"),
+            "rating": place.get("rating"),
+            "famous_for": place.get("famous_for", []),
+            "activities": place.get("activities", []),
+            "best_time_to_visit": place.get("best_time_to_visit"),
+            "description": place.get("description", "")[:200] + "..." if place.get("description") else ""
+        })
+    
+    return encode_tool_output({
+        "success": True,
+        "count": len(formatted_places),
+        "data": formatted_places
+    }, tool="search_places")
+
+
+def _format_popular_places(places: List[Dict[str, Any]]) -> str:
+    if not places:
+        return encode_tool_output({
+            "success": False,
+            "message": "No popular places found",
+            "data": []
+        })
+    
+    formatted_places = []
+    for place in places:
+        formatted_places.append({
+            "id": place.get("id"),
+            "name": place.get("name"),
+            "city": place.get("city"),
+            "country": place.get("country"),
+            "category": place.get("category"),
+            "rating": place.get("rating"),
+            "popular_ranking": place.get("popular_ranking"),
+            "famous_for": place.get("famous_for", []),
+            "description": place.get("description", "")[:150] + "..."
+        })
+    
+    return encode_tool_output({
+        "success": True,
+        "count": len(formatted_places),
+        "data": formatted_places
+    }, tool="get_popular_places")
+
+
 @tool
 def search_places(
     country: Optional[str] = None,
     city: Optional[str] = None,
     category: Optional[str] = None,
-    near_city: Optional[str] = None
+    near_city: Optional[str] = None,
+    keywords: Optional[str] = None
 ) -> str:
     """
     Search for tourist places and destinations.
@@ -322,6 +548,8 @@ def search_places(
         city: City name (e.g., "Dhaka")
         category: Place category (e.g., "beach", "mountain", "historical", "cultural")
         near_city: Find places near this city
+        keywords: Free-text interests to match in place names and descriptions,
+            best match first (e.g., "waterfall", "ancient temple")
     
     Returns:
         JSON string with list of places including name, location, category, and activities
@@ -332,39 +560,38 @@ def search_places(
             city=city,
             category=category,
             near_city=near_city,
-            limit=10
+            text=keywords,
+            limit=10,
+            columns=PLACE_CARD
         )
-        
-        if not places:
-            return json.dumps({
-                "success": False,
-                "message": f"No places found matching the criteria",
-                "data": []
-            })
-        
-        formatted_places = []
-        for place in places:
-            formatted_places.append({
-                "id": place.get("id"),
-                "name": place.get("name"),
-                "city": place.get("city"),
-                "country": place.get("country"),
-                "category": place.get("category"),
-                "rating": place.get("rating"),
-                "famous_for": place.get("famous_for", []),
-                "activities": place.get("activities", []),
-                "best_time_to_visit": place.get("best_time_to_visit"),
-                "description": place.get("description", "")[:200] + "..." if place.get("description") else ""
-            })
-        
-        return json.dumps({
-            "success": True,
-            "count": len(formatted_places),
-            "data": formatted_places
-        }, indent=2)
+        return _format_place_search(places)
     except Exception as e:
         logger.error(f"Error in search_places tool: {e}")
-        return json.dumps({"success": False, "error": str(e)})
+        return encode_tool_output({"success": False, "error": str(e)})
+
+
+@async_variant(search_places)
+async def _search_places_async(
+    country: Optional[str] = None,
+    city: Optional[str] = None,
+    category: Optional[str] = None,
+    near_city: Optional[str] = None,
+    keywords: Optional[str] = None
+) -> str:
+    try:
+        places = await async_supabase_client.search_places(
+            country=country,
+            city=city,
+            category=category,
+            near_city=near_city,
+            text=keywords,
+            limit=10,
+            columns=PLACE_CARD
+        )
+        return _format_place_search(places)
+    except Exception as e:
+        logger.error(f"Error in search_places tool: {e}")
+        return encode_tool_output({"success": False, "error": str(e)})
 
 
 @tool
@@ -381,41 +608,43 @@ def get_popular_places() -> str:
         JSON string with list of popular places
     """
     try:
-        places = supabase_client.get_popular_places(limit=10)
-        
-        if not places:
-            return json.dumps({
-                "success": False,
-                "message": "No popular places found",
-                "data": []
-            })
-        
-        formatted_places = []
-        for place in places:
-            formatted_places.append({
-                "id": place.get("id"),
-                "name": place.get("name"),
-                "city": place.get("city"),
-                "country": place.get("country"),
-                "category": place.get("category"),
-                "rating": place.get("rating"),
-                "popular_ranking": place.get("popular_ranking"),
-                "famous_for": place.get("famous_for", []),
-                "description": place.get("description", "")[:150] + "..."
-            })
-        
-        return json.dumps({
-            "success": True,
-            "count": len(formatted_places),
-            "data": formatted_places
-        }, indent=2)
+        places = supabase_client.get_popular_places(limit=10, columns=PLACE_CARD)
+        return _format_popular_places(places)
+    except Exception as e:
+        logger.error(f"Error in get_popular_places tool: {e}")
+        return encode_tool_output({"success": False, "error": str(e)})
+
+
+@async_variant(get_popular_places)
+async def _get_popular_places_async() -> str:
+    try:
+        places = await async_supabase_client.get_popular_places(limit=10, columns=PLACE_CARD)
+        return _format_popular_places(places)
     except Exception as e:
         logger.error(f"Error in get_popular_places tool: {e}")
-        return json.dumps({"success": False, "error": str(e)})
+        return encode_tool_output({"success": False, "error": str(e)})
 
 
 # ==================== HOTEL PRICE SORTING ====================
 
+def _format_hotels_by_price(hotels: List[Dict[str, Any]], sort_order: str) -> str:
+    if not hotels:
+        return encode_tool_output({
+            "success": False,
+            "message": f"No hotels found",
+            "data": []
+        })
+    
+    formatted_hotels = [_format_hotel(hotel) for hotel in hotels]
+    
+    return encode_tool_output({
+        "success": True,
+        "sort_order": sort_order,
+        "count": len(formatted_hotels),
+        "data": formatted_hotels
+    }, tool="get_hotels_by_price")
+
+
 @tool
 def get_hotels_by_price(
     city: Optional[str] = None,
@@ -445,44 +674,63 @@ def get_hotels_by_price(
             city=city,
             country=country,
             ascending=ascending,
-            limit=10
+            limit=10,
+            columns=HOTEL_SUMMARY
         )
-        
-        if not hotels:
-            return json.dumps({
-                "success": False,
-                "message": f"No hotels found",
-                "data": []
-            })
-        
-        formatted_hotels = []
-        for hotel in hotels:
-            formatted_hotels.append({
-                "id": hotel.get("id"),
-                "name": hotel.get("name"),
-                "city": hotel.get("city"),
-                "country": hotel.get("country"),
-                "address": hotel.get("address"),
-                "rating": hotel.get("rating"),
-                "reviews_count": hotel.get("reviews_count"),
-                "phone": hotel.get("phone"),
-                "email": hotel.get("contact_email"),
-                "description": hotel.get("description", "")[:200] + "..." if hotel.get("description") else ""
-            })
-        
-        return json.dumps({
-            "success": True,
-            "sort_order": sort_order,
-            "count": len(formatted_hotels),
-            "data": formatted_hotels
-        }, indent=2)
+        return _format_hotels_by_price(hotels, sort_order)
     except Exception as e:
         logger.error(f"Error in get_hotels_by_price tool: {e}")
-        return json.dumps({"success": False, "error": str(e)})
+        return encode_tool_output({"success": False, "error": str(e)})
+
+
+@async_variant(get_hotels_by_price)
+async def _get_hotels_by_price_async(
+    city: Optional[str] = None,
+    country: Optional[str] = None,
+    sort_order: str = "low_to_high"
+) -> str:
+    try:
+        ascending = sort_order.lower() == "low_to_high"
+        hotels = await async_supabase_client.get_hotels_sorted_by_price(
+            city=city,
+            country=country,
+            ascending=ascending,
+            limit=10,
+            columns=HOTEL_SUMMARY
+        )
+        return _format_hotels_by_price(hotels, sort_order)
+    except Exception as e:
+        logger.error(f"Error in get_hotels_by_price tool: {e}")
+        return encode_tool_output({"success": False, "error": str(e)})
 
 
 # ==================== USER FAVORITES ====================
 
+def _format_favorites(favorites: List[Dict[str, Any]]) -> str:
+    if not favorites:
+        return encode_tool_output({
+            "success": False,
+            "message": "No favorites found",
+            "data": []
+        })
+    
+    formatted_favorites = []
+    for fav in favorites:
+        formatted_favorites.append({
+            "id": fav.get("id"),
+            "item_type": fav.get("item_type"),
+            "item_id": fav.get("item_id"),
+            "created_at": fav.get("created_at")
+        })
+    
+    return encode_tool_output({
+        "success": True,
+        "count": len(formatted_favorites),
+        "data": formatted_favorites,
+        "message": f"Found {len(formatted_favorites)} favorite items"
+    }, tool="get_user_favorites")
+
+
 @tool
 def get_user_favorites(user_id: str, item_type: Optional[str] = None) -> str:
     """
@@ -506,38 +754,73 @@ def get_user_favorites(user_id: str, item_type: Optional[str] = None) -> str:
         favorites = supabase_client.get_user_favorites(
             user_id=user_id,
             item_type=item_type,
-            limit=20
+            limit=20,
+            columns=FAVORITE_SUMMARY
         )
-        
-        if not favorites:
-            return json.dumps({
-                "success": False,
-                "message": "No favorites found",
-                "data": []
-            })
-        
-        formatted_favorites = []
-        for fav in favorites:
-            formatted_favorites.append({
-                "id": fav.get("id"),
-                "item_type": fav.get("item_type"),
-                "item_id": fav.get("item_id"),
-                "created_at": fav.get("created_at")
-            })
-        
-        return json.dumps({
-            "success": True,
-            "count": len(formatted_favorites),
-            "data": formatted_favorites,
-            "message": f"Found {len(formatted_favorites)} favorite items"
-        }, indent=2)
+        return _format_favorites(favorites)
+    except Exception as e:
+        logger.error(f"Error in get_user_favorites tool: {e}")
+        return encode_tool_output({"success": False, "error": str(e)})
+
+
+@async_variant(get_user_favorites)
+async def _get_user_favorites_async(user_id: str, item_type: Optional[str] = None) -> str:
+    try:
+        favorites = await async_supabase_client.get_user_favorites(
+            user_id=user_id,
+            item_type=item_type,
+            limit=20,
+            columns=FAVORITE_SUMMARY
+        )
+        return _format_favorites(favorites)
     except Exception as e:
         logger.error(f"Error in get_user_favorites tool: {e}")
-        return json.dumps({"success": False, "error": str(e)})
+        return encode_tool_output({"success": False, "error": str(e)})
 
 
 # ==================== WEATHER TOOL ====================
 
+WEATHER_API_URL = "http://api.openweathermap.org/data/2.5/weather"
+
+
+def _weather_params(city: str) -> Dict[str, Any]:
+    return {
+        "q": city,
+        "appid": settings.openweather_api_key,
+        "units": "metric"
+    }
+
+
+def _format_weather(data: Dict[str, Any]) -> str:
+    weather_info = {
+        "city": data.get("name"),
+        "country": data.get("sys", {}).get("country"),
+        "temperature": data.get("main", {}).get("temp"),
+        "feels_like": data.get("main", {}).get("feels_like"),
+        "humidity": data.get("main", {}).get("humidity"),
+        "description": data.get("weather", [{}])[0].get("description"),
+        "wind_speed": data.get("wind", {}).get("speed"),
+        "pressure": data.get("main", {}).get("pressure")
+    }
+    
+    return encode_tool_output({
+        "success": True,
+        "data": weather_info
+    }, tool="get_weather")
+
+
+def _format_weather_http_error(e: httpx.HTTPStatusError, city: str) -> str:
+    if e.response.status_code == 404:
+        return encode_tool_output({
+            "success": False,
+            "message": f"City '{city}' not found"
+        })
+    return encode_tool_output({
+        "success": False,
+        "message": f"Weather API error: {e}"
+    })
+
+
 @tool
 def get_weather(city: str) -> str:
     """
@@ -556,55 +839,95 @@ def get_weather(city: str) -> str:
     """
     try:
         if not settings.openweather_api_key:
-            return json.dumps({
+            return encode_tool_output({
                 "success": False,
                 "message": "Weather API key not configured"
             })
         
-        url = "http://api.openweathermap.org/data/2.5/weather"
-        params = {
-            "q": city,
-            "appid": settings.openweather_api_key,
-            "units": "metric"
-        }
-        
         with httpx.Client(timeout=10.0) as client:
-            response = client.get(url, params=params)
+            response = client.get(WEATHER_API_URL, params=_weather_params(city))
             response.raise_for_status()
             data = response.json()
         
-        weather_info = {
-            "city": data.get("name"),
-            "country": data.get("sys", {}).get("country"),
-            "temperature": data.get("main", {}).get("temp"),
-            "feels_like": data.get("main", {}).get("feels_like"),
-            "humidity": data.get("main", {}).get("humidity"),
-            "description": data.get("weather", [{}])[0].get("description"),
-            "wind_speed": data.get("wind", {}).get("speed"),
-            "pressure": data.get("main", {}).get("pressure")
-        }
-        
-        return json.dumps({
-            "success": True,
-            "data": weather_info
-        }, indent=2)
+        return _format_weather(data)
     except httpx.HTTPStatusError as e:
-        if e.response.status_code == 404:
-            return json.dumps({
+        return _format_weather_http_error(e, city)
+    except Exception as e:
+        logger.error(f"Error in get_weather tool: {e}")
+        return encode_tool_output({"success": False, "error": str(e)})
+
+
+@async_variant(get_weather)
+async def _get_weather_async(city: str) -> str:
+    try:
+        if not settings.openweather_api_key:
+            return encode_tool_output({
                 "success": False,
-                "message": f"City '{city}' not found"
+                "message": "Weather API key not configured"
             })
-        return json.dumps({
-            "success": False,
-            "message": f"Weather API error: {e}"
-        })
+        
+        async with httpx.AsyncClient(timeout=10.0) as client:
+            response = await client.get(WEATHER_API_URL, params=_weather_params(city))
+            response.raise_for_status()
+            data = response.json()
+        
+        return _format_weather(data)
+    except httpx.HTTPStatusError as e:
+        return _format_weather_http_error(e, city)
     except Exception as e:
         logger.error(f"Error in get_weather tool: {e}")
-        return json.dumps({"success": False, "error": str(e)})
+        return encode_tool_output({"success": False, "error": str(e)})
 
 
 # ==================== BOOKING TOOL ====================
 
+def _booking_amount(booking_type: str, item: Optional[Dict[str, Any]], item_id: str, total_participants: int):
+    """
+    Price a booking from the fetched package or hotel
+    
+    Returns:
+        (total_amount, error_json) - exactly one of them is None
+    """
+    if booking_type == "package":
+        if not item:
+            return None, encode_tool_output({
+                "success": False,
+                "message": f"Package with ID {item_id} not found"
+            })
+        return float(item.get("price", 0)) * total_participants, None
+    
+    # hotel
+    if not item:
+        return None, encode_tool_output({
+            "success": False,
+            "message": f"Hotel with ID {item_id} not found"
+        })
+    # For hotels, we'd need room selection, but for demo purposes:
+    return 5000.0, None  # Default amount, should be calculated from room prices
+
+
+def _format_booking(booking: Optional[Dict[str, Any]]) -> str:
+    if not booking:
+        return encode_tool_output({
+            "success": False,
+            "message": "Failed to create booking"
+        })
+    
+    return encode_tool_output({
+        "success": True,
+        "message": "Booking created successfully",
+        "data": {
+            "booking_reference": booking.get("booking_reference"),
+            "booking_type": booking.get("booking_type"),
+            "guest_name": booking.get("primary_guest_name"),
+            "total_amount": booking.get("total_amount"),
+            "currency": booking.get("currency"),
+            "status": booking.get("booking_status"),
+            "payment_status": booking.get("payment_status")
+        }
+    }, tool="create_booking")
+
+
 @tool
 def create_booking(
     booking_type: str,
@@ -638,33 +961,23 @@ def create_booking(
     try:
         # Validate booking type
         if booking_type not in ["package", "hotel"]:
-            return json.dumps({
+            return encode_tool_output({
                 "success": False,
                 "message": "Invalid booking type. Must be 'package' or 'hotel'"
             })
         
         # Get item details to calculate price
         if booking_type == "package":
-            item = supabase_client.get_package_by_id(item_id)
-            if not item:
-                return json.dumps({
-                    "success": False,
-                    "message": f"Package with ID {item_id} not found"
-                })
-            total_amount = float(item.get("price", 0)) * total_participants
+            item = supabase_client.get_package_by_id(item_id, columns=PACKAGE_PRICING)
         else:  # hotel
-            item = supabase_client.get_hotel_by_id(item_id)
-            if not item:
-                return json.dumps({
-                    "success": False,
-                    "message": f"Hotel with ID {item_id} not found"
-                })
-            # For hotels, we'd need room selection, but for demo purposes:
-            total_amount = 5000.0  # Default amount, should be calculated from room prices
+            item = supabase_client.get_hotel_by_id(item_id, columns="id")
+        
+        total_amount, error = _booking_amount(booking_type, item, item_id, total_participants)
+        if error:
+            return error
         
         # Use a temporary user ID if not provided
         if not user_id:
-            import uuid
             user_id = str(uuid.uuid4())
         
         # Create the booking
@@ -680,28 +993,60 @@ def create_booking(
             base_price=total_amount
         )
         
-        if not booking:
-            return json.dumps({
+        return _format_booking(booking)
+    except Exception as e:
+        logger.error(f"Error in create_booking tool: {e}")
+        return encode_tool_output({"success": False, "error": str(e)})
+
+
+@async_variant(create_booking)
+async def _create_booking_async(
+    booking_type: str,
+    item_id: str,
+    guest_name: str,
+    guest_email: str,
+    guest_phone: str,
+    total_participants: int = 1,
+    user_id: Optional[str] = None
+) -> str:
+    try:
+        # Validate booking type
+        if booking_type not in ["package", "hotel"]:
+            return encode_tool_output({
                 "success": False,
-                "message": "Failed to create booking"
+                "message": "Invalid booking type. Must be 'package' or 'hotel'"
             })
         
-        return json.dumps({
-            "success": True,
-            "message": "Booking created successfully",
-            "data": {
-                "booking_reference": booking.get("booking_reference"),
-                "booking_type": booking.get("booking_type"),
-                "guest_name": booking.get("primary_guest_name"),
-                "total_amount": booking.get("total_amount"),
-                "currency": booking.get("currency"),
-                "status": booking.get("booking_status"),
-                "payment_status": booking.get("payment_status")
-            }
-        }, indent=2)
+        # Get item details to calculate price
+        if booking_type == "package":
+            item = await async_supabase_client.get_package_by_id(item_id, columns=PACKAGE_PRICING)
+        else:  # hotel
+            item = await async_supabase_client.get_hotel_by_id(item_id, columns="id")
+        
+        total_amount, error = _booking_amount(booking_type, item, item_id, total_participants)
+        if error:
+            return error
+        
+        # Use a temporary user ID if not provided
+        if not user_id:
+            user_id = str(uuid.uuid4())
+        
+        booking = await async_supabase_client.create_booking(
+            user_id=user_id,
+            booking_type=booking_type,
+            item_id=item_id,
+            primary_guest_name=guest_name,
+            primary_guest_email=guest_email,
+            primary_guest_phone=guest_phone,
+            total_amount=total_amount,
+            total_participants=total_participants,
+            base_price=total_amount
+        )
+        
+        return _format_booking(booking)
     except Exception as e:
         logger.error(f"Error in create_booking tool: {e}")
-        return json.dumps({"success": False, "error": str(e)})
+        return encode_tool_output({"success": False, "error": str(e)})
 
 
 # Export all tools as a list
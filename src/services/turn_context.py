@@ -0,0 +1,218 @@
+"""
+Agent Turn Context
+Request-scoped state shared by the tools running inside one agent turn
+"""
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Set, Tuple
+from contextlib import contextmanager
+from contextvars import ContextVar
+from src.utils.helpers import canonical_location
+import asyncio
+import json
+import time
+
+
+# Tool arguments holding a location, compared by canonical spelling
+LOCATION_ARGS = {"city", "country", "destination", "near_city"}
+
+
+def canonical_args(args: Dict[str, Any]) -> str:
+    """
+    Stable representation of tool arguments (key order, null values and
+    location spellings ignored, so "Chattogram" and "Chittagong" match)
+    """
+    return json.dumps(
+        {
+            key: canonical_location(value) if key in LOCATION_ARGS and isinstance(value, str) else value
+            for key, value in args.items() if value is not None
+        },
+        sort_keys=True,
+        default=str
+    )
+
+
+class TurnContext:
+    """
+    State for one process_message / stream_message call.
+
+    AgentExecutor runs all tool calls from one LLM step concurrently; the
+    turn's semaphore caps how many of them run at once, and each tool run
+    records its duration so it can be reported in tools_used.
+
+    Repeated calls with the same tool and arguments within the turn are
+    served from a memo of futures, so even concurrent duplicates share a
+    single database round trip. Speculative prefetches started before the
+    LLM asks for a tool are parked in the same memo.
+    """
+
+    def __init__(self, max_parallel_tools: int = 4):
+        """
+        Args:
+            max_parallel_tools: Tool calls allowed to run at the same time in this turn
+        """
+        self.semaphore = asyncio.Semaphore(max(1, max_parallel_tools))
+        self._calls: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        self._memo: Dict[Tuple[str, str], "asyncio.Future[Any]"] = {}
+        self._memo_durations: Dict[Tuple[str, str], float] = {}
+        self._prefetches: Dict[Tuple[str, str], "asyncio.Task[Any]"] = {}
+        self._prefetch_hits: Set[Tuple[str, str]] = set()
+
+        # Metrics
+        self.tool_calls = 0
+        self.memo_hits = 0
+        self.memo_saved_seconds = 0.0
+
+    def _record(self, key: Tuple[str, str], seconds: float, memoized: bool, prefetched: bool = False) -> None:
+        self._calls.setdefault(key, []).append({"seconds": seconds, "memoized": memoized, "prefetched": prefetched})
+
+    async def run_tool(
+        self,
+        tool: str,
+        args: Dict[str, Any],
+        call: Callable[[], Awaitable[Any]],
+        memoize: bool = True
+    ) -> Any:
+        """
+        Run a tool call under the turn's concurrency limit
+
+        Args:
+            tool: Tool name
+            args: Tool arguments (used for the memo key)
+            call: Starts the actual tool coroutine
+            memoize: Whether identical calls in this turn may share the result
+                (False for tools with side effects)
+        """
+        key = (tool, canonical_args(args))
+        self.tool_calls += 1
+
+        if memoize:
+            future = self._memo.get(key)
+            if future is not None:
+                start = time.perf_counter()
+                result = await asyncio.shield(future)
+                prefetched = key in self._prefetches and key not in self._prefetch_hits
+                if prefetched:
+                    # The first call for a prefetched key is the one the prefetch was for
+                    self._prefetch_hits.add(key)
+                else:
+                    self.memo_hits += 1
+                    self.memo_saved_seconds += self._memo_durations.get(key, 0.0)
+                self._record(key, time.perf_counter() - start, memoized=not prefetched, prefetched=prefetched)
+                return result
+            future = asyncio.get_running_loop().create_future()
+            self._memo[key] = future
+
+        async with self.semaphore:
+            start = time.perf_counter()
+            try:
+                result = await call()
+            except BaseException as e:
+                if memoize:
+                    # Let later repeats try again instead of replaying the failure
+                    self._memo.pop(key, None)
+                    if isinstance(e, Exception):
+                        future.set_exception(e)
+                        future.exception()  # mark retrieved when nobody is waiting
+                    else:
+                        future.cancel()
+                raise
+            finally:
+                seconds = time.perf_counter() - start
+                self._record(key, seconds, memoized=False)
+
+        if memoize:
+            self._memo_durations[key] = seconds
+            future.set_result(result)
+        return result
+
+    def prefetch(self, tool: str, args: Dict[str, Any], call: Callable[[], Awaitable[Any]]) -> bool:
+        """
+        Start a tool call before the LLM asks for it
+
+        The result is parked in the memo, so a later run_tool with the same
+        tool and arguments waits for it instead of querying again.
+
+        Returns:
+            False if an identical call is already running or done in this turn
+        """
+        key = (tool, canonical_args(args))
+        if key in self._memo:
+            return False
+
+        future = asyncio.get_running_loop().create_future()
+        self._memo[key] = future
+
+        async def run() -> None:
+            start = time.perf_counter()
+            try:
+                result = await call()
+            except BaseException as e:
+                # Let the real call run the tool itself
+                self._memo.pop(key, None)
+                if isinstance(e, Exception):
+                    future.set_exception(e)
+                    future.exception()
+                else:
+                    future.cancel()
+                    raise
+            else:
+                self._memo_durations[key] = time.perf_counter() - start
+                future.set_result(result)
+
+        self._prefetches[key] = asyncio.create_task(run())
+        return True
+
+    def cancel_prefetches(self) -> None:
+        """Stop prefetches still running when the turn ends"""
+        for task in self._prefetches.values():
+            if not task.done():
+                task.cancel()
+
+    def pop_call(self, tool: str, args: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Timing of the oldest unreported call with these arguments ({"seconds", "memoized"})"""
+        calls = self._calls.get((tool, canonical_args(args)))
+        return calls.pop(0) if calls else None
+
+    def discard_calls(self) -> None:
+        """Forget unreported call timings (e.g. from a model run whose answer was discarded)"""
+        self._calls.clear()
+
+    def memo_stats(self) -> Dict[str, Any]:
+        """Tool-call memo counters for this turn"""
+        return {
+            "tool_calls": self.tool_calls,
+            "memo_hits": self.memo_hits,
+            "saved_ms": round(self.memo_saved_seconds * 1000, 1)
+        }
+
+    def prefetch_stats(self) -> Dict[str, Any]:
+        """Prefetches started in this turn and how many the LLM actually used"""
+        return {
+            "started": len(self._prefetches),
+            "hits": len(self._prefetch_hits),
+            "wasted": len(self._prefetches) - len(self._prefetch_hits),
+            "tools": [tool for tool, _ in self._prefetches],
+            "hit_tools": [tool for tool, _ in self._prefetch_hits]
+        }
+
+
+_current_turn: ContextVar[Optional[TurnContext]] = ContextVar("current_turn", default=None)
+
+
+def current_turn() -> Optional[TurnContext]:
+    """The context of the agent turn being processed, if any"""
+    return _current_turn.get()
+
+
+@contextmanager
+def turn_scope(max_parallel_tools: int = 4) -> Iterator[TurnContext]:
+    """Make a fresh TurnContext current for the duration of the block"""
+    turn = TurnContext(max_parallel_tools=max_parallel_tools)
+    # Restore by value rather than ContextVar.reset: a streaming generator may be
+    # resumed (and closed) from a copy of the context it was started in
+    previous = _current_turn.get()
+    _current_turn.set(turn)
+    try:
+        yield turn
+    finally:
+        turn.cancel_prefetches()
+        _current_turn.set(previous)
@@ -4,9 +4,9 @@ Utils Package
 from .helpers import *
 
 __all__ = [
-    "parse_natural_date", "format_date", "calculate_duration",
+    "parse_natural_date", "format_date", "calculate_duration", "parse_timestamp",
     "format_price", "parse_price_range",
-    "extract_location", "extract_numbers", "clean_text",
+    "extract_location", "normalize_locations", "canonical_location", "extract_numbers", "clean_text",
     "validate_email", "validate_phone",
-    "format_list_response", "classify_simple_intent"
+    "format_list_response", "classify_simple_intent", "match_intents"
 ]
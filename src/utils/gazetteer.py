@@ -0,0 +1,312 @@
+"""
+Location Gazetteer
+Known location names (catalog values plus curated spellings) found in a
+message with one pass of an Aho-Corasick automaton
+"""
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+from collections import deque
+import asyncio
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# Cities known before (or without) the catalog being loaded
+CURATED_CITIES = [
+    "Dhaka", "Chittagong", "Sylhet", "Cox's Bazar", "Khulna", "Rajshahi", "Rangpur",
+    "Barisal", "Mymensingh", "Comilla", "Gazipur", "Narayanganj", "Bogra", "Jessore",
+    "Sundarbans", "Kuakata"
+]
+CURATED_COUNTRIES = ["Bangladesh"]
+
+# Alternative spellings mapped to the canonical (lowercase) location name
+LOCATION_ALIASES = {
+    "coxs bazar": "cox's bazar",
+    "cox bazar": "cox's bazar",
+    "coxsbazar": "cox's bazar",
+    "chattogram": "chittagong",
+    "ctg": "chittagong",
+    "cumilla": "comilla",
+    "bogura": "bogra",
+    "jashore": "jessore",
+    "barishal": "barisal",
+    "sundarban": "sundarbans",
+    "dacca": "dhaka",
+}
+
+
+def _fold(text: str) -> str:
+    """Lowercase with straight apostrophes, one character per character so spans still index the text"""
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        # A few characters lowercase to two ("İ" -> "i̇"); those are kept as they are
+        lowered = "".join(c.lower() if len(c.lower()) == 1 else c for c in text)
+    return lowered.replace("’", "'")
+
+
+def _key(name: str) -> str:
+    """Lookup form of a name: folded (see _fold), single spaces"""
+    return " ".join(_fold(name).split())
+
+
+class Location(NamedTuple):
+    """A known location: display name, and its country (itself for a country)"""
+    name: str
+    country: Optional[str]
+    is_country: bool = False
+
+
+class LocationMatch(NamedTuple):
+    """A location found in a text, with its character span"""
+    start: int
+    end: int
+    text: str
+    location: Location
+
+
+class _Automaton:
+    """Aho-Corasick automaton over lowercase patterns"""
+
+    def __init__(self, patterns: Iterable[str]):
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.out: List[List[str]] = [[]]
+
+        for pattern in patterns:
+            state = 0
+            for char in pattern:
+                nxt = self.goto[state].get(char)
+                if nxt is None:
+                    nxt = self.goto[state][char] = len(self.goto)
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.out.append([])
+                state = nxt
+            self.out[state].append(pattern)
+
+        # Breadth-first, so every fail target is finished before it is used
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self.goto[state].items():
+                queue.append(nxt)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[nxt] = self.goto[fallback].get(char, 0)
+                self.out[nxt] = self.out[nxt] + self.out[self.fail[nxt]]
+
+    def iter(self, text: str) -> Iterator[Tuple[int, int, str]]:
+        """Every (start, end, pattern) occurrence in the text, overlaps included"""
+        state = 0
+        for i, char in enumerate(text):
+            while state and char not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(char, 0)
+            for pattern in self.out[state]:
+                yield i + 1 - len(pattern), i + 1, pattern
+
+
+class Gazetteer:
+    """
+    Location names for message parsing and argument normalization.
+
+    Starts from the curated Bangladesh cities and aliases, and refresh()
+    adds the distinct city, state_province, country and destination values
+    of the catalog tables. All names and aliases are compiled into one
+    automaton, so find_all() scans a message once however many names there
+    are, instead of one substring search per name.
+
+    Matches must fall on word boundaries ("ctg" is not found in "ctgx"),
+    and overlapping matches resolve to the leftmost, then longest, name.
+    """
+
+    def __init__(self, aliases: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            aliases: Alternative spelling -> canonical name (defaults to LOCATION_ALIASES)
+        """
+        self.aliases = {_key(alias): _key(name) for alias, name in (aliases or LOCATION_ALIASES).items()}
+        # Each canonical name with its aliases: all spellings of one place
+        self._groups: Dict[str, List[str]] = {}
+        for alias, canonical in self.aliases.items():
+            self._groups.setdefault(canonical, [canonical]).append(alias)
+        self._spellings = {spelling: group for group in self._groups.values() for spelling in group}
+        self._curated: Dict[str, Location] = {}
+        for city in CURATED_CITIES:
+            self._curated[_key(city)] = Location(city, "Bangladesh")
+        for country in CURATED_COUNTRIES:
+            self._curated[_key(country)] = Location(country, country, is_country=True)
+        self._build({}, {})
+
+        # Metrics
+        self.refreshes = 0
+        self.failures = 0
+        self.loaded_at: Optional[float] = None
+        self.last_refresh_ms = 0.0
+
+    def _build(self, catalog: Dict[str, Location], stored: Dict[Tuple[str, str], Dict[str, str]]) -> None:
+        # Catalog spellings win over the curated ones: when the catalog uses any
+        # spelling of an alias group (e.g. "Chattogram"), every spelling in the
+        # group resolves to it. stored keeps the values of each (table, column),
+        # for canonical() to pick the spelling a given column uses. Swapped in
+        # one assignment so concurrent lookups see either the old or the new
+        # index.
+        names = {**self._curated, **catalog}
+        index = dict(names)
+        for canonical, spellings in self._groups.items():
+            listed = next((spelling for spelling in spellings if spelling in catalog), None)
+            if listed is not None:
+                target = catalog[listed]
+            else:
+                target = names.get(canonical) or Location(
+                    " ".join(w[:1].upper() + w[1:] for w in canonical.split()), None
+                )
+            for spelling in spellings:
+                index[spelling] = target
+        self._index = (index, _Automaton(index), stored)
+        self._names = len(names)
+
+    def load(self, rows: Dict[str, List[Dict[str, Any]]]) -> int:
+        """
+        Replace the catalog names from fetched rows
+
+        Args:
+            rows: Rows per table with any of city, state_province, destination and country
+
+        Returns:
+            Number of distinct names (aliases excluded)
+        """
+        catalog: Dict[str, Location] = {}
+        stored: Dict[Tuple[str, str], Dict[str, str]] = {}
+        for table, table_rows in rows.items():
+            for row in table_rows:
+                country = (row.get("country") or "").strip() or None
+                if country:
+                    catalog.setdefault(_key(country), Location(country, country, is_country=True))
+                    stored.setdefault((table, "country"), {}).setdefault(_key(country), country)
+                for column in ("city", "destination", "state_province"):
+                    value = (row.get(column) or "").strip()
+                    if not value:
+                        continue
+                    if _key(value) not in catalog:
+                        catalog[_key(value)] = Location(value, country)
+                    stored.setdefault((table, column), {}).setdefault(_key(value), value)
+        self._build(catalog, stored)
+        return self._names
+
+    async def refresh(self, client, table_columns: Dict[str, str], page_size: int = 1000) -> bool:
+        """
+        Reload the catalog names (on failure the previous names stay in use)
+
+        Args:
+            client: AsyncSupabaseClient (uses fetch_table)
+            table_columns: Location columns to read per table
+            page_size: Rows per request
+
+        Returns:
+            True if the names were reloaded
+        """
+        start = time.perf_counter()
+        try:
+            rows = {
+                table: await client.fetch_table(table, columns, page_size)
+                for table, columns in table_columns.items()
+            }
+        except Exception as e:
+            self.failures += 1
+            logger.warning(f"Gazetteer refresh failed: {e}")
+            return False
+
+        count = self.load(rows)
+        self.refreshes += 1
+        self.loaded_at = time.time()
+        self.last_refresh_ms = round((time.perf_counter() - start) * 1000, 1)
+        logger.info(f"Gazetteer loaded {count} location names in {self.last_refresh_ms} ms")
+        return True
+
+    async def run(self, client, table_columns: Dict[str, str], interval_seconds: float, page_size: int = 1000) -> None:
+        """Background task: reload the names every interval_seconds"""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            await self.refresh(client, table_columns, page_size)
+
+    def find_all(self, text: str) -> List[LocationMatch]:
+        """Every location in the text, in order of appearance"""
+        index, automaton, _ = self._index
+        lowered = _fold(text)
+        candidates = sorted(
+            (
+                (start, end, pattern) for start, end, pattern in automaton.iter(lowered)
+                if (start == 0 or not lowered[start - 1].isalnum())
+                and (end == len(lowered) or not lowered[end].isalnum())
+            ),
+            key=lambda match: (match[0], -match[1])
+        )
+
+        matches: List[LocationMatch] = []
+        position = 0
+        for start, end, pattern in candidates:
+            if start >= position:
+                matches.append(LocationMatch(start, end, text[start:end], index[pattern]))
+                position = end
+        return matches
+
+    def extract(self, text: str) -> Dict[str, Optional[str]]:
+        """First city (or destination, region) and the country mentioned in or implied by the text"""
+        matches = self.find_all(text)
+        city = next((m.location for m in matches if not m.location.is_country), None)
+        country = next((m.location.name for m in matches if m.location.is_country), None)
+        return {
+            "city": city.name if city else None,
+            "country": country or (city.country if city else None)
+        }
+
+    def canonical(self, value: str, table: Optional[str] = None, *columns: str) -> Optional[str]:
+        """
+        Display name of a known location or alias (e.g. "chattogram" -> "Chittagong"), else None
+
+        Args:
+            value: Location name as given
+            table: Catalog table the name will be matched against
+            columns: That table's columns, in order of preference; the first one
+                storing a spelling of the name decides it (hotels.city may say
+                "Chittagong" where packages.destination says "Chattogram")
+        """
+        index, _, stored = self._index
+        key = _key(value)
+        location = index.get(key)
+        if location is None:
+            return None
+        for column in columns:
+            values = stored.get((table, column), {})
+            for spelling in (key, *self._spellings.get(key, ())):
+                if spelling in values:
+                    return values[spelling]
+        return location.name
+
+    def normalize(self, text: str) -> str:
+        """Text with every location spelled as its canonical lowercase name"""
+        parts, position = [], 0
+        for match in self.find_all(text):
+            parts.append(text[position:match.start])
+            parts.append(_key(match.location.name))
+            position = match.end
+        parts.append(text[position:])
+        return "".join(parts)
+
+    def stats(self) -> Dict[str, Any]:
+        """Name counts and refresh status"""
+        return {
+            "names": self._names,
+            "aliases": len(self.aliases),
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+            "age_seconds": round(time.time() - self.loaded_at, 1) if self.loaded_at else None,
+            "last_refresh_ms": self.last_refresh_ms
+        }
+
+
+# Shared by message parsing, tool arguments and cache keys
+location_gazetteer = Gazetteer()
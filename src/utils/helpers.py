@@ -3,8 +3,9 @@ Utility Functions
 Helper functions for the GoTravel AI Backend
 """
 from typing import Optional, Dict, Any, List
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from dateutil import parser
+from src.utils.gazetteer import location_gazetteer
 import re
 import logging
 
@@ -105,6 +106,25 @@ def calculate_duration(start_date: datetime, end_date: datetime) -> Dict[str, in
     }
 
 
+def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse an ISO 8601 timestamp returned by the database (e.g. updated_at)
+    
+    Postgres prints between 0 and 6 fractional-second digits, so these
+    strings don't sort in time order; compare the parsed values instead.
+    
+    Returns:
+        Timezone-aware datetime (UTC when the value has no offset), or None if it can't be parsed
+    """
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
 # ==================== PRICE FORMATTING ====================
 
 def format_price(amount: float, currency: str = "BDT") -> str:
@@ -175,39 +195,45 @@ def parse_price_range(price_string: str) -> Dict[str, Optional[float]]:
 
 # ==================== TEXT PROCESSING ====================
 
+def normalize_locations(text: str) -> str:
+    """
+    Replace known alternative spellings of locations with their canonical name
+    
+    Args:
+        text: Lowercase input text
+    
+    Returns:
+        Text with aliases resolved (e.g. "ctg" -> "chittagong")
+    """
+    return location_gazetteer.normalize(text)
+
+
 def extract_location(text: str) -> Dict[str, Optional[str]]:
     """
     Extract location information from text
     
     Returns:
-        Dictionary with potential city and country
+        Dictionary with the first city (or destination) mentioned and its country
     """
-    # Common Bangladesh cities
-    bd_cities = [
-        "dhaka", "chittagong", "sylhet", "cox's bazar", "coxs bazar", "khulna",
-        "rajshahi", "rangpur", "barisal", "mymensingh", "comilla", "gazipur",
-        "narayanganj", "bogra", "jessore", "sundarbans", "kuakata"
-    ]
-    
-    text_lower = text.lower()
-    
-    result = {
-        "city": None,
-        "country": None
-    }
-    
-    # Check for Bangladesh cities
-    for city in bd_cities:
-        if city in text_lower:
-            result["city"] = city.title()
-            result["country"] = "Bangladesh"
-            break
+    return location_gazetteer.extract(text)
+
+
+def canonical_location(value: Optional[str], table: Optional[str] = None, *columns: str) -> Optional[str]:
+    """
+    Canonical spelling of a location argument (e.g. "chattogram" -> "Chittagong")
     
-    # Check for country mentions
-    if "bangladesh" in text_lower:
-        result["country"] = "Bangladesh"
+    Args:
+        value: Location argument
+        table: Catalog table the argument filters (optional)
+        columns: Columns of that table it is matched against; the spelling
+            they store wins over the gazetteer's own
     
-    return result
+    Returns:
+        The known name, or the value stripped if the gazetteer doesn't know it
+    """
+    if not value:
+        return value
+    return location_gazetteer.canonical(value, table, *columns) or value.strip()
 
 
 def extract_numbers(text: str) -> List[int]:
@@ -334,6 +360,30 @@ def format_list_response(items: List[Dict[str, Any]], item_type: str = "item") -
 
 # ==================== INTENT CLASSIFICATION ====================
 
+# Intent keywords, in priority order
+INTENT_KEYWORDS = {
+    "hotel": ["hotel", "accommodation", "stay", "room", "lodge"],
+    "package": ["package", "tour", "trip", "travel package"],
+    "place": ["place", "destination", "tourist", "visit", "attraction", "sightseeing"],
+    "weather": ["weather", "temperature", "climate", "forecast"],
+    "booking": ["book", "reserve", "reservation", "booking"],
+}
+
+
+def match_intents(text: str) -> List[str]:
+    """
+    Find every intent whose keywords appear in the text
+    
+    Returns:
+        Matching intents in priority order (empty if none match)
+    """
+    text_lower = text.lower()
+    return [
+        intent for intent, keywords in INTENT_KEYWORDS.items()
+        if any(word in text_lower for word in keywords)
+    ]
+
+
 def classify_simple_intent(text: str) -> str:
     """
     Simple rule-based intent classification
@@ -341,26 +391,5 @@ def classify_simple_intent(text: str) -> str:
     Returns:
         Intent category: 'hotel', 'package', 'place', 'weather', 'booking', 'general'
     """
-    text_lower = text.lower()
-    
-    # Hotel keywords
-    if any(word in text_lower for word in ["hotel", "accommodation", "stay", "room", "lodge"]):
-        return "hotel"
-    
-    # Package keywords
-    if any(word in text_lower for word in ["package", "tour", "trip", "travel package"]):
-        return "package"
-    
-    # Place keywords
-    if any(word in text_lower for word in ["place", "destination", "tourist", "visit", "attraction", "sightseeing"]):
-        return "place"
-    
-    # Weather keywords
-    if any(word in text_lower for word in ["weather", "temperature", "climate", "forecast"]):
-        return "weather"
-    
-    # Booking keywords
-    if any(word in text_lower for word in ["book", "reserve", "reservation", "booking"]):
-        return "booking"
-    
-    return "general"
+    intents = match_intents(text)
+    return intents[0] if intents else "general"
@@ -0,0 +1,48 @@
+-- Full text search for hotels, packages and places
+--
+-- Each search_<table>_text() function filters with the same to_tsvector()
+-- expression its GIN index is built on, so the planner answers the match from
+-- the index instead of scanning every row with ilike. Rows come back best
+-- match first (ts_rank); the API client chains its usual filters and limit on
+-- top of the call (see _catalog_query in src/services/database.py).
+--
+-- websearch_to_tsquery accepts plain user input: "tea garden -rain", quoted
+-- phrases and "or" all work, and stray punctuation is never a syntax error.
+
+-- Full text search indexes (places already has idx_places_search)
+create index IF not exists idx_hotels_search on public.hotels using gin (to_tsvector('english', name || ' ' || coalesce(description, '') || ' ' || coalesce(address, '') || ' ' || coalesce(city, '') || ' ' || coalesce(country, ''))) TABLESPACE pg_default;
+create index IF not exists idx_packages_search on public.packages using gin (to_tsvector('english', name || ' ' || description || ' ' || destination || ' ' || country || ' ' || category)) TABLESPACE pg_default;
+
+-- Ranked search functions (called as /rest/v1/rpc/search_<table>_text)
+create or replace function public.search_hotels_text(search text)
+returns setof public.hotels
+language sql
+stable
+as $$
+  select h.*
+  from public.hotels h, websearch_to_tsquery('english', search) q
+  where to_tsvector('english', h.name || ' ' || coalesce(h.description, '') || ' ' || coalesce(h.address, '') || ' ' || coalesce(h.city, '') || ' ' || coalesce(h.country, '')) @@ q
+  order by ts_rank(to_tsvector('english', h.name || ' ' || coalesce(h.description, '') || ' ' || coalesce(h.address, '') || ' ' || coalesce(h.city, '') || ' ' || coalesce(h.country, '')), q) desc, h.id
+$$;
+
+create or replace function public.search_packages_text(search text)
+returns setof public.packages
+language sql
+stable
+as $$
+  select p.*
+  from public.packages p, websearch_to_tsquery('english', search) q
+  where to_tsvector('english', p.name || ' ' || p.description || ' ' || p.destination || ' ' || p.country || ' ' || p.category) @@ q
+  order by ts_rank(to_tsvector('english', p.name || ' ' || p.description || ' ' || p.destination || ' ' || p.country || ' ' || p.category), q) desc, p.id
+$$;
+
+create or replace function public.search_places_text(search text)
+returns setof public.places
+language sql
+stable
+as $$
+  select pl.*
+  from public.places pl, websearch_to_tsquery('english', search) q
+  where to_tsvector('english', pl.name || ' ' || coalesce(pl.description, '') || ' ' || pl.country || ' ' || coalesce(pl.city, '')) @@ q
+  order by ts_rank(to_tsvector('english', pl.name || ' ' || coalesce(pl.description, '') || ' ' || pl.country || ' ' || coalesce(pl.city, '')), q) desc, pl.id
+$$;
@@ -0,0 +1,52 @@
+-- Trigram indexes and fuzzy location search
+--
+-- The location filters are ilike '%...%' substring matches, which a btree
+-- index can't serve; gin_trgm_ops indexes answer them (and similarity
+-- matches) from the index instead of scanning the table.
+--
+-- When a location search matches nothing (e.g. "Coxs Bazar" for "Cox's
+-- Bazar"), the API client retries it through search_<table>_fuzzy(), which
+-- returns rows whose location is trigram-similar to the input
+-- (similarity >= pg_trgm.similarity_threshold, 0.3 by default), closest
+-- first. The client chains its other filters and the limit on top.
+
+create extension if not exists pg_trgm;
+
+-- Trigram indexes for the location filters
+create index IF not exists idx_hotels_city_trgm on public.hotels using gin (city gin_trgm_ops) TABLESPACE pg_default;
+create index IF not exists idx_packages_destination_trgm on public.packages using gin (destination gin_trgm_ops) TABLESPACE pg_default;
+create index IF not exists idx_places_city_trgm on public.places using gin (city gin_trgm_ops) TABLESPACE pg_default;
+
+-- Similarity-ranked location search functions (called as /rest/v1/rpc/search_<table>_fuzzy)
+create or replace function public.search_hotels_fuzzy(search text)
+returns setof public.hotels
+language sql
+stable
+as $$
+  select h.*
+  from public.hotels h
+  where h.city % search
+  order by similarity(h.city, search) desc, h.id
+$$;
+
+create or replace function public.search_packages_fuzzy(search text)
+returns setof public.packages
+language sql
+stable
+as $$
+  select p.*
+  from public.packages p
+  where p.destination % search
+  order by similarity(p.destination, search) desc, p.id
+$$;
+
+create or replace function public.search_places_fuzzy(search text)
+returns setof public.places
+language sql
+stable
+as $$
+  select pl.*
+  from public.places pl
+  where pl.city % search
+  order by similarity(pl.city, search) desc, pl.id
+$$;
@@ -0,0 +1,16 @@
+-- Keep updated_at current on hotels and rooms
+--
+-- The catalog delta sync (src/services/catalog_sync.py) finds changed rows by
+-- updated_at. packages and places already have this trigger; without it on
+-- hotels and rooms, price and availability edits keep their old updated_at
+-- and the sync never sees them.
+
+drop trigger if exists update_hotels_updated_at on public.hotels;
+create trigger update_hotels_updated_at BEFORE
+update on hotels for EACH row
+execute FUNCTION update_updated_at_column ();
+
+drop trigger if exists update_rooms_updated_at on public.rooms;
+create trigger update_rooms_updated_at BEFORE
+update on rooms for EACH row
+execute FUNCTION update_updated_at_column ();
@@ -0,0 +1,136 @@
+-- Return the text search rank as a column
+--
+-- The search_<table>_text() functions from 008_full_text_search.sql sorted
+-- their rows with ts_rank inside the function, but PostgREST applies the
+-- client's filters and limit around the call, and nothing guarantees the
+-- function's ORDER BY survives that. The functions now return the rank as a
+-- "rank" column, and the API client orders by it itself (rank desc, id; see
+-- _catalog_query in src/services/database.py).
+--
+-- Changing the return type needs a drop. The columns are listed explicitly
+-- so a column added to a table later doesn't break the function; add it
+-- here too if the API should read it through the search.
+
+drop function if exists public.search_hotels_text(text);
+drop function if exists public.search_packages_text(text);
+drop function if exists public.search_places_text(text);
+
+create function public.search_hotels_text(search text)
+returns table (
+  id uuid,
+  name text,
+  description text,
+  address text,
+  city text,
+  country text,
+  latitude double precision,
+  longitude double precision,
+  contact_email text,
+  phone text,
+  rating numeric,
+  reviews_count integer,
+  cover_image text,
+  images text[],
+  created_at timestamp with time zone,
+  updated_at timestamp with time zone,
+  rank real
+)
+language sql
+stable
+as $$
+  select
+    h.id, h.name, h.description, h.address, h.city, h.country, h.latitude, h.longitude,
+    h.contact_email, h.phone, h.rating, h.reviews_count, h.cover_image, h.images,
+    h.created_at, h.updated_at,
+    ts_rank(to_tsvector('english', h.name || ' ' || coalesce(h.description, '') || ' ' || coalesce(h.address, '') || ' ' || coalesce(h.city, '') || ' ' || coalesce(h.country, '')), q)
+  from public.hotels h, websearch_to_tsquery('english', search) q
+  where to_tsvector('english', h.name || ' ' || coalesce(h.description, '') || ' ' || coalesce(h.address, '') || ' ' || coalesce(h.city, '') || ' ' || coalesce(h.country, '')) @@ q
+$$;
+
+create function public.search_packages_text(search text)
+returns table (
+  id uuid,
+  name character varying,
+  description text,
+  destination character varying,
+  country character varying,
+  category character varying,
+  duration_days integer,
+  price numeric,
+  currency character varying,
+  max_participants integer,
+  available_slots integer,
+  difficulty_level character varying,
+  minimum_age integer,
+  included_services text[],
+  excluded_services text[],
+  itinerary jsonb,
+  contact_email character varying,
+  contact_phone character varying,
+  rating numeric,
+  reviews_count integer,
+  cover_image text,
+  images text[],
+  is_active boolean,
+  created_at timestamp with time zone,
+  updated_at timestamp with time zone,
+  place_id uuid,
+  rank real
+)
+language sql
+stable
+as $$
+  select
+    p.id, p.name, p.description, p.destination, p.country, p.category, p.duration_days,
+    p.price, p.currency, p.max_participants, p.available_slots, p.difficulty_level,
+    p.minimum_age, p.included_services, p.excluded_services, p.itinerary, p.contact_email,
+    p.contact_phone, p.rating, p.reviews_count, p.cover_image, p.images, p.is_active,
+    p.created_at, p.updated_at, p.place_id,
+    ts_rank(to_tsvector('english', p.name || ' ' || p.description || ' ' || p.destination || ' ' || p.country || ' ' || p.category), q)
+  from public.packages p, websearch_to_tsquery('english', search) q
+  where to_tsvector('english', p.name || ' ' || p.description || ' ' || p.destination || ' ' || p.country || ' ' || p.category) @@ q
+$$;
+
+create function public.search_places_text(search text)
+returns table (
+  id uuid,
+  name character varying,
+  description text,
+  country character varying,
+  state_province character varying,
+  city character varying,
+  latitude double precision,
+  longitude double precision,
+  category character varying,
+  popular_ranking integer,
+  visit_count integer,
+  rating numeric,
+  reviews_count integer,
+  cover_image text,
+  images text[],
+  best_time_to_visit text,
+  average_temperature text,
+  currency character varying,
+  local_language character varying,
+  time_zone character varying,
+  famous_for text[],
+  activities text[],
+  is_featured boolean,
+  is_active boolean,
+  created_at timestamp with time zone,
+  updated_at timestamp with time zone,
+  rank real
+)
+language sql
+stable
+as $$
+  select
+    pl.id, pl.name, pl.description, pl.country, pl.state_province, pl.city, pl.latitude,
+    pl.longitude, pl.category, pl.popular_ranking, pl.visit_count, pl.rating, pl.reviews_count,
+    pl.cover_image, pl.images, pl.best_time_to_visit, pl.average_temperature, pl.currency,
+    pl.local_language, pl.time_zone, pl.famous_for, pl.activities, pl.is_featured, pl.is_active,
+    pl.created_at, pl.updated_at,
+    ts_rank(to_tsvector('english', pl.name || ' ' || coalesce(pl.description, '') || ' ' || pl.country || ' ' || coalesce(pl.city, '')), q)
+  from public.places pl, websearch_to_tsquery('english', search) q
+  where to_tsvector('english', pl.name || ' ' || coalesce(pl.description, '') || ' ' || pl.country || ' ' || coalesce(pl.city, '')) @@ q
+$$;
@@ -0,0 +1,10 @@
+"""
+Test Configuration
+"""
+import os
+
+# Settings and the global clients are created at import time, so the tests
+# import the app with placeholder credentials (nothing connects to them)
+os.environ.setdefault("SUPABASE_URL", "http://localhost:54321")
+os.environ.setdefault("SUPABASE_KEY", "eyJhbGciOiJIUzI1NiJ9.e30.test")
+os.environ.setdefault("GOOGLE_API_KEY", "test")
@@ -0,0 +1,31 @@
+"""
+Catalog Snapshot Tests
+"""
+import asyncio
+from src.services.catalog_snapshot import CatalogSnapshot
+
+
+class FakeClient:
+    """Serves fetch_table from fixed rows"""
+
+    def __init__(self, tables):
+        self.tables = tables
+
+    async def fetch_table(self, table, columns, page_size):
+        return [{c: row.get(c) for c in columns.split(",")} for row in self.tables[table]]
+
+
+def test_popular_places_break_ranking_ties_by_visit_count():
+    places = [
+        {"id": 1, "popular_ranking": 5, "visit_count": 10, "is_active": True},
+        {"id": 2, "popular_ranking": 9, "visit_count": 1, "is_active": True},
+        {"id": 3, "popular_ranking": 5, "visit_count": 500, "is_active": True},
+        {"id": 4, "popular_ranking": 5, "visit_count": None, "is_active": True},
+        {"id": 5, "popular_ranking": 9, "visit_count": 99, "is_active": False},
+    ]
+    snapshot = CatalogSnapshot({"places": "id,popular_ranking,visit_count,is_active"})
+    assert asyncio.run(snapshot.refresh(FakeClient({"places": places})))
+
+    rows = snapshot.search("get_popular_places", {"limit": 10, "columns": "id"})
+    # Like order by popular_ranking desc, visit_count desc (nulls first when descending)
+    assert [row["id"] for row in rows] == [2, 4, 3, 1]
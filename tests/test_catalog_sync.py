@@ -0,0 +1,51 @@
+"""
+Catalog Sync Tests
+"""
+import asyncio
+from datetime import datetime, timezone
+from src.services.catalog_sync import CatalogSync
+
+
+class FakeClient:
+    """Serves fetch_changes from a list of rows, recording the since argument"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.since = []
+
+    async def latest_update(self, table):
+        return None
+
+    async def fetch_changes(self, table, columns, since, page_size):
+        self.since.append(since)
+        return list(self.rows)
+
+
+def test_watermark_compares_timestamps_not_strings():
+    client = FakeClient([
+        # As strings, "...:00.5+00:00" sorts after "...:00.45+00:00" but also
+        # after "...:00.500001+00:00", which is the later time
+        {"id": 1, "updated_at": "2025-01-01T00:00:00.500001+00:00"},
+        {"id": 2, "updated_at": "2025-01-01T00:00:00.5+00:00"},
+    ])
+    changed = []
+    sync = CatalogSync({"packages": "id,updated_at"}, overlap_seconds=5, on_change=changed.append)
+
+    assert asyncio.run(sync.sync_table(client, "packages")) == 2
+    assert sync.watermarks["packages"] == datetime(2025, 1, 1, 0, 0, 0, 500001, tzinfo=timezone.utc)
+
+    # The same rows read again inside the overlap window are not re-applied
+    assert asyncio.run(sync.sync_table(client, "packages")) == 0
+    assert client.since[-1] == "2024-12-31T23:59:55.500001+00:00"
+    assert changed == ["packages"]
+
+
+def test_rows_with_another_offset_or_precision_are_not_skipped():
+    client = FakeClient([{"id": 1, "updated_at": "2025-01-01T06:00:00+06:00"}])
+    sync = CatalogSync({"packages": "id,updated_at"}, overlap_seconds=0)
+    asyncio.run(sync.sync_table(client, "packages"))
+
+    # Later in time, though it sorts before the watermark as a string
+    client.rows = [{"id": 2, "updated_at": "2025-01-01T00:00:00.25Z"}]
+    assert asyncio.run(sync.sync_table(client, "packages")) == 1
+    assert sync.watermarks["packages"] == datetime(2025, 1, 1, 0, 0, 0, 250000, tzinfo=timezone.utc)
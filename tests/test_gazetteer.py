@@ -0,0 +1,50 @@
+"""
+Gazetteer Tests
+"""
+from src.utils.gazetteer import Gazetteer
+
+
+def test_aliases_resolve_to_curated_spelling():
+    gazetteer = Gazetteer()
+    assert gazetteer.canonical("ctg") == "Chittagong"
+    assert gazetteer.canonical("chattogram") == "Chittagong"
+    assert gazetteer.extract("hotels in coxs bazar") == {"city": "Cox's Bazar", "country": "Bangladesh"}
+
+
+def test_catalog_alias_spelling_wins_for_the_whole_group():
+    gazetteer = Gazetteer()
+    gazetteer.load({"hotels": [{"city": "Chattogram", "country": "Bangladesh"}]})
+
+    for spelling in ("chattogram", "Chittagong", "ctg"):
+        assert gazetteer.canonical(spelling) == "Chattogram"
+    assert gazetteer.extract("weather in CTG")["city"] == "Chattogram"
+    assert gazetteer.normalize("hotels near chittagong") == "hotels near chattogram"
+
+
+def test_each_column_gets_the_spelling_it_stores():
+    gazetteer = Gazetteer()
+    gazetteer.load({
+        "hotels": [{"city": "Chittagong", "country": "Bangladesh"}],
+        "packages": [{"destination": "Chattogram", "country": "Bangladesh"}],
+    })
+
+    for spelling in ("Chittagong", "Chattogram", "ctg"):
+        assert gazetteer.canonical(spelling, "hotels", "city") == "Chittagong"
+        assert gazetteer.canonical(spelling, "packages", "destination") == "Chattogram"
+    # A column without any spelling of the place falls back to the shared name
+    assert gazetteer.canonical("ctg", "places", "city") == gazetteer.canonical("ctg")
+
+
+def test_matches_respect_word_boundaries():
+    gazetteer = Gazetteer()
+    assert gazetteer.find_all("ctgx dhakaa") == []
+    assert [m.text for m in gazetteer.find_all("Dhaka to Sylhet")] == ["Dhaka", "Sylhet"]
+
+
+def test_spans_index_the_original_text():
+    gazetteer = Gazetteer()
+    # "İ" lowercases to two characters
+    text = "İstanbul or Dhaka"
+    [match] = gazetteer.find_all(text)
+    assert match.text == "Dhaka"
+    assert text[match.start:match.end] == "Dhaka"
@@ -0,0 +1,130 @@
+"""
+Shared Session Store Tests
+Two SharedSessionStore instances on one InMemorySessionBackend act as two workers
+"""
+import asyncio
+from langchain_core.messages import AIMessage, HumanMessage
+from src.services.session_store import InMemorySessionBackend, SharedSessionStore
+
+
+class CountingBackend(InMemorySessionBackend):
+    """InMemorySessionBackend that counts full reads"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.reads = 0
+
+    def read(self, session_id):
+        self.reads += 1
+        return super().read(session_id)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _turn(question, answer):
+    return [HumanMessage(content=question), AIMessage(content=answer)]
+
+
+def _contents(history):
+    return [m.content for m in history.messages]
+
+
+def test_current_cache_skips_full_reads():
+    backend = CountingBackend()
+    store = SharedSessionStore(backend)
+    history = store.get_history("s1")
+    # A turn reads the history before writing to it
+    assert history.messages == []
+    history.add_messages(_turn("hotels in Dhaka", "Here are 3 hotels"))
+
+    # add_messages kept the cached copy current, so reads don't fetch the list again
+    assert _contents(history) == ["hotels in Dhaka", "Here are 3 hotels"]
+    assert _contents(store.get_history("s1")) == ["hotels in Dhaka", "Here are 3 hotels"]
+    assert backend.reads == 1
+
+
+def test_cache_revalidates_after_another_worker_writes():
+    backend = CountingBackend()
+    worker_a, worker_b = SharedSessionStore(backend), SharedSessionStore(backend)
+    worker_a.get_history("s1").add_messages(_turn("hotels in Dhaka", "Here are 3 hotels"))
+    assert len(worker_b.get_history("s1").messages) == 2
+
+    worker_b.get_history("s1").add_messages(_turn("and in Sylhet?", "Here are 2 hotels"))
+
+    # Worker A's cached copy is one version behind, so it re-reads the session
+    reads = backend.reads
+    assert _contents(worker_a.get_history("s1"))[-1] == "Here are 2 hotels"
+    assert backend.reads == reads + 1
+
+
+def test_write_after_a_concurrent_write_drops_the_stale_copy():
+    backend = InMemorySessionBackend()
+    worker_a, worker_b = SharedSessionStore(backend), SharedSessionStore(backend)
+    history_a = worker_a.get_history("s1")
+    history_a.add_messages(_turn("q1", "a1"))
+    assert len(history_a.messages) == 2  # A now caches version 1
+    worker_b.get_history("s1").add_messages(_turn("q2", "a2"))
+
+    # Version skipped one, so A must not extend its stale copy with q3
+    history_a.add_messages(_turn("q3", "a3"))
+    assert _contents(history_a) == ["q1", "a1", "q2", "a2", "q3", "a3"]
+    assert _contents(worker_b.get_history("s1")) == ["q1", "a1", "q2", "a2", "q3", "a3"]
+
+
+def test_history_is_trimmed_to_max_messages():
+    backend = InMemorySessionBackend(max_messages=4)
+    store = SharedSessionStore(backend, max_messages=3)
+    history = store.get_history("s1")
+    for i in range(3):
+        history.add_messages(_turn(f"q{i}", f"a{i}"))
+
+    # The backend keeps 4; the history keeps 3 but starts at a human turn
+    assert len(backend.read("s1")[1]) == 4
+    assert _contents(history) == ["q2", "a2"]
+    assert _contents(SharedSessionStore(backend, max_messages=3).get_history("s1")) == ["q2", "a2"]
+
+
+def test_idle_sessions_expire():
+    clock = FakeClock()
+    backend = InMemorySessionBackend(ttl_seconds=60, clock=clock)
+    store = SharedSessionStore(backend)
+    store.get_history("s1").add_messages(_turn("q1", "a1"))
+
+    clock.now = 59
+    assert store.get_history("s1", create=False) is not None
+    clock.now = 59 + 60
+    assert store.get_history("s1", create=False) is None
+    assert SharedSessionStore(backend).get_history("s1").messages == []
+
+
+def test_clear_is_seen_by_every_worker():
+    backend = InMemorySessionBackend()
+    worker_a, worker_b = SharedSessionStore(backend), SharedSessionStore(backend)
+    worker_a.get_history("s1").add_messages(_turn("q1", "a1"))
+    assert len(worker_b.get_history("s1").messages) == 2
+
+    assert worker_a.clear("s1") is True
+    assert worker_b.get_history("s1").messages == []
+    assert worker_a.clear("s1") is False
+
+
+def test_async_methods_match_the_sync_ones():
+    async def run():
+        store = SharedSessionStore(InMemorySessionBackend())
+        assert await store.aget_history("s1", create=False) is None
+
+        history = await store.aget_history("s1")
+        await history.aadd_messages(_turn("q1", "a1"))
+        assert [m.content for m in await history.aget_messages()] == ["q1", "a1"]
+        assert await store.aget_history("s1", create=False) is not None
+
+        assert await store.aclear("s1") is True
+        assert await history.aget_messages() == []
+
+    asyncio.run(run())